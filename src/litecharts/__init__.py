@@ -1,7 +1,11 @@
 """Litecharts - Python wrapper for TradingView Lightweight Charts."""
 
-from ._js import getDefaultStyles, getLwcScript, getPluginScripts
+from ._js import getDefaultStyles, getLwcScript, getPluginScripts, writeAssets
+from .batch import saveMany
+from .cache import DiskCache
 from .chart import Chart, createChart
+from .columnar import ColumnarData
+from .dashboard import Dashboard
 from .pane import Pane
 from .series import (
     AreaSeries,
@@ -25,6 +29,7 @@ from .types import (
     BaseValuePrice,
     CandlestickSeriesOptions,
     ChartOptions,
+    ColorRule,
     CrosshairLineOptions,
     CrosshairOptions,
     GridLineOptions,
@@ -46,6 +51,8 @@ from .types import (
     PriceScaleMargins,
     PriceScaleOptions,
     RectangleOptions,
+    RenderOptions,
+    SaveResult,
     SingleValueData,
     StyleOptions,
     TimeScaleOptions,
@@ -71,8 +78,12 @@ __all__ = [
     "CandlestickSeriesOptions",
     "Chart",
     "ChartOptions",
+    "ColorRule",
+    "ColumnarData",
     "CrosshairLineOptions",
     "CrosshairOptions",
+    "Dashboard",
+    "DiskCache",
     "GridLineOptions",
     "GridOptions",
     "HandleScaleOptions",
@@ -95,6 +106,8 @@ __all__ = [
     "PriceScaleMargins",
     "PriceScaleOptions",
     "RectangleOptions",
+    "RenderOptions",
+    "SaveResult",
     "SeriesMarkersApi",
     "SingleValueData",
     "StyleOptions",
@@ -105,4 +118,6 @@ __all__ = [
     "getDefaultStyles",
     "getLwcScript",
     "getPluginScripts",
+    "saveMany",
+    "writeAssets",
 ]
@@ -0,0 +1,34 @@
+"""Atomic file output."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, TextIO
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@contextmanager
+def atomicWriter(path: Path) -> Iterator[TextIO]:
+    """Open a text file that replaces ``path`` only once fully written.
+
+    Output goes to a temporary file in the same directory, which is moved
+    over ``path`` when the block exits normally and deleted if it raises,
+    so an existing file is never left truncated or half written.
+
+    Args:
+        path: Destination file path.
+
+    Yields:
+        Writable UTF-8 text stream.
+    """
+    temp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with temp.open("w", encoding="utf-8") as fp:
+            yield fp
+        os.replace(temp, path)
+    finally:
+        temp.unlink(missing_ok=True)
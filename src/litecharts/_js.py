@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 from functools import lru_cache
 from importlib.resources import files
+from pathlib import Path
+
+from ._files import atomicWriter
 
 
 @lru_cache(maxsize=1)
@@ -29,6 +33,18 @@ def getLwcJs() -> str:
         raise FileNotFoundError(msg) from None
 
 
+@lru_cache(maxsize=1)
+def getCompressedLwcJs() -> str:
+    """Load the bundled Lightweight Charts JavaScript, deflated and base64-encoded.
+
+    Returns:
+        Base64 string for ``litechartsInflate``.
+    """
+    from ._payload import compressText
+
+    return compressText(getLwcJs())
+
+
 def getLwcScript() -> str:
     """Get the LWC library wrapped in a script tag.
 
@@ -48,11 +64,62 @@ def getPluginScripts() -> str:
     Include in <head> after getLwcScript() and before any chart fragments.
 
     Returns:
-        HTML script tags containing all plugin code.
+        HTML script tags containing all plugin code and shared helpers.
     """
+    return f"<script>{_getPluginJs()}</script>"
+
+
+def _getPluginJs() -> str:
+    """Return the code of all plugins and shared helpers."""
+    from ._payload import PAYLOAD_JS
     from .plugins.draw_rectangle import RECTANGLE_PRIMITIVE_JS
+    from .plugins.marker_tooltips import TOOLTIP_RUNTIME_JS
+
+    return f"{RECTANGLE_PRIMITIVE_JS}{TOOLTIP_RUNTIME_JS}{PAYLOAD_JS}"
+
+
+@lru_cache(maxsize=1)
+def getAssetFiles() -> dict[str, str]:
+    """Get the LWC library and plugin scripts as content-hashed JS files.
+
+    File names include a hash of their content, so a new litecharts version
+    never reuses a stale file and browsers can cache them indefinitely.
+
+    Returns:
+        Mapping of file name to file content, in script load order.
+    """
+    assets = {}
+    for stem, code in (
+        ("lightweight-charts", getLwcJs()),
+        ("litecharts-plugins", _getPluginJs()),
+    ):
+        digest = hashlib.blake2b(code.encode(), digest_size=6).hexdigest()
+        assets[f"{stem}.{digest}.js"] = code
+    return assets
+
 
-    return f"<script>{RECTANGLE_PRIMITIVE_JS}</script>"
+def writeAssets(directory: str | Path) -> list[str]:
+    """Write the LWC library and plugin scripts into a directory.
+
+    Files that already exist are left untouched, so writing the assets for
+    every saved chart costs one stat per file. Use the returned names as
+    ``scripts`` for ``Chart.write`` to link them instead of inlining them.
+
+    Args:
+        directory: Directory to write the files to (created if needed).
+
+    Returns:
+        The asset file names, in script load order.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, code in getAssetFiles().items():
+        path = directory / name
+        if not path.exists():
+            # Write under a temporary name so readers never see a partial file
+            with atomicWriter(path) as fp:
+                fp.write(code)
+    return list(getAssetFiles())
 
 
 def getDefaultStyles(containerId: str) -> str:
@@ -69,3 +136,23 @@ def getDefaultStyles(containerId: str) -> str:
     """
     # Native LWC panes handle layout internally, no CSS needed
     return f"/* styles for #container_{containerId} */"
+
+
+def resolveAssets(directory: str | Path, assets: str) -> list[str] | None:
+    """Prepare the scripts for a save() assets mode.
+
+    Args:
+        directory: Directory the HTML file is saved to.
+        assets: "inline" or "sidecar".
+
+    Returns:
+        Asset file names to link for "sidecar" (written by ``writeAssets``),
+        or None for "inline".
+
+    Raises:
+        ValueError: If assets is not a known mode.
+    """
+    if assets not in ("inline", "sidecar"):
+        msg = f"Unknown assets mode: {assets!r}"
+        raise ValueError(msg)
+    return writeAssets(directory) if assets == "sidecar" else None
@@ -0,0 +1,138 @@
+"""Compact JSON encoding for rendered payloads.
+
+All data embedded in the generated JS goes through ``dumps``. orjson or
+ujson is used when installed, with the stdlib ``json`` module as fallback.
+Whatever the backend, the output is compact, ASCII-only and writes
+non-finite floats as the JS literals ``NaN``/``Infinity``.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+_SEPARATORS = (",", ":")
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _default(obj: Any) -> Any:
+    """Convert numpy scalars and arrays for encoders without native support.
+
+    Args:
+        obj: Object the encoder could not serialize.
+
+    Returns:
+        Equivalent Python object.
+
+    Raises:
+        TypeError: If obj is not a numpy value.
+    """
+    if hasattr(obj, "tolist") and hasattr(obj, "dtype"):
+        return obj.tolist()
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _stdlibDumps(obj: object) -> str:
+    """Encode with the stdlib ``json`` module."""
+    return json.dumps(obj, separators=_SEPARATORS, default=_default)
+
+
+@lru_cache(maxsize=1)
+def _fastEncoder() -> Callable[[object], str] | None:
+    """Return an encoder backed by orjson or ujson, if either is installed."""
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+        def orjsonDumps(obj: object) -> str:
+            return orjson.dumps(obj, default=_default, option=options).decode()
+
+        return orjsonDumps
+
+    try:
+        import ujson
+    except ImportError:
+        return None
+
+    def ujsonDumps(obj: object) -> str:
+        return str(
+            ujson.dumps(
+                obj,
+                ensure_ascii=True,
+                escape_forward_slashes=False,
+                default=_default,
+            )
+        )
+
+    return ujsonDumps
+
+
+def _isFinite(obj: Any) -> bool:
+    """Return whether obj holds no NaN or infinite floats.
+
+    numpy float arrays are checked in one vectorized call.
+    """
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, (list, tuple)):
+        return all(map(_isFinite, obj))
+    if isinstance(obj, dict):
+        return all(map(_isFinite, obj.values()))
+    dtype = getattr(obj, "dtype", None)
+    if dtype is not None and hasattr(obj, "tolist"):
+        import numpy as np
+
+        if dtype.kind in "fc":
+            return bool(np.isfinite(obj).all())
+        if dtype.kind == "O":
+            return _isFinite(obj.tolist())
+    return True
+
+
+def _escapeChar(match: re.Match[str]) -> str:
+    """Return the JSON escape of a non-ASCII character, as the stdlib writes it."""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return f"\\u{0xD800 + (code >> 10):04x}\\u{0xDC00 + (code & 0x3FF):04x}"
+    return f"\\u{code:04x}"
+
+
+def dumps(obj: object) -> str:
+    """Encode an object as compact JSON.
+
+    numpy scalars and arrays are encoded directly. A fast backend is used
+    unless the input holds NaN or infinite floats, which orjson would write
+    as ``null``; those go through the stdlib. Non-ASCII text left unescaped
+    by orjson is escaped afterwards. ``null`` in the fast output only
+    triggers the (vectorized for arrays) input check, so legitimate None
+    values keep the fast path.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        Compact JSON string.
+    """
+    encoder = _fastEncoder()
+    if encoder is not None:
+        try:
+            text = encoder(obj)
+        except (TypeError, ValueError, OverflowError):
+            pass
+        else:
+            if "null" not in text or _isFinite(obj):
+                if text.isascii():
+                    return text
+                # Non-ASCII characters only occur inside JSON strings
+                return _NON_ASCII.sub(_escapeChar, text)
+    return _stdlibDumps(obj)
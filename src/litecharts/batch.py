@@ -0,0 +1,109 @@
+"""Parallel export of many charts."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, TypeAlias
+
+from ._files import atomicWriter
+from .chart import Chart
+
+if TYPE_CHECKING:
+    from .types import SaveResult
+
+# A chart, or a picklable zero-argument callable building one in the worker
+ChartSource: TypeAlias = Chart | Callable[[], Chart]
+
+
+def _saveOne(source: ChartSource, path: str, scripts: list[str] | None) -> None:
+    """Build a chart if needed and save it (runs in a worker process)."""
+    chart = source if isinstance(source, Chart) else source()
+    # A failed chart leaves no file (or its previous file) at its path
+    with atomicWriter(Path(path)) as fp:
+        chart.write(fp, scripts=scripts)
+
+
+def saveMany(
+    charts: Mapping[str, ChartSource] | Iterable[ChartSource],
+    directory: str | Path,
+    *,
+    workers: int | None = None,
+    assets: Literal["inline", "sidecar"] = "inline",
+) -> list[SaveResult]:
+    """Save many charts to HTML files in parallel worker processes.
+
+    Each chart is converted and rendered in a worker from a
+    ``ProcessPoolExecutor``. Charts are pickled to the workers with their
+    data in columnar form (lazily set DataFrames/arrays are shipped
+    unconverted and converted there); passing factories instead builds
+    each chart in its worker, so only the callable is pickled. Factories
+    must be picklable: module-level functions or ``functools.partial``
+    objects, not lambdas.
+
+    Args:
+        charts: Charts or factories. A mapping saves each to
+            ``<key>.html``, where each key must be a plain file name; any
+            other iterable to ``chart_<index>.html``.
+        directory: Output directory (created if needed).
+        workers: Number of worker processes (default: CPU count). With 1,
+            charts are saved in the calling process.
+        assets: "inline" or "sidecar", as for ``Chart.save``. Sidecar
+            assets are written once, before any chart.
+
+    Returns:
+        One result per chart, in input order. A failed chart (including
+        one that can't be pickled) has its exception in ``error`` and does
+        not stop the others.
+
+    Raises:
+        ValueError: If a mapping key is not a plain file name (e.g. holds a
+            path separator), or assets is not a known mode. Nothing is
+            written in that case.
+
+    Example:
+        >>> from functools import partial
+        >>> results = saveMany(
+        ...     {symbol: partial(buildChart, symbol) for symbol in symbols},
+        ...     "out",
+        ...     workers=8,
+        ... )
+        >>> failed = [result for result in results if result["error"]]
+    """
+    from ._js import resolveAssets
+
+    if isinstance(charts, Mapping):
+        for name in charts:
+            if name in ("", ".", "..") or Path(name).name != name:
+                msg = f"Chart name must be a plain file name: {name!r}"
+                raise ValueError(msg)
+        named = list(charts.items())
+    else:
+        named = [(f"chart_{index}", source) for index, source in enumerate(charts)]
+
+    directory = Path(directory)
+    scripts = resolveAssets(directory, assets)
+    directory.mkdir(parents=True, exist_ok=True)
+    jobs = [(source, directory / f"{name}.html") for name, source in named]
+
+    results: list[SaveResult] = []
+    if workers == 1:
+        for source, path in jobs:
+            try:
+                _saveOne(source, str(path), scripts)
+            except Exception as error:
+                results.append({"path": str(path), "error": error})
+            else:
+                results.append({"path": str(path), "error": None})
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures: list[Future[None]] = [
+            executor.submit(_saveOne, source, str(path), scripts)
+            for source, path in jobs
+        ]
+        for (_, path), future in zip(jobs, futures, strict=True):
+            results.append({"path": str(path), "error": future.exception()})
+    return results
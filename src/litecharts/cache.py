@@ -0,0 +1,331 @@
+"""Content-addressed on-disk cache of rendered charts."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ._js import _getPluginJs, getLwcJs
+from ._json import dumps
+from .columnar import ColumnarData
+
+if TYPE_CHECKING:
+    from .chart import Chart
+    from .types import StyleOptions
+
+# Render options that don't change the output
+_UNKEYED_OPTIONS = ("cache", "diskCache")
+
+# Chart, pane and series ids are stored as "\0<index>\0" and filled in with
+# the current ids on a hit. NUL never occurs in rendered output.
+_ID_PLACEHOLDER = re.compile("\0(\\d+)\0")
+
+_READ_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=1)
+def _rendererDigest() -> str:
+    """Return a digest of the litecharts version and the JS it inlines.
+
+    Covers the bundled LWC library and the plugin scripts, so output cached
+    by another litecharts version is never served.
+    """
+    from . import __version__
+
+    digest = hashlib.blake2b(__version__.encode(), digest_size=16)
+    digest.update(getLwcJs().encode())
+    digest.update(_getPluginJs().encode())
+    return digest.hexdigest()
+
+
+def _hashArray(digest: Any, array: Any) -> None:
+    """Feed a numpy array into a digest through its raw buffer.
+
+    Args:
+        digest: hashlib digest object.
+        array: numpy array.
+    """
+    import numpy as np
+
+    digest.update(f"{array.dtype.descr}{array.shape}".encode())
+    if array.dtype.kind == "O":
+        _hashValue(digest, array.tolist())
+    else:
+        digest.update(np.ascontiguousarray(array).reshape(-1).view(np.uint8))
+
+
+def _pandasArray(column: Any) -> Any:
+    """Return a pandas Index or Series as a numpy array for hashing.
+
+    tz-aware datetimes would export as object arrays of Timestamps; their
+    int64 epoch values are returned instead (the zone is hashed with the
+    dtype name by the caller).
+    """
+    if getattr(column.dtype, "tz", None) is not None:
+        return column.array.asi8
+    return column.to_numpy()
+
+
+def _hashValue(digest: Any, value: Any) -> None:
+    """Feed a value into a digest.
+
+    numpy arrays, ColumnarData and pandas/polars/arrow tables are hashed
+    over their column buffers without creating Python objects per element;
+    anything else is hashed through its JSON (or repr) text.
+
+    Args:
+        digest: hashlib digest object.
+        value: Value to hash.
+    """
+    from .convert import _isArrowTable, _isPolars
+
+    if isinstance(value, ColumnarData):
+        _hashColumns(digest, value.time, value.fields.items())
+        if value.whitespace is not None:
+            _hashArray(digest, value.whitespace)
+    elif type(value).__module__ == "numpy":
+        _hashArray(digest, value)
+    elif _isArrowTable(value) or (_isPolars(value) and hasattr(value, "columns")):
+        columns = value.column_names if _isArrowTable(value) else value.columns
+        _hashColumns(digest, None, ((name, value[name].to_numpy()) for name in columns))
+    elif hasattr(value, "to_numpy") and hasattr(value, "index"):
+        # pandas DataFrame or Series
+        frame = value.to_frame() if hasattr(value, "to_frame") else value
+        digest.update(f"{frame.index.dtype}{list(frame.dtypes)}".encode())
+        _hashColumns(
+            digest,
+            _pandasArray(frame.index),
+            ((name, _pandasArray(frame[name])) for name in frame.columns),
+        )
+    elif hasattr(value, "to_numpy"):
+        # polars Series
+        digest.update(f"{getattr(value, 'name', None)}".encode())
+        _hashArray(digest, value.to_numpy())
+    else:
+        try:
+            text = dumps(value)
+        except (TypeError, ValueError):
+            text = repr(value)
+        digest.update(f"{type(value).__name__}:{text}".encode())
+
+
+def _hashColumns(
+    digest: Any, index: Any, columns: Iterable[tuple[object, Any]]
+) -> None:
+    """Feed an optional index array and named columns into a digest."""
+    if index is not None:
+        _hashArray(digest, index)
+    for name, column in columns:
+        digest.update(f"\0{name}\0".encode())
+        _hashArray(digest, column)
+
+
+def chartIds(chart: Chart) -> list[str]:
+    """Return the chart, pane and series ids that appear in rendered output.
+
+    Args:
+        chart: The chart.
+
+    Returns:
+        List of ids in a stable order.
+    """
+    panes = chart.panes
+    return [
+        chart.id,
+        *(pane.id for pane in panes),
+        *(series.id for pane in panes for series in pane.series),
+    ]
+
+
+def chartKey(
+    chart: Chart,
+    kind: str,
+    style: StyleOptions | None = None,
+    scripts: Sequence[str] | None = None,
+) -> str:
+    """Compute the cache key of a chart's rendered output.
+
+    Covers everything the output depends on except the chart, pane and
+    series ids: the litecharts version and the LWC and plugin JS it
+    inlines, chart and render options, pane layout, and each series'
+    options, data, markers, price lines and rectangles. Data set with
+    ``lazy=True`` is hashed from its source, so a hit skips conversion.
+
+    Args:
+        chart: The chart.
+        kind: "html" or "fragment".
+        style: HTML document styling options.
+        scripts: Linked script URLs, if any.
+
+    Returns:
+        Hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    renderOptions = {
+        key: value
+        for key, value in chart.renderOptions.items()
+        if key not in _UNKEYED_OPTIONS
+    }
+    _hashValue(
+        digest,
+        [
+            _rendererDigest(),
+            kind,
+            style,
+            scripts,
+            chart.options,
+            chart.width,
+            chart.height,
+            chart.shouldFitContent,
+            renderOptions,
+        ],
+    )
+    for pane in chart.panes:
+        _hashValue(digest, ["pane", pane.options, len(pane.series)])
+        for series in pane.series:
+            source, options = series._dataSource()
+            _hashValue(
+                digest,
+                [
+                    type(series).__name__,
+                    series.options,
+                    options,
+                    [group.markers() for group in series.markerGroups],
+                    series.priceLines,
+                    series.rectangles,
+                ],
+            )
+            _hashValue(digest, source)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """Size-bounded directory of rendered charts, keyed by their content.
+
+    Set on a chart with ``chart.setRenderOptions({"diskCache": cache})``;
+    toHtml, toFragment, save and write then return the stored output when a
+    chart with the same content was rendered before, skipping conversion and
+    serialization. Files are evicted least recently used first once the
+    directory exceeds ``maxBytes``.
+
+    Example:
+        >>> cache = DiskCache("~/.cache/litecharts", maxBytes=512 * 2**20)
+        >>> chart.setRenderOptions({"diskCache": cache})
+        >>> chart.save("report.html")
+    """
+
+    def __init__(self, directory: str | Path, maxBytes: int = 256 * 2**20) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache files (created if needed).
+            maxBytes: Total size the cache files are trimmed to.
+        """
+        self._directory = Path(directory).expanduser()
+        self._maxBytes = maxBytes
+
+    @property
+    def directory(self) -> Path:
+        """Return the cache directory."""
+        return self._directory
+
+    @property
+    def maxBytes(self) -> int:
+        """Return the size bound in bytes."""
+        return self._maxBytes
+
+    def _path(self, key: str) -> Path:
+        """Return the file path for a key."""
+        return self._directory / f"{key}.html"
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether output for a key is stored."""
+        return isinstance(key, str) and self._path(key).is_file()
+
+    def fetch(
+        self,
+        key: str,
+        ids: Sequence[str],
+        render: Callable[[], Iterable[str]],
+    ) -> Iterator[str]:
+        """Yield the stored output for a key, rendering and storing it on a miss.
+
+        Output is streamed in both cases; on a miss it is written to a
+        temporary file alongside and only stored once complete.
+
+        Args:
+            key: Cache key from ``chartKey``.
+            ids: Current chart, pane and series ids (from ``chartIds``).
+            render: Produces the output chunks on a miss.
+
+        Yields:
+            Output chunks.
+        """
+        path = self._path(key)
+        try:
+            fp = path.open(encoding="utf-8", newline="")
+        except FileNotFoundError:
+            pass
+        else:
+            with fp:
+                os.utime(path)
+                yield from self._read(fp, ids)
+            return
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with temp.open("w", encoding="utf-8", newline="") as out:
+                for chunk in render():
+                    stored = chunk
+                    for index, itemId in enumerate(ids):
+                        stored = stored.replace(itemId, f"\0{index}\0")
+                    out.write(stored)
+                    yield chunk
+            os.replace(temp, path)
+        finally:
+            temp.unlink(missing_ok=True)
+        self._evict()
+
+    def _read(self, fp: Any, ids: Sequence[str]) -> Iterator[str]:
+        """Yield a stored file's text with the id placeholders filled in."""
+
+        def fill(match: re.Match[str]) -> str:
+            return ids[int(match.group(1))]
+
+        pending = ""
+        while block := fp.read(_READ_SIZE):
+            text = pending + block
+            # Hold back a placeholder cut off at the end of the block
+            cut = text.rfind("\0") if text.count("\0") % 2 else len(text)
+            pending = text[cut:]
+            yield _ID_PLACEHOLDER.sub(fill, text[:cut])
+        if pending:
+            yield pending
+
+    def _evict(self) -> None:
+        """Delete least recently used files until the cache fits maxBytes."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self._directory):
+            if entry.name.endswith(".html") and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self._maxBytes:
+                break
+            Path(path).unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Delete every cached file."""
+        if self._directory.is_dir():
+            for path in self._directory.glob("*.html"):
+                path.unlink(missing_ok=True)
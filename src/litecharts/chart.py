@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import uuid
 from pathlib import Path
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, Literal, overload
 
 from .pane import Pane
 from .series import (
@@ -17,6 +17,10 @@ from .series import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from _typeshed import SupportsWrite
+
     from .series import BaseSeries
     from .types import (
         AreaSeriesOptions,
@@ -28,6 +32,7 @@ if TYPE_CHECKING:
         LineSeriesOptions,
         OhlcInput,
         PaneOptions,
+        RenderOptions,
         SingleValueInput,
         StyleOptions,
     )
@@ -60,6 +65,7 @@ class Chart:
         self._panes: list[Pane] = []
         self._defaultPane: Pane | None = None
         self._fitContent: bool = False
+        self._renderOptions: RenderOptions = {}
 
     @property
     def id(self) -> str:
@@ -107,6 +113,26 @@ class Chart:
         """
         self._fitContent = True
 
+    @property
+    def renderOptions(self) -> RenderOptions:
+        """Return the options controlling how data is written to HTML."""
+        return self._renderOptions
+
+    def setRenderOptions(self, options: RenderOptions) -> None:
+        """Set options controlling how data is written to HTML.
+
+        Options are merged into the current ones and apply to every later
+        toHtml/toFragment/save call.
+
+        Args:
+            options: Render options, e.g. ``{"precision": "priceFormat"}`` to
+                round values to each series' price precision.
+
+        Example:
+            >>> chart.setRenderOptions({"precision": 5})
+        """
+        self._renderOptions.update(options)
+
     def _getDefaultPane(self) -> Pane:
         """Get or create the default pane."""
         if self._defaultPane is None:
@@ -233,6 +259,31 @@ class Chart:
 
         return renderChart(self, style)
 
+    def write(
+        self,
+        fp: SupportsWrite[str],
+        style: StyleOptions | None = None,
+        *,
+        scripts: Sequence[str] | None = None,
+    ) -> None:
+        """Write HTML for the chart to a text stream.
+
+        The document is written in chunks as it is rendered (the LWC library,
+        then series data a block at a time), so it is never held in memory
+        as a whole.
+
+        Args:
+            fp: Writable text stream (open file, StringIO, ...).
+            style: Optional HTML document styling options.
+            scripts: URLs of the LWC library and plugin scripts to link
+                instead of inlining them, e.g. the file names returned by
+                ``writeAssets``.
+        """
+        from .render import iterChart
+
+        for chunk in iterChart(self, style, scripts):
+            fp.write(chunk)
+
     def toFragment(self) -> str:
         """Generate an HTML fragment for embedding in custom pages.
 
@@ -308,20 +359,43 @@ class Chart:
         with tempfile.NamedTemporaryFile(
             mode="w", suffix=".html", delete=False, encoding="utf-8"
         ) as f:
-            f.write(self.toHtml(style))
+            self.write(f, style)
             temp_path = f.name
 
         webbrowser.open(f"file://{temp_path}")
 
-    def save(self, path: str | Path, style: StyleOptions | None = None) -> None:
+    def save(
+        self,
+        path: str | Path,
+        style: StyleOptions | None = None,
+        *,
+        assets: Literal["inline", "sidecar"] = "inline",
+    ) -> None:
         """Save the chart to an HTML file.
 
         Args:
             path: File path to save to.
             style: Optional HTML document styling options.
+            assets: "inline" embeds the LWC library, making the file
+                self-contained. "sidecar" writes the library and plugin
+                scripts once as content-hashed .js files in the same
+                directory (see ``writeAssets``) and links them, so charts
+                saved together share one browser-cached copy.
+
+        The file is written under a temporary name and only replaces
+        ``path`` once complete, so a render error leaves an existing file
+        untouched.
+
+        Raises:
+            ValueError: If assets is not a known mode.
         """
+        from ._files import atomicWriter
+        from ._js import resolveAssets
+
         path = Path(path)
-        path.write_text(self.toHtml(style), encoding="utf-8")
+        scripts = resolveAssets(path.parent, assets)
+        with atomicWriter(path) as fp:
+            self.write(fp, style, scripts=scripts)
 
 
 def createChart(options: ChartOptions | None = None) -> Chart:
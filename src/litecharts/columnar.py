@@ -0,0 +1,282 @@
+"""Columnar (struct-of-arrays) storage for series data."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .types import OhlcData, SingleValueData
+
+# Per-point color fields, stored as object arrays of str (None where unset)
+COLOR_FIELDS = ("color", "borderColor", "wickColor", "lineColor")
+
+
+def _colorColumn(column: Any) -> np.ndarray[Any, Any]:
+    """Coerce a color column to an object array of str, with None for gaps.
+
+    Args:
+        column: Array-like of CSS color strings; NaN/None mark missing colors.
+
+    Returns:
+        Object numpy array.
+    """
+    import numpy as np
+
+    values: np.ndarray[Any, Any] = np.asarray(column, dtype=object)
+    if len(values) and not all(isinstance(v, str) for v in set(values.tolist())):
+        toColor = np.frompyfunc(lambda v: v if isinstance(v, str) else None, 1, 1)
+        values = np.asarray(toColor(values), dtype=object)
+    return values
+
+
+def _unsetRows(column: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """Return the row indices where a color column is None."""
+    rows: np.ndarray[Any, Any] = (column == None).nonzero()[0]  # noqa: E711
+    return rows
+
+
+class ColumnarData:
+    """Series data stored as one numpy array per field.
+
+    Holds an int64 ``time`` array (Unix seconds) plus one float64 array per
+    value field (open/high/low/close/volume or value), instead of one dict per
+    data point. Produced by the vectorized converters for pandas and numpy
+    input; list-of-dict input keeps its row form.
+
+    Per-point color fields (see ``COLOR_FIELDS``) are held as object arrays
+    of CSS color strings; a None entry omits that key from the data point.
+
+    An optional boolean ``whitespace`` mask marks rows that are emitted as
+    time-only whitespace points, whatever their field values.
+
+    Points added with ``append`` are buffered and merged into the columns
+    in one pass the next time the columns are read.
+    """
+
+    __slots__ = ("_fields", "_tail", "_time", "_whitespace")
+
+    def __init__(
+        self,
+        time: np.ndarray[Any, Any],
+        fields: Mapping[str, np.ndarray[Any, Any]],
+        whitespace: np.ndarray[Any, Any] | None = None,
+    ) -> None:
+        """Initialize the columnar store.
+
+        Columns that already have the right dtype are stored without
+        copying; the converters pass copies of mutable pandas/numpy input,
+        so later edits to a source don't reach the store.
+
+        Args:
+            time: Unix timestamps in seconds.
+            fields: Mapping of field name to value column, in output key order.
+            whitespace: Optional boolean mask of time-only rows.
+
+        Raises:
+            ValueError: If a column length does not match the time column.
+        """
+        import numpy as np
+
+        self._time: np.ndarray[Any, Any] = np.asarray(time, dtype=np.int64)
+        self._fields: dict[str, np.ndarray[Any, Any]] = {}
+        for name, column in fields.items():
+            values = (
+                _colorColumn(column)
+                if name in COLOR_FIELDS
+                else np.asarray(column, dtype=np.float64)
+            )
+            if values.shape != self._time.shape:
+                msg = (
+                    f"Column '{name}' has {len(values)} values, "
+                    f"expected {len(self._time)}"
+                )
+                raise ValueError(msg)
+            self._fields[name] = values
+
+        self._whitespace: np.ndarray[Any, Any] | None = None
+        if whitespace is not None and whitespace.any():
+            if whitespace.shape != self._time.shape:
+                msg = (
+                    f"Whitespace mask has {len(whitespace)} values, "
+                    f"expected {len(self._time)}"
+                )
+                raise ValueError(msg)
+            self._whitespace = np.asarray(whitespace, dtype=bool)
+        self._tail: list[Mapping[str, object]] = []
+
+    @classmethod
+    def concat(cls, parts: Sequence[ColumnarData]) -> ColumnarData:
+        """Join stores with identical keys end to end.
+
+        Args:
+            parts: Non-empty sequence of stores sharing the same keys.
+
+        Returns:
+            New store holding every part's rows in order.
+
+        Raises:
+            ValueError: If the parts don't all have the same keys.
+        """
+        import numpy as np
+
+        keys = parts[0].keys
+        if any(part.keys != keys for part in parts):
+            msg = "Cannot concatenate columnar data with different fields"
+            raise ValueError(msg)
+        whitespace = None
+        if any(part.whitespace is not None for part in parts):
+            whitespace = np.concatenate([part.whitespaceMask() for part in parts])
+        return cls(
+            np.concatenate([part.time for part in parts]),
+            {
+                name: np.concatenate([part.fields[name] for part in parts])
+                for name in parts[0].fields
+            },
+            whitespace,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of data points."""
+        return len(self._time) + len(self._tail)
+
+    @property
+    def time(self) -> np.ndarray[Any, Any]:
+        """Return the time column (int64 Unix seconds)."""
+        self._flush()
+        return self._time
+
+    @property
+    def fields(self) -> dict[str, np.ndarray[Any, Any]]:
+        """Return the value columns keyed by field name."""
+        self._flush()
+        return self._fields
+
+    @property
+    def whitespace(self) -> np.ndarray[Any, Any] | None:
+        """Return the mask of time-only rows, or None if there are none."""
+        self._flush()
+        return self._whitespace
+
+    def whitespaceMask(self) -> np.ndarray[Any, Any]:
+        """Return the whitespace mask, all False when there are no such rows."""
+        import numpy as np
+
+        self._flush()
+        if self._whitespace is None:
+            return np.zeros(len(self._time), dtype=bool)
+        return self._whitespace
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        """Return the data point keys, time first."""
+        return ("time", *self._fields)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the column buffers in bytes."""
+        self._flush()
+        return self._time.nbytes + sum(col.nbytes for col in self._fields.values())
+
+    def accepts(self, point: Mapping[str, object]) -> bool:
+        """Return whether a data point has this store's keys (or only time).
+
+        Color keys may be left out of the point.
+
+        Args:
+            point: Data point dict.
+        """
+        pointKeys = set(point)
+        keys = set(self.keys)
+        if pointKeys == {"time"} or pointKeys == keys:
+            return True
+        return pointKeys <= keys and keys - pointKeys <= set(COLOR_FIELDS)
+
+    def append(self, point: Mapping[str, object]) -> None:
+        """Append a single data point to every column.
+
+        The point is buffered, so appending costs O(1) instead of copying
+        every column; buffered points are merged on the next read.
+
+        Args:
+            point: Data point dict with a normalized int time and either the
+                same keys as this store or only a time (see ``accepts``).
+        """
+        self._tail.append(point)
+
+    def _flush(self) -> None:
+        """Merge the points buffered by ``append`` into the columns."""
+        if not self._tail:
+            return
+        import numpy as np
+
+        tail, self._tail = self._tail, []
+        count = len(tail)
+        blank = [set(point) == {"time"} for point in tail]
+        if any(blank) or self._whitespace is not None:
+            mask = self._whitespace
+            if mask is None:
+                mask = np.zeros(len(self._time), dtype=bool)
+            self._whitespace = np.concatenate((mask, np.array(blank, dtype=bool)))
+        times = np.fromiter((point["time"] for point in tail), np.int64, count)
+        self._time = np.concatenate((self._time, times))
+        for name, column in self._fields.items():
+            if name in COLOR_FIELDS:
+                values = np.empty(count, dtype=object)
+                values[:] = [point.get(name) for point in tail]
+            else:
+                values = np.fromiter(
+                    (
+                        np.nan if isBlank else point[name]
+                        for point, isBlank in zip(tail, blank, strict=True)
+                    ),
+                    np.float64,
+                    count,
+                )
+            self._fields[name] = np.concatenate((column, values))
+
+    def take(self, indexer: np.ndarray[Any, Any] | slice) -> ColumnarData:
+        """Return a new store with the rows selected by an index, mask or slice.
+
+        Args:
+            indexer: Integer positions, boolean mask, or a slice (which
+                selects views of the columns without copying).
+
+        Returns:
+            New store with the selected rows.
+        """
+        self._flush()
+        whitespace = self._whitespace
+        return ColumnarData(
+            self._time[indexer],
+            {name: col[indexer] for name, col in self._fields.items()},
+            whitespace[indexer] if whitespace is not None else None,
+        )
+
+    def toRecords(self) -> list[OhlcData | SingleValueData]:
+        """Materialize the columns as a list of data point dicts.
+
+        Returns:
+            List of dicts with time first, then each field.
+        """
+        self._flush()
+        keys = self.keys
+        rows = zip(
+            self._time.tolist(),
+            *(col.tolist() for col in self._fields.values()),
+            strict=True,
+        )
+        records: list[OhlcData | SingleValueData] = [
+            dict(zip(keys, row, strict=True))  # type: ignore[misc]
+            for row in rows
+        ]
+        for name, column in self._fields.items():
+            if name in COLOR_FIELDS:
+                for index in _unsetRows(column).tolist():
+                    del records[index][name]
+        if self._whitespace is not None:
+            for index in self._whitespace.nonzero()[0].tolist():
+                records[index] = {"time": records[index]["time"]}
+        return records
@@ -3,15 +3,76 @@
 from __future__ import annotations
 
 import calendar
-from collections.abc import Mapping, Sequence
+import math
+import numbers
+import re
+from collections.abc import Collection, Mapping, Sequence
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any, cast
 
+from .columnar import COLOR_FIELDS, ColumnarData
 from .types import DataValue, OhlcData, SingleValueData
 
 if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
+    import polars as pl
+
+    from .types import (
+        ColorRule,
+        NanPolicy,
+        OhlcInput,
+        SeriesData,
+        SingleValueInput,
+    )
+
+# ISO-8601 layouts that numpy's datetime64 parser reads the same way as
+# datetime.fromisoformat (naive or "Z" suffix, up to microseconds)
+_ISO_BATCH_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d{1,6})?)?)?Z?"
+)
+_ISO_DATE_LENGTH = len("2024-01-02")
+
+# Value fields read from tabular OHLC input, in output key order
+_OHLC_FIELDS = ("open", "high", "low", "close", "volume")
+
+# Comparison operators accepted by ColorRule
+_RULE_OPERATORS = {
+    ">": "greater",
+    ">=": "greater_equal",
+    "<": "less",
+    "<=": "less_equal",
+    "==": "equal",
+    "!=": "not_equal",
+}
+
+
+@lru_cache(maxsize=4096)
+def _parseIsoDate(value: str) -> int:
+    """Parse a date-only ISO string ("2024-01-02"), memoized.
+
+    Args:
+        value: Date string.
+
+    Returns:
+        Unix timestamp in seconds (UTC midnight).
+    """
+    return _parseIsoString(value)
+
+
+def _parseIsoString(value: str) -> int:
+    """Parse an ISO-8601 string to a UTC Unix timestamp (seconds).
+
+    Args:
+        value: ISO string; naive values are treated as UTC.
+
+    Returns:
+        Unix timestamp in seconds.
+    """
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return int(calendar.timegm(dt.utctimetuple()))
 
 
 def toUnixTimestamp(timeValue: int | float | str | datetime) -> int:
@@ -33,8 +94,9 @@ def toUnixTimestamp(timeValue: int | float | str | datetime) -> int:
         return int(timeValue)
 
     if isinstance(timeValue, str):
-        dt = datetime.fromisoformat(timeValue.replace("Z", "+00:00"))
-        return int(calendar.timegm(dt.utctimetuple()))
+        if len(timeValue) == _ISO_DATE_LENGTH:
+            return _parseIsoDate(timeValue)
+        return _parseIsoString(timeValue)
 
     if isinstance(timeValue, datetime):
         if timeValue.tzinfo is None:
@@ -49,6 +111,76 @@ def toUnixTimestamp(timeValue: int | float | str | datetime) -> int:
     raise TypeError(msg)
 
 
+def _parseIsoStringsBatch(values: Sequence[str]) -> list[int] | None:
+    """Parse a column of uniformly formatted ISO strings in one numpy pass.
+
+    The layout of the first string is checked once; every other string must
+    have the same length, digits in the same positions and identical
+    separators, which is verified on the array's code points without a Python
+    loop. numpy's datetime64 parser then converts the whole column.
+
+    Args:
+        values: Non-empty sequence of ISO strings.
+
+    Returns:
+        Unix timestamps in seconds, or None if the strings aren't uniform, a
+        value doesn't parse, or numpy isn't installed.
+    """
+    first = values[0]
+    if not _ISO_BATCH_PATTERN.fullmatch(first):
+        return None
+
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    arr = np.asarray(values)
+    if arr.dtype != np.dtype(f"U{len(first)}"):
+        return None  # strings of differing lengths
+
+    # One row of UTF-32 code points per string
+    codes = arr.view(np.uint32).reshape(len(arr), len(first))
+    template = np.frombuffer(first.encode("utf-32-le"), dtype=np.uint32)
+    isDigit = (template >= ord("0")) & (template <= ord("9"))
+    digitCols = codes[:, isDigit]
+    if not (
+        ((digitCols >= ord("0")) & (digitCols <= ord("9"))).all()
+        and (codes[:, ~isDigit] == template[~isDigit]).all()
+    ):
+        return None
+
+    if first.endswith("Z"):
+        arr = arr.astype(f"U{len(first) - 1}")  # truncating cast drops the "Z"
+
+    try:
+        parsed = arr.astype("datetime64[us]")
+    except ValueError:
+        return None  # e.g. month out of range; let the scalar path raise
+    result: list[int] = parsed.astype("datetime64[s]").astype(np.int64).tolist()
+    return result
+
+
+def toUnixTimestamps(values: Sequence[DataValue]) -> list[int]:
+    """Convert a batch of time values to UTC Unix timestamps (seconds).
+
+    A column of ISO strings sharing one layout (as produced by JSON APIs) is
+    parsed with a single vectorized call; anything else is converted with
+    ``toUnixTimestamp`` per value.
+
+    Args:
+        values: Time values as accepted by ``toUnixTimestamp``.
+
+    Returns:
+        Unix timestamps in seconds (UTC), in input order.
+    """
+    if values and all(isinstance(v, str) for v in values):
+        parsed = _parseIsoStringsBatch(cast("Sequence[str]", values))
+        if parsed is not None:
+            return parsed
+    return [toUnixTimestamp(v) for v in values]
+
+
 def _normalizeOhlcColumns(columns: Sequence[str]) -> dict[str, str]:
     """Create mapping from lowercase column names to actual column names.
 
@@ -59,166 +191,450 @@ def _normalizeOhlcColumns(columns: Sequence[str]) -> dict[str, str]:
         Mapping from standard names to actual column names.
     """
     columnMap: dict[str, str] = {}
-    standardNames = {"time", "open", "high", "low", "close", "volume", "value"}
+    standardNames = {
+        name.lower(): name for name in ("time", "value", *_OHLC_FIELDS, *COLOR_FIELDS)
+    }
 
     for col in columns:
         lower = col.lower()
         if lower in standardNames:
-            columnMap[lower] = col
+            columnMap[standardNames[lower]] = col
 
     return columnMap
 
 
-def _convertDataframeToOhlc(df: pd.DataFrame) -> list[OhlcData | SingleValueData]:
-    """Convert a pandas DataFrame to OHLC data format.
+def _toUnixSeconds(values: Any) -> np.ndarray[Any, Any]:
+    """Convert a whole column of time values to UTC Unix timestamps (seconds).
+
+    Vectorized counterpart of ``toUnixTimestamp``: datetime64 columns (naive or
+    tz-aware, any unit) are floored to seconds, integers pass through and
+    floats are truncated. Anything else falls back to ``toUnixTimestamp``
+    per element.
 
     Args:
-        df: pandas DataFrame with OHLC columns.
+        values: pandas Series/Index or numpy array of time values.
 
     Returns:
-        List of dicts with time, open, high, low, close.
+        int64 numpy array of Unix timestamps in seconds.
+
+    Raises:
+        ValueError: If the column holds NaT or NaN.
     """
-    columns = list(df.columns)
-    colMap = _normalizeOhlcColumns(columns)
+    import numpy as np
 
-    result: list[OhlcData | SingleValueData] = []
+    if getattr(values.dtype, "tz", None) is not None:
+        # tz-aware pandas data: drop the zone, keeping UTC wall time
+        accessor = values.dt if hasattr(values, "dt") else values
+        values = accessor.tz_convert(None)
+
+    arr: np.ndarray[Any, Any] = np.asarray(values)
+    kind = arr.dtype.kind
+
+    if kind == "O" and len(arr) and isinstance(arr[0], np.datetime64):
+        # datetime64 values held in an object column (e.g. from column_stack)
+        arr = arr.astype("datetime64[s]")
+        kind = "M"
+
+    if (kind == "M" and np.isnat(arr).any()) or (kind == "f" and np.isnan(arr).any()):
+        msg = "Time column must not contain nulls"
+        raise ValueError(msg)
+    if kind == "M":
+        return arr.astype("datetime64[s]").astype(np.int64)
+    if kind in "iuf":
+        # Casting truncates floats toward zero, matching int()
+        return arr.astype(np.int64)
+
+    return np.fromiter(
+        (toUnixTimestamp(v) for v in arr.tolist()), dtype=np.int64, count=len(arr)
+    )
+
+
+def _frameTimes(df: pd.DataFrame, colMap: dict[str, str]) -> np.ndarray[Any, Any]:
+    """Extract the time axis of a DataFrame as Unix seconds.
+
+    Args:
+        df: pandas DataFrame.
+        colMap: Normalized column mapping from ``_normalizeOhlcColumns``.
+
+    Returns:
+        int64 numpy array of Unix timestamps in seconds.
+
+    Raises:
+        ValueError: If there is neither a time column nor a datetime index.
+    """
+    if "time" in colMap:
+        return _toUnixSeconds(df[colMap["time"]])
 
-    # Check if index is datetime-like
     index = df.index
-    hasDatetimeIndex = hasattr(index, "to_pydatetime") or hasattr(index, "asi8")
+    if hasattr(index, "to_pydatetime") or hasattr(index, "asi8"):
+        return _toUnixSeconds(index)
 
-    for i, row in enumerate(df.itertuples(index=True)):
-        data: OhlcData = {}
+    msg = "DataFrame must have a 'time' column or datetime index"
+    raise ValueError(msg)
 
-        # Handle time from index or column
-        if "time" in colMap:
-            data["time"] = toUnixTimestamp(getattr(row, colMap["time"]))
-        elif hasDatetimeIndex:
-            idxVal = index[i]
-            data["time"] = toUnixTimestamp(idxVal)
-        else:
-            msg = "DataFrame must have a 'time' column or datetime index"
-            raise ValueError(msg)
 
-        # Map OHLC columns
-        for stdName in ("open", "high", "low", "close"):
-            if stdName in colMap:
-                data[stdName] = float(getattr(row, colMap[stdName]))
+def _valueColumn(columns: Sequence[str], colMap: dict[str, str]) -> str:
+    """Pick the column holding single-value data.
+
+    Args:
+        columns: All column names.
+        colMap: Normalized column mapping from ``_normalizeOhlcColumns``.
+
+    Returns:
+        The 'value' column, or the only column besides time.
 
-        # Optional volume
-        if "volume" in colMap:
-            data["volume"] = float(getattr(row, colMap["volume"]))
+    Raises:
+        ValueError: If the value column is ambiguous.
+    """
+    if "value" in colMap:
+        return colMap["value"]
+    reserved = {colMap[name] for name in ("time", *COLOR_FIELDS) if name in colMap}
+    candidates = [col for col in columns if col not in reserved]
+    if len(candidates) == 1:
+        # Single column (besides time and colors) - use it as value
+        return candidates[0]
+    msg = "Cannot determine value column"
+    raise ValueError(msg)
+
+
+def _convertDataframeToOhlc(df: pd.DataFrame) -> ColumnarData:
+    """Convert a pandas DataFrame to OHLC data format.
 
-        result.append(data)
+    Args:
+        df: pandas DataFrame with OHLC columns.
 
-    return result
+    Returns:
+        Columnar data with time, open, high, low, close (and volume and
+        color columns, if present).
+    """
+    import numpy as np
+
+    colMap = _normalizeOhlcColumns(list(df.columns))
+    times = _frameTimes(df, colMap)
+
+    columns: dict[str, np.ndarray[Any, Any]] = {}
+    for stdName in _OHLC_FIELDS:
+        if stdName in colMap:
+            columns[stdName] = df[colMap[stdName]].to_numpy(dtype=np.float64, copy=True)
+    for stdName in COLOR_FIELDS:
+        if stdName in colMap:
+            columns[stdName] = df[colMap[stdName]].to_numpy(copy=True)
+
+    return ColumnarData(times, columns)
 
 
 def _convertDataframeToSingleValue(
     df: pd.DataFrame | pd.Series[float],
-) -> list[OhlcData | SingleValueData]:
+) -> ColumnarData:
     """Convert a pandas DataFrame/Series to single-value data format.
 
+    The index (or time column) and the value column are converted as whole
+    numpy arrays. Integer indexes are used as Unix timestamps directly.
+
     Args:
         df: pandas DataFrame or Series with value data.
 
     Returns:
-        List of dicts with time and value.
+        Columnar data with time and value (and color columns, if present).
     """
-    result: list[OhlcData | SingleValueData] = []
-    index = df.index
-    hasDatetimeIndex = hasattr(index, "to_pydatetime") or hasattr(index, "asi8")
+    import numpy as np
 
     # Check if this is a Series-like object
     if hasattr(df, "items") and not hasattr(df, "columns"):
-        # It's a Series
-        assert isinstance(df, pd.Series)
-        for idxVal, value in df.items():
-            itemData: SingleValueData = {"value": float(value)}
-            if hasDatetimeIndex:
-                itemData["time"] = toUnixTimestamp(idxVal)  # type: ignore[arg-type]
-            else:
-                itemData["time"] = int(idxVal)  # type: ignore[call-overload]
-            result.append(itemData)
-        return result
+        times = _toUnixSeconds(df.index)
+        return ColumnarData(times, {"value": df.to_numpy(dtype=np.float64, copy=True)})
 
     # It's a DataFrame
-    assert isinstance(df, pd.DataFrame)
-    columns = list(df.columns)
+    frame = cast("pd.DataFrame", df)
+    columns = list(frame.columns)
     colMap = _normalizeOhlcColumns(columns)
 
-    for i, row in enumerate(df.itertuples(index=True)):
-        data: SingleValueData = {}
+    if "time" not in colMap and frame.index.dtype.kind in "iu":
+        times = _toUnixSeconds(frame.index)
+    else:
+        times = _frameTimes(frame, colMap)
 
-        # Handle time
-        if "time" in colMap:
-            data["time"] = toUnixTimestamp(getattr(row, colMap["time"]))
-        elif hasDatetimeIndex:
-            idxVal = index[i]
-            data["time"] = toUnixTimestamp(idxVal)
-        else:
-            msg = "DataFrame must have a 'time' column or datetime index"
-            raise ValueError(msg)
+    fields = {
+        "value": frame[_valueColumn(columns, colMap)].to_numpy(
+            dtype=np.float64, copy=True
+        )
+    }
+    for stdName in COLOR_FIELDS:
+        if stdName in colMap:
+            fields[stdName] = frame[colMap[stdName]].to_numpy(copy=True)
+    return ColumnarData(times, fields)
 
-        # Get value column
-        if "value" in colMap:
-            data["value"] = float(getattr(row, colMap["value"]))
-        elif len(columns) == 1 or (len(columns) == 2 and "time" in colMap):
-            # Single column (besides time) - use it as value
-            for col in columns:
-                if col.lower() != "time":
-                    data["value"] = float(getattr(row, col))
-                    break
-        else:
-            msg = "Cannot determine value column"
-            raise ValueError(msg)
 
-        result.append(data)
+def _convertStructuredArray(arr: np.ndarray[Any, Any]) -> ColumnarData:
+    """Convert a numpy structured/record array field by field.
 
-    return result
+    Field names are matched case-insensitively against time, open, high, low,
+    close, volume, value and the color fields. The time field may be
+    datetime64 of any unit.
 
+    Args:
+        arr: numpy structured array.
 
-def _convertNumpyToOhlc(
-    arr: np.ndarray[Any, Any],
-) -> list[OhlcData | SingleValueData]:
+    Returns:
+        Columnar data with time and every recognized value field.
+
+    Raises:
+        ValueError: If the array has no time field.
+    """
+    import numpy as np
+
+    colMap = _normalizeOhlcColumns(arr.dtype.names or ())
+    if "time" not in colMap:
+        msg = "Structured array must have a 'time' field"
+        raise ValueError(msg)
+
+    times = _toUnixSeconds(arr[colMap["time"]])
+    columns: dict[str, np.ndarray[Any, Any]] = {}
+    for stdName in ("open", "high", "low", "close", "volume", "value"):
+        if stdName in colMap:
+            columns[stdName] = arr[colMap[stdName]].astype(np.float64)
+    for stdName in COLOR_FIELDS:
+        if stdName in colMap:
+            columns[stdName] = arr[colMap[stdName]].copy()
+
+    return ColumnarData(times, columns)
+
+
+def _convertNumpyToOhlc(arr: np.ndarray[Any, Any]) -> ColumnarData:
     """Convert a numpy array to OHLC data format.
 
     Expects array with shape (n, 5) for [time, open, high, low, close]
-    or (n, 6) for [time, open, high, low, close, volume].
+    or (n, 6) for [time, open, high, low, close, volume], or (n, 2) for
+    [time, value]. Structured arrays with named fields are also accepted;
+    separate datetime64 time columns can be combined with the value
+    columns via ``np.rec.fromarrays``. An empty array of any shape gives
+    empty data.
 
     Args:
         arr: numpy array.
 
     Returns:
-        List of dicts with OHLC data.
+        Columnar data with OHLC or single-value fields.
+
+    Raises:
+        ValueError: If the array shape is not one of the above.
     """
-    arrayList = arr.tolist()
-    result: list[OhlcData | SingleValueData] = []
+    import numpy as np
+
+    if arr.dtype.names:
+        return _convertStructuredArray(arr)
+
+    if arr.size == 0:
+        return ColumnarData(np.empty(0, dtype=np.int64), {})
+
+    if arr.ndim != 2:
+        msg = f"Expected a 2-D or structured array, got shape {arr.shape}"
+        raise ValueError(msg)
+
+    width = arr.shape[1]
+    if width >= 5:
+        fields = ["open", "high", "low", "close", "volume"][: min(width, 6) - 1]
+    elif width == 2:
+        fields = ["value"]
+    else:
+        msg = f"Unexpected array row length: {width}"
+        raise ValueError(msg)
+
+    times = _toUnixSeconds(arr[:, 0])
+    columns = {name: arr[:, i + 1].astype(np.float64) for i, name in enumerate(fields)}
+    return ColumnarData(times, columns)
 
-    for row in arrayList:
-        if len(row) >= 5:
-            data: OhlcData = {
-                "time": toUnixTimestamp(row[0]),
-                "open": float(row[1]),
-                "high": float(row[2]),
-                "low": float(row[3]),
-                "close": float(row[4]),
-            }
-            if len(row) >= 6:
-                data["volume"] = float(row[5])
-            result.append(data)
-        elif len(row) == 2:
-            result.append(
-                SingleValueData(
-                    time=toUnixTimestamp(row[0]),
-                    value=float(row[1]),
-                )
+
+def _isArrowTable(data: object) -> bool:
+    """Return whether data is a pyarrow Table or RecordBatch (duck-typed)."""
+    return hasattr(data, "schema") and hasattr(data, "column_names")
+
+
+def _arrowToNumpy(column: Any) -> np.ndarray[Any, Any]:
+    """Export an Arrow Array/ChunkedArray to numpy.
+
+    Each chunk is exported as a zero-copy view when its type allows (numeric,
+    no nulls); a single-chunk column is returned as that view. Several chunks
+    are copied straight into one output array without concatenating them in
+    Arrow first. Nulls become NaN.
+
+    Args:
+        column: pyarrow Array or ChunkedArray.
+
+    Returns:
+        numpy array (read-only when zero-copy).
+    """
+    import numpy as np
+
+    chunks = column.chunks if hasattr(column, "chunks") else [column]
+    arrays: list[np.ndarray[Any, Any]] = [
+        chunk.to_numpy(zero_copy_only=False) for chunk in chunks
+    ]
+    if len(arrays) == 1:
+        return arrays[0]
+    if not arrays:
+        return np.empty(0, dtype=column.type.to_pandas_dtype())
+    return np.concatenate(arrays)
+
+
+def _arrowTimes(column: Any) -> np.ndarray[Any, Any]:
+    """Convert an Arrow time column to Unix seconds.
+
+    Timestamp columns of any unit (and dates) are floored to seconds with
+    Arrow compute; numeric and string columns go through the same rules as
+    ``toUnixTimestamp``.
+
+    Args:
+        column: pyarrow Array or ChunkedArray.
+
+    Returns:
+        int64 numpy array of Unix timestamps in seconds.
+
+    Raises:
+        ValueError: If the column contains nulls.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if column.null_count:
+        msg = "Time column must not contain nulls"
+        raise ValueError(msg)
+
+    columnType = column.type
+    if pa.types.is_date(columnType):
+        column = pc.cast(column, pa.timestamp("s"))
+    elif pa.types.is_timestamp(columnType) and columnType.unit != "s":
+        floored = pc.floor_temporal(column, unit="second")
+        column = pc.cast(floored, pa.timestamp("s", columnType.tz))
+
+    if pa.types.is_timestamp(column.type):
+        return _arrowToNumpy(pc.cast(column, pa.int64()))
+    if pa.types.is_string(columnType) or pa.types.is_large_string(columnType):
+        return np.asarray(toUnixTimestamps(column.to_pylist()), dtype=np.int64)
+    return _toUnixSeconds(_arrowToNumpy(column))
+
+
+def _convertArrowTable(table: Any, fields: Sequence[str] | None) -> ColumnarData:
+    """Convert a pyarrow Table or RecordBatch column by column.
+
+    Column names are matched case-insensitively like DataFrame columns; a
+    'time' column is required since Arrow tables have no index.
+
+    Args:
+        table: pyarrow Table or RecordBatch.
+        fields: OHLC field names to read, or None for single-value data.
+
+    Returns:
+        Columnar data.
+
+    Raises:
+        ValueError: If the table has no time column or no value column.
+    """
+    columnNames = list(table.column_names)
+    colMap = _normalizeOhlcColumns(columnNames)
+    if "time" not in colMap:
+        msg = "Arrow table must have a 'time' column"
+        raise ValueError(msg)
+
+    names = (
+        {name: colMap[name] for name in fields if name in colMap}
+        if fields is not None
+        else {"value": _valueColumn(columnNames, colMap)}
+    )
+    names.update({name: colMap[name] for name in COLOR_FIELDS if name in colMap})
+    times = _arrowTimes(table.column(colMap["time"]))
+    return ColumnarData(
+        times,
+        {name: _arrowToNumpy(table.column(col)) for name, col in names.items()},
+    )
+
+
+def _isPolars(data: object) -> bool:
+    """Return whether data is a polars DataFrame or Series."""
+    return type(data).__module__.startswith("polars.")
+
+
+def _polarsTimes(column: pl.Series) -> np.ndarray[Any, Any]:
+    """Convert a polars time column to Unix seconds.
+
+    Datetime (any unit, naive or tz-aware) and Date columns are floored to
+    seconds with a polars expression; numeric and string columns go through
+    the same rules as ``toUnixTimestamp``.
+
+    Args:
+        column: polars Series.
+
+    Returns:
+        int64 numpy array of Unix timestamps in seconds.
+
+    Raises:
+        ValueError: If the column contains nulls.
+    """
+    import numpy as np
+    import polars as pl
+
+    if column.null_count():
+        msg = "Time column must not contain nulls"
+        raise ValueError(msg)
+
+    if isinstance(column.dtype, (pl.Date, pl.Datetime)):
+        return column.dt.epoch("s").to_numpy()
+    if column.dtype.is_numeric():
+        return _toUnixSeconds(column.to_numpy())
+    return np.asarray(toUnixTimestamps(column.to_list()), dtype=np.int64)
+
+
+def _convertPolars(
+    data: pl.DataFrame | pl.Series, fields: Sequence[str] | None
+) -> ColumnarData:
+    """Convert a polars DataFrame (or struct Series) column by column.
+
+    Column names are matched case-insensitively like pandas columns; a 'time'
+    column is required since polars frames have no index. Numeric columns are
+    exported with ``to_numpy()``, which is zero-copy for null-free numeric
+    data.
+
+    Args:
+        data: polars DataFrame, or a Series of struct dtype.
+        fields: OHLC field names to read, or None for single-value data.
+
+    Returns:
+        Columnar data.
+
+    Raises:
+        ValueError: If there is no time column or no value column.
+    """
+    import polars as pl
+
+    if isinstance(data, pl.Series):
+        series = data
+        if not isinstance(series.dtype, pl.Struct):
+            msg = (
+                "A polars Series has no time axis; pass a DataFrame with a "
+                "'time' column or a Series of structs with 'time' and 'value'"
             )
-        else:
-            msg = f"Unexpected array row length: {len(row)}"
             raise ValueError(msg)
-
-    return result
+        data = series.struct.unnest()
+
+    frame = data
+    columnNames = list(frame.columns)
+    colMap = _normalizeOhlcColumns(columnNames)
+    if "time" not in colMap:
+        msg = "Polars DataFrame must have a 'time' column"
+        raise ValueError(msg)
+
+    names = (
+        {name: colMap[name] for name in fields if name in colMap}
+        if fields is not None
+        else {"value": _valueColumn(columnNames, colMap)}
+    )
+    names.update({name: colMap[name] for name in COLOR_FIELDS if name in colMap})
+    times = _polarsTimes(frame.get_column(colMap["time"]))
+    return ColumnarData(
+        times,
+        {name: frame.get_column(col).to_numpy() for name, col in names.items()},
+    )
 
 
 def _convertListOfDicts(
@@ -232,59 +648,395 @@ def _convertListOfDicts(
     Returns:
         List of dicts with normalized time values.
     """
-    result: list[OhlcData | SingleValueData] = []
+    result: list[OhlcData | SingleValueData] = [dict(item) for item in data]  # type: ignore[misc]
 
-    for item in data:
-        normalized: OhlcData | SingleValueData = dict(item)  # type: ignore[assignment]
-        if "time" in normalized:
-            normalized["time"] = toUnixTimestamp(normalized["time"])
-        result.append(normalized)
+    timed = [point for point in result if "time" in point]
+    times = toUnixTimestamps([point["time"] for point in timed])
+    for point, timestamp in zip(timed, times, strict=True):
+        point["time"] = timestamp
 
     return result
 
 
-def toLwcOhlcData(
-    data: pd.DataFrame | np.ndarray[Any, Any] | list[Mapping[str, DataValue]],
-) -> list[OhlcData | SingleValueData]:
-    """Convert various data formats to LWC OHLC data format.
+def convertOhlcData(
+    data: OhlcInput,
+) -> SeriesData:
+    """Convert OHLC input to series storage.
+
+    Like ``toLwcOhlcData``, but pandas and numpy input is kept in columnar
+    form instead of being expanded into one dict per data point.
 
     Args:
-        data: Data as list of dicts, pandas DataFrame, or numpy array.
+        data: Data as list of dicts, pandas or polars DataFrame, numpy array,
+            or pyarrow Table/RecordBatch.
 
     Returns:
-        List of dicts with time, open, high, low, close.
+        ColumnarData for array-like input, list of dicts otherwise.
     """
     if isinstance(data, list):
         return _convertListOfDicts(data)
 
+    if _isArrowTable(data):
+        return _convertArrowTable(data, _OHLC_FIELDS)
+
+    if _isPolars(data):
+        return _convertPolars(data, _OHLC_FIELDS)  # type: ignore[arg-type]
+
     # pandas DataFrame (check before numpy since DataFrame has shape too)
     if hasattr(data, "itertuples") and hasattr(data, "columns"):
         return _convertDataframeToOhlc(data)  # type: ignore[arg-type]
 
     # numpy array
-    return _convertNumpyToOhlc(data)
+    return _convertNumpyToOhlc(data)  # type: ignore[arg-type]
 
 
-def toLwcSingleValueData(
-    data: pd.DataFrame
-    | pd.Series[float]
-    | np.ndarray[Any, Any]
-    | list[Mapping[str, DataValue]],
-) -> list[OhlcData | SingleValueData]:
-    """Convert various data formats to LWC single-value data format.
+def convertSingleValueData(
+    data: SingleValueInput,
+) -> SeriesData:
+    """Convert single-value input to series storage.
+
+    Like ``toLwcSingleValueData``, but pandas and numpy input is kept in
+    columnar form instead of being expanded into one dict per data point.
 
     Args:
-        data: Data as list of dicts, pandas DataFrame/Series, or numpy array.
+        data: Data as list of dicts, pandas DataFrame/Series, polars
+            DataFrame/Series, numpy array, or pyarrow Table/RecordBatch.
 
     Returns:
-        List of dicts with time and value.
+        ColumnarData for array-like input, list of dicts otherwise.
     """
     if isinstance(data, list):
         return _convertListOfDicts(data)
 
+    if _isArrowTable(data):
+        return _convertArrowTable(data, None)
+
+    if _isPolars(data):
+        return _convertPolars(data, None)  # type: ignore[arg-type]
+
     # pandas Series or DataFrame
     if hasattr(data, "index") and (hasattr(data, "columns") or hasattr(data, "items")):
         return _convertDataframeToSingleValue(data)  # type: ignore[arg-type]
 
     # numpy array
-    return _convertNumpyToOhlc(data)
+    return _convertNumpyToOhlc(data)  # type: ignore[arg-type]
+
+
+def toRecords(data: SeriesData) -> list[OhlcData | SingleValueData]:
+    """Return series storage as a list of data point dicts.
+
+    Args:
+        data: ColumnarData or list of dicts.
+
+    Returns:
+        List of dicts (the list itself when already in row form).
+    """
+    if isinstance(data, ColumnarData):
+        return data.toRecords()
+    return data
+
+
+def sanitizeData(data: SeriesData) -> tuple[SeriesData, int]:
+    """Make times strictly ascending, as LWC requires.
+
+    Points are stably sorted by time and, for duplicate timestamps, only the
+    last point is kept. Columnar data is checked with one O(n) vectorized
+    pass first and returned untouched when already strictly ascending.
+
+    The number of fixes is the count of points out of order (each point
+    earlier than its predecessor) plus the count of duplicates dropped.
+
+    Args:
+        data: ColumnarData or list of dicts with normalized times.
+
+    Returns:
+        Tuple of (sanitized data, number of fixes).
+    """
+    if isinstance(data, ColumnarData):
+        return _sanitizeColumns(data)
+
+    times = [point.get("time", 0) for point in data]
+    if all(a < b for a, b in pairwise(times)):
+        return data, 0
+
+    order = sorted(range(len(data)), key=times.__getitem__)
+    descents = sum(1 for a, b in pairwise(times) if b < a)
+    keep = [
+        index
+        for position, index in enumerate(order)
+        if position + 1 == len(order) or times[order[position + 1]] != times[index]
+    ]
+    return [data[index] for index in keep], descents + len(order) - len(keep)
+
+
+def _sanitizeColumns(data: ColumnarData) -> tuple[ColumnarData, int]:
+    """Vectorized ``sanitizeData`` for columnar data.
+
+    Args:
+        data: Columnar series data.
+
+    Returns:
+        Tuple of (sanitized data, number of fixes).
+    """
+    import numpy as np
+
+    times = data.time
+    if len(times) < 2 or bool((times[1:] > times[:-1]).all()):
+        return data, 0  # already strictly ascending
+
+    descents = int(np.count_nonzero(times[1:] < times[:-1]))
+    order = np.argsort(times, kind="stable")
+    sortedTimes = times[order]
+    # Keep the last point of each run of equal timestamps
+    keep = np.append(sortedTimes[1:] != sortedTimes[:-1], True)
+    order = order[keep]
+    return data.take(order), descents + len(times) - len(order)
+
+
+def applyNanPolicy(data: SeriesData, policy: NanPolicy) -> SeriesData:
+    """Handle points with NaN/inf values, which are not valid JSON.
+
+    Args:
+        data: ColumnarData or list of dicts.
+        policy: "keep" leaves them as-is, "whitespace" turns them into
+            time-only whitespace points, "drop" removes them.
+
+    Returns:
+        Data with non-finite points handled.
+
+    Raises:
+        ValueError: If policy is not one of the above.
+    """
+    if policy not in ("keep", "whitespace", "drop"):
+        msg = f"Unknown NaN policy: {policy!r}"
+        raise ValueError(msg)
+    if policy == "keep":
+        return data
+
+    if isinstance(data, ColumnarData):
+        import numpy as np
+
+        # One mask over every value column
+        invalid = np.zeros(len(data), dtype=bool)
+        for name, column in data.fields.items():
+            if name not in COLOR_FIELDS:
+                invalid |= ~np.isfinite(column)
+        if not invalid.any():
+            return data
+        if policy == "drop":
+            return data.take(~invalid)
+        return ColumnarData(data.time, data.fields, invalid | data.whitespaceMask())
+
+    result: list[OhlcData | SingleValueData] = []
+    for point in data:
+        if all(
+            math.isfinite(value)
+            for value in point.values()
+            if isinstance(value, numbers.Real)
+        ):
+            result.append(point)
+        elif policy == "whitespace":
+            result.append({"time": point["time"]})
+    return result
+
+
+def roundValues(data: SeriesData, digits: int) -> SeriesData:
+    """Round every value field to a number of decimals.
+
+    Float64 artifacts like ``101.23000000000001`` otherwise serialize with up
+    to 17 significant digits. Time and color fields are left untouched.
+
+    Args:
+        data: ColumnarData or list of dicts.
+        digits: Number of decimals to keep.
+
+    Returns:
+        New data with rounded values.
+    """
+    if isinstance(data, ColumnarData):
+        import numpy as np
+
+        return ColumnarData(
+            data.time,
+            {
+                name: col if name in COLOR_FIELDS else np.round(col, digits)
+                for name, col in data.fields.items()
+            },
+            data.whitespace,
+        )
+
+    return [
+        {  # type: ignore[misc]
+            key: round(value, digits) if isinstance(value, float) else value
+            for key, value in point.items()
+        }
+        for point in data
+    ]
+
+
+def projectFields(data: SeriesData, fields: Collection[str]) -> SeriesData:
+    """Keep only the data point keys a series type reads.
+
+    LWC ignores other keys (e.g. volume on a candlestick), so they would
+    only add payload bytes. Time is always kept.
+
+    Args:
+        data: ColumnarData or list of dicts.
+        fields: Keys to keep besides time.
+
+    Returns:
+        Data without the other keys; the input itself if nothing is dropped.
+    """
+    if isinstance(data, ColumnarData):
+        if all(name in fields for name in data.fields):
+            return data
+        return ColumnarData(
+            data.time,
+            {name: col for name, col in data.fields.items() if name in fields},
+            data.whitespace,
+        )
+
+    if all(key == "time" or key in fields for point in data for key in point):
+        return data
+    return [
+        {key: value for key, value in point.items() if key == "time" or key in fields}  # type: ignore[misc]
+        for point in data
+    ]
+
+
+def _sourceColumn(source: object, name: str) -> np.ndarray[Any, Any]:
+    """Read one numeric column from unconverted series input.
+
+    Lets a color rule compare columns the series itself does not keep, e.g.
+    close and open of the frame behind a volume histogram.
+
+    Args:
+        source: Input as accepted by ``convertOhlcData``.
+        name: Column name, matched case-insensitively like OHLC columns.
+
+    Returns:
+        float64 numpy array with one value per input row.
+
+    Raises:
+        ValueError: If the input has no such column.
+    """
+    import numpy as np
+
+    if isinstance(source, list):
+        try:
+            return np.fromiter(
+                (point[name] for point in source), dtype=np.float64, count=len(source)
+            )
+        except KeyError:
+            pass
+    elif isinstance(source, np.ndarray) and not source.dtype.names:
+        # Plain 2-D arrays are positional, see _convertNumpyToOhlc
+        width = source.shape[1] if source.ndim == 2 else 0
+        layout = ["time", *_OHLC_FIELDS] if width >= 5 else ["time", "value"]
+        if name in layout[:width]:
+            return source[:, layout.index(name)].astype(np.float64)
+    else:
+        frame: Any = source
+        if _isPolars(frame) and not hasattr(frame, "columns"):
+            frame = frame.struct.unnest()
+        if hasattr(frame, "column_names"):
+            columns = list(frame.column_names)
+        elif hasattr(frame, "columns"):
+            columns = list(frame.columns)
+        else:
+            columns = list(getattr(frame.dtype, "names", None) or ())
+        colMap = _normalizeOhlcColumns(columns)
+        column = colMap.get(name, name if name in columns else None)
+        if column is not None:
+            if _isArrowTable(frame):
+                return _arrowToNumpy(frame.column(column)).astype(np.float64)
+            if hasattr(frame[column], "to_numpy"):
+                return np.asarray(frame[column].to_numpy(), dtype=np.float64)
+            return np.asarray(frame[column], dtype=np.float64)
+
+    msg = f"Color rule column '{name}' not found in data"
+    raise ValueError(msg)
+
+
+def applyColorRule(data: SeriesData, source: object, rule: ColorRule) -> SeriesData:
+    """Color every point by comparing two columns, as one vectorized mask.
+
+    For example ``{"left": "close", "op": ">=", "right": "open", "upColor":
+    "#26a69a", "downColor": "#ef5350"}`` colors a volume histogram by bar
+    direction. Operands are looked up in the converted data first and then
+    in the source input, so columns the series does not keep can be used.
+
+    Args:
+        data: Converted data, one point per source row.
+        source: The input ``data`` was converted from.
+        rule: Color rule; ``right`` may also be a number.
+
+    Returns:
+        Data with the rule's color field set on every point.
+
+    Raises:
+        ValueError: If the rule is incomplete or names an unknown column.
+    """
+    import numpy as np
+
+    if "upColor" not in rule or "downColor" not in rule:
+        msg = "Color rule needs both 'upColor' and 'downColor'"
+        raise ValueError(msg)
+    op = rule.get("op", ">=")
+    if op not in _RULE_OPERATORS:
+        msg = f"Unknown color rule operator: {op!r}"
+        raise ValueError(msg)
+
+    def operand(value: str | float) -> Any:
+        if not isinstance(value, str):
+            return value
+        if isinstance(data, ColumnarData) and value in data.fields:
+            return data.fields[value]
+        return _sourceColumn(source, value)
+
+    compare = getattr(np, _RULE_OPERATORS[op])
+    mask = compare(
+        operand(rule.get("left", "close")), operand(rule.get("right", "open"))
+    )
+    colors = np.where(mask, rule["upColor"], rule["downColor"]).astype(object)
+    field = rule.get("field", "color")
+
+    if isinstance(data, ColumnarData):
+        return ColumnarData(data.time, {**data.fields, field: colors}, data.whitespace)
+
+    result: list[OhlcData | SingleValueData] = []
+    for point, color in zip(data, colors.tolist(), strict=True):
+        colored = dict(point)
+        colored[field] = color
+        result.append(colored)  # type: ignore[arg-type]
+    return result
+
+
+def toLwcOhlcData(
+    data: OhlcInput,
+) -> list[OhlcData | SingleValueData]:
+    """Convert various data formats to LWC OHLC data format.
+
+    Args:
+        data: Data as list of dicts, pandas or polars DataFrame, numpy array,
+            or pyarrow Table/RecordBatch.
+
+    Returns:
+        List of dicts with time, open, high, low, close.
+    """
+    return toRecords(convertOhlcData(data))
+
+
+def toLwcSingleValueData(
+    data: SingleValueInput,
+) -> list[OhlcData | SingleValueData]:
+    """Convert various data formats to LWC single-value data format.
+
+    Args:
+        data: Data as list of dicts, pandas DataFrame/Series, polars
+            DataFrame/Series, numpy array, or pyarrow Table/RecordBatch.
+
+    Returns:
+        List of dicts with time and value.
+    """
+    return toRecords(convertSingleValueData(data))
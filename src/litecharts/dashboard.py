@@ -0,0 +1,136 @@
+"""Dashboard pages combining many charts."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from _typeshed import SupportsWrite
+
+    from .chart import Chart
+    from .types import StyleOptions
+
+
+class Dashboard:
+    """A page of charts sharing one copy of the library and plugins.
+
+    The LWC library and each plugin any chart uses (rectangles, marker
+    tooltips, payload decoders) are written once in the page head, and all
+    charts are streamed into the body as fragments, laid out in a grid.
+
+    Example::
+
+        from litecharts import CandlestickSeries, Dashboard, createChart
+
+        dashboard = Dashboard("Monitoring", columns=2)
+        for symbol, df in frames.items():
+            chart = createChart({"width": 600, "height": 300})
+            chart.addSeries(CandlestickSeries).setData(df)
+            dashboard.addChart(chart, title=symbol)
+        dashboard.save("monitoring.html")
+    """
+
+    def __init__(
+        self,
+        title: str = "Dashboard",
+        *,
+        columns: int = 1,
+        style: StyleOptions | None = None,
+    ) -> None:
+        """Initialize the dashboard.
+
+        Args:
+            title: Page title.
+            columns: Number of grid columns.
+            style: Optional HTML document styling options.
+        """
+        self._title = title
+        self._columns = columns
+        self._style: StyleOptions = style.copy() if style else {}
+        self._charts: list[Chart] = []
+        self._titles: list[str | None] = []
+
+    @property
+    def title(self) -> str:
+        """Return the page title."""
+        return self._title
+
+    @property
+    def columns(self) -> int:
+        """Return the number of grid columns."""
+        return self._columns
+
+    @property
+    def style(self) -> StyleOptions:
+        """Return the HTML document styling options."""
+        return self._style
+
+    @property
+    def charts(self) -> list[Chart]:
+        """Return the charts in page order."""
+        return self._charts
+
+    @property
+    def titles(self) -> list[str | None]:
+        """Return each chart's heading (None for no heading)."""
+        return self._titles
+
+    def addChart(self, chart: Chart, title: str | None = None) -> Chart:
+        """Add a chart to the end of the page.
+
+        Args:
+            chart: The chart to add.
+            title: Optional heading shown above the chart.
+
+        Returns:
+            The added chart.
+        """
+        self._charts.append(chart)
+        self._titles.append(title)
+        return chart
+
+    def toHtml(self) -> str:
+        """Generate the dashboard page as HTML.
+
+        Returns:
+            HTML string.
+        """
+        from .render import iterDashboard
+
+        return "".join(iterDashboard(self))
+
+    def write(
+        self, fp: SupportsWrite[str], *, scripts: Sequence[str] | None = None
+    ) -> None:
+        """Write the dashboard page to a text stream, chart by chart.
+
+        Args:
+            fp: Writable text stream (open file, StringIO, ...).
+            scripts: URLs of the LWC library and plugin scripts to link
+                instead of inlining them (see ``writeAssets``).
+        """
+        from .render import iterDashboard
+
+        for chunk in iterDashboard(self, scripts):
+            fp.write(chunk)
+
+    def save(
+        self, path: str | Path, *, assets: Literal["inline", "sidecar"] = "inline"
+    ) -> None:
+        """Save the dashboard page to an HTML file.
+
+        Args:
+            path: File path to save to.
+            assets: "inline" or "sidecar", as for ``Chart.save``. As there,
+                ``path`` is only replaced once the page is fully written.
+        """
+        from ._files import atomicWriter
+        from ._js import resolveAssets
+
+        path = Path(path)
+        scripts = resolveAssets(path.parent, assets)
+        with atomicWriter(path) as fp:
+            self.write(fp, scripts=scripts)
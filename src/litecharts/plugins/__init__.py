@@ -5,12 +5,19 @@ from .draw_rectangle import (
     extractRectangles,
     renderRectangleJs,
 )
-from .marker_tooltips import extractMarkerTooltips, renderTooltipJs
+from .marker_tooltips import (
+    TOOLTIP_RUNTIME_JS,
+    extractMarkerTooltips,
+    renderTooltipCallJs,
+    renderTooltipJs,
+)
 
 __all__ = [
     "RECTANGLE_PRIMITIVE_JS",
+    "TOOLTIP_RUNTIME_JS",
     "extractMarkerTooltips",
     "extractRectangles",
     "renderRectangleJs",
+    "renderTooltipCallJs",
     "renderTooltipJs",
 ]
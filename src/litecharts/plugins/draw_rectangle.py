@@ -8,9 +8,10 @@ The rectangle primitive is rendered behind the candles (zOrder: 'bottom').
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
+from .._json import dumps
+
 if TYPE_CHECKING:
     from ..series import BaseSeries
     from ..types import OhlcInput, RectangleOptions, SingleValueInput
@@ -128,7 +129,7 @@ def renderRectangleJs(
         }
         jsRectangles.append(jsRect)
 
-    rectanglesJson = json.dumps(jsRectangles)
+    rectanglesJson = dumps(jsRectangles)
     primitiveVar = f"rectPrimitive_{seriesVar}"
 
     return f"""// Rectangle primitive for {seriesVar}
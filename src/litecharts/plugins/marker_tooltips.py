@@ -8,12 +8,47 @@ This is a custom enhancement - LWC doesn't have built-in marker tooltips.
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
 
+from .._json import dumps
+
 if TYPE_CHECKING:
     from ..pane import Pane
 
+# Shared tooltip runtime, included once per page by Dashboard. Each chart
+# then attaches its tooltips with one litechartsAttachTooltips() call.
+TOOLTIP_RUNTIME_JS = """
+function litechartsAttachTooltips(chart, containerId, tooltips) {
+    const container = document.getElementById(containerId);
+    const tooltip = document.createElement('div');
+    tooltip.style.cssText = 'position:absolute;display:none;padding:8px 12px;' +
+        'background:rgba(0,0,0,0.85);color:white;border-radius:4px;' +
+        'font-size:12px;pointer-events:none;z-index:1000;max-width:250px;';
+    container.style.position = 'relative';
+    container.appendChild(tooltip);
+    chart.subscribeCrosshairMove(function(param) {
+        const data = param.hoveredObjectId && tooltips[param.hoveredObjectId];
+        if (!data) {
+            tooltip.style.display = 'none';
+            return;
+        }
+        let html = data.title ? '<strong>' + data.title + '</strong><br>' : '';
+        if (data.fields) {
+            for (const [key, val] of Object.entries(data.fields)) {
+                html += '<span style="color:#aaa">' + key + ':</span> ';
+                html += val + '<br>';
+            }
+        }
+        tooltip.innerHTML = html;
+        tooltip.style.display = 'block';
+        if (param.point) {
+            tooltip.style.left = (param.point.x + 15) + 'px';
+            tooltip.style.top = (param.point.y - 15) + 'px';
+        }
+    });
+}
+"""
+
 
 def extractMarkerTooltips(pane: Pane) -> dict[str, dict[str, object]]:
     """Extract tooltip data from markers that have 'id' and 'tooltip' fields.
@@ -50,7 +85,7 @@ def renderTooltipJs(
     tooltipVar = f"tooltip_{chartVar}"
     tooltipsDataVar = f"markerTooltips_{chartVar}"
 
-    tooltipsJson = json.dumps(tooltips)
+    tooltipsJson = dumps(tooltips)
 
     return f"""// Marker tooltips
     const {tooltipsDataVar} = {tooltipsJson};
@@ -80,3 +115,21 @@ def renderTooltipJs(
             {tooltipVar}.style.display = 'none';
         }}
     }});"""
+
+
+def renderTooltipCallJs(
+    chartVar: str, containerId: str, tooltips: dict[str, dict[str, object]]
+) -> str:
+    """Generate JS code attaching tooltips through the shared runtime.
+
+    Requires ``TOOLTIP_RUNTIME_JS`` on the page.
+
+    Args:
+        chartVar: The JS variable name of the chart.
+        containerId: The HTML container ID for the pane.
+        tooltips: Dict mapping marker IDs to tooltip data.
+
+    Returns:
+        JavaScript code string.
+    """
+    return f"litechartsAttachTooltips({chartVar}, '{containerId}', {dumps(tooltips)});"
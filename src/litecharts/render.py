@@ -2,21 +2,51 @@
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, cast
-
-from ._js import getLwcJs
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from functools import partial
+from html import escape
+from typing import TYPE_CHECKING, Any, cast
+
+from ._js import getCompressedLwcJs, getLwcJs
+from ._json import dumps
+from ._payload import (
+    PAYLOAD_JS,
+    compressText,
+    renderBinaryPayload,
+    renderColumnsPayload,
+)
+from .cache import chartIds, chartKey
+from .columnar import ColumnarData
+from .convert import roundValues
 from .plugins.draw_rectangle import (
     RECTANGLE_PRIMITIVE_JS,
     extractRectangles,
     renderRectangleJs,
 )
-from .plugins.marker_tooltips import extractMarkerTooltips, renderTooltipJs
+from .plugins.marker_tooltips import (
+    TOOLTIP_RUNTIME_JS,
+    extractMarkerTooltips,
+    renderTooltipCallJs,
+    renderTooltipJs,
+)
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from .chart import Chart
+    from .dashboard import Dashboard
     from .series import BaseSeries
-    from .types import OhlcInput, SingleValueInput, StyleOptions
+    from .types import (
+        OhlcInput,
+        RectangleOptions,
+        RenderOptions,
+        SeriesData,
+        SingleValueInput,
+        StyleOptions,
+    )
+
+# Data points encoded per chunk when streaming a rows payload
+_BLOCK_ROWS = 50_000
 
 
 def _stripTooltipFromMarkers(
@@ -33,44 +63,224 @@ def _stripTooltipFromMarkers(
     return [{k: v for k, v in marker.items() if k != "tooltip"} for marker in markers]
 
 
-def _renderSeriesJs(
-    series: BaseSeries[SingleValueInput] | BaseSeries[OhlcInput], paneVar: str
-) -> str:
-    """Generate JS code for a series.
+def _columnTokens(column: np.ndarray[Any, Any]) -> list[str | None]:
+    """Encode every value of one column as a JSON token.
+
+    Numeric columns are encoded with a single ``dumps`` call on the array.
+    Color columns repeat a handful of strings, so each distinct color is
+    encoded once; unset colors give None.
+
+    Args:
+        column: Value or color column.
+
+    Returns:
+        List of JSON tokens, one per row.
+    """
+    if column.dtype.kind != "O":
+        return dumps(column)[1:-1].split(",")  # type: ignore[return-value]
+    values = column.tolist()
+    encoded = {v: None if v is None else dumps(v) for v in set(values)}
+    return [encoded[v] for v in values]
+
+
+def _renderColumnsRows(columns: ColumnarData) -> str:
+    """Serialize columnar data as comma-separated JSON data point objects.
+
+    Produces the text of ``dumps(columns.toRecords())`` without the
+    brackets and without building a dict per data point: each column is
+    encoded in one pass and the tokens are interleaved through a per-row
+    template.
+
+    Args:
+        columns: Columnar series data.
+
+    Returns:
+        JSON objects joined by commas.
+    """
+    keys = columns.keys
+    arrays = [columns.time, *columns.fields.values()]
+    tokens = [_columnTokens(arr) for arr in arrays]
+    template = "{" + ",".join(f"{dumps(key)}:%s" for key in keys) + "}"
+    rows = [template % row for row in zip(*tokens, strict=True)]
+
+    for columnTokens in tokens:
+        if None in columnTokens:
+            # Rows with unset colors leave those keys out
+            for index, token in enumerate(columnTokens):
+                if token is None:
+                    pairs = zip(keys, (col[index] for col in tokens), strict=True)
+                    rows[index] = (
+                        "{" + ",".join(f"{dumps(k)}:{t}" for k, t in pairs if t) + "}"
+                    )
+
+    if columns.whitespace is not None:
+        for index in columns.whitespace.nonzero()[0].tolist():
+            rows[index] = f'{{"time":{tokens[0][index]}}}'
+    return ",".join(rows)
+
+
+def _iterRowsJson(data: SeriesData) -> Iterator[str]:
+    """Serialize series data as a JSON array of data points, in chunks.
+
+    Blocks of ``_BLOCK_ROWS`` points are encoded at a time, so only one
+    block's text is held in memory while streaming.
+
+    Args:
+        data: ColumnarData or list of dicts.
+
+    Yields:
+        Consecutive pieces of the JSON array.
+    """
+    yield "["
+    for start in range(0, len(data), _BLOCK_ROWS):
+        if start:
+            yield ","
+        block = slice(start, start + _BLOCK_ROWS)
+        if isinstance(data, ColumnarData):
+            yield _renderColumnsRows(data.take(block))
+        else:
+            yield dumps(data[block])[1:-1]
+    yield "]"
+
+
+def _seriesPrecision(
+    series: BaseSeries[SingleValueInput] | BaseSeries[OhlcInput],
+    renderOptions: RenderOptions,
+) -> int | None:
+    """Resolve the number of decimals to round a series' values to.
 
     Args:
         series: The series to render.
-        paneVar: The JS variable name of the parent pane.
+        renderOptions: The chart's render options.
 
     Returns:
-        JavaScript code string.
+        Number of decimals, or None to leave values as-is.
+    """
+    precision = renderOptions.get("precision")
+    if precision != "priceFormat":
+        return precision
+    priceFormat = series.options.get("priceFormat", {})
+    if priceFormat.get("type") == "custom":
+        return None
+    return priceFormat.get("precision", 2)
+
+
+def _cached(
+    series: BaseSeries[SingleValueInput] | BaseSeries[OhlcInput],
+    part: str,
+    key: Hashable,
+    render: Callable[[], Iterable[str]],
+    renderOptions: RenderOptions,
+) -> Iterable[str]:
+    """Render one part of a series through its render cache, if enabled.
+
+    Args:
+        series: The series being rendered.
+        part: Name of the series part (see ``BaseSeries._renderCached``).
+        key: Render settings the part's output depends on.
+        render: Produces the JS chunks.
+        renderOptions: The chart's render options.
+
+    Returns:
+        JS chunks.
+    """
+    if not renderOptions.get("cache", False):
+        return render()
+    return series._renderCached(part, key, render)
+
+
+def _iterSeriesJs(
+    series: BaseSeries[SingleValueInput] | BaseSeries[OhlcInput],
+    paneVar: str,
+    renderOptions: RenderOptions | None = None,
+) -> Iterator[str]:
+    """Generate JS code for a series, in chunks.
+
+    With the "cache" render option, the data payload, markers and price
+    lines are reused from the series' render cache while they and the
+    render settings are unchanged.
+
+    Args:
+        series: The series to render.
+        paneVar: The JS variable name of the parent pane.
+        renderOptions: The chart's render options.
+
+    Yields:
+        Consecutive pieces of JavaScript code.
     """
     seriesVar = series.id
     seriesType = series.seriesType
-    optionsJs = json.dumps(series.options)
-    dataJs = json.dumps(series.data)
-
-    lines = [
+    optionsJs = dumps(series.options)
+
+    renderOptions = renderOptions or {}
+    digits = _seriesPrecision(series, renderOptions)
+    payload = renderOptions.get("payload", "rows")
+    encoding = renderOptions.get("binaryEncoding", "float64")
+    minMove = series.options.get("priceFormat", {}).get("minMove", 0.01)
+    compress = bool(renderOptions.get("compress"))
+
+    def renderData() -> Iterable[str]:
+        columns = series.columns
+        data = columns if columns is not None else series.data
+        if digits is not None:
+            data = roundValues(data, digits)
+        dataJs: Iterable[str]
+        if payload == "columns":
+            dataJs = [f"litechartsZipColumns({renderColumnsPayload(data)})"]
+        elif payload == "binary":
+            dataJs = [renderBinaryPayload(data, encoding, minMove)]
+        else:
+            dataJs = _iterRowsJson(data)
+        if compress:
+            compressed = compressText("".join(dataJs))
+            dataJs = [f"await litechartsInflateValue({dumps(compressed)})"]
+        return dataJs
+
+    def renderMarkers() -> Iterator[str]:
+        for group in series.markerGroups:
+            markersForLwc = _stripTooltipFromMarkers(
+                cast(list[dict[str, object]], group.markers())
+            )
+            markersJs = dumps(markersForLwc)
+            yield (
+                "\n    "
+                f"LightweightCharts.createSeriesMarkers({seriesVar}, {markersJs});"
+            )
+
+    def renderPriceLines() -> Iterator[str]:
+        for priceLine in series.priceLines:
+            plJs = dumps(priceLine)
+            yield f"\n    {seriesVar}.createPriceLine({plJs});"
+
+    yield (
         f"const {seriesVar} = {paneVar}.addSeries("
-        f"LightweightCharts.{seriesType}Series, {optionsJs});",
-        f"{seriesVar}.setData({dataJs});",
-    ]
+        f"LightweightCharts.{seriesType}Series, {optionsJs});"
+        f"\n    {seriesVar}.setData("
+    )
+    dataKey = (digits, payload, encoding, minMove, compress)
+    yield from _cached(series, "data", dataKey, renderData, renderOptions)
+    yield ");"
+    yield from _cached(series, "markers", None, renderMarkers, renderOptions)
+    # Render price lines
+    yield from _cached(series, "priceLines", None, renderPriceLines, renderOptions)
 
-    for group in series.markerGroups:
-        markersForLwc = _stripTooltipFromMarkers(
-            cast(list[dict[str, object]], group.markers())
-        )
-        markersJs = json.dumps(markersForLwc)
-        lines.append(
-            f"LightweightCharts.createSeriesMarkers({seriesVar}, {markersJs});"
-        )
 
-    # Render price lines
-    for priceLine in series.priceLines:
-        plJs = json.dumps(priceLine)
-        lines.append(f"{seriesVar}.createPriceLine({plJs});")
+def _renderSeriesJs(
+    series: BaseSeries[SingleValueInput] | BaseSeries[OhlcInput],
+    paneVar: str,
+    renderOptions: RenderOptions | None = None,
+) -> str:
+    """Generate JS code for a series.
 
-    return "\n    ".join(lines)
+    Args:
+        series: The series to render.
+        paneVar: The JS variable name of the parent pane.
+        renderOptions: The chart's render options.
+
+    Returns:
+        JavaScript code string.
+    """
+    return "".join(_iterSeriesJs(series, paneVar, renderOptions))
 
 
 def _renderContainerHtml(chart: Chart) -> str:
@@ -90,34 +300,46 @@ def _renderContainerHtml(chart: Chart) -> str:
     return f'<div id="{containerId}" style="{style}"></div>'
 
 
-def _renderChartInitScript(chart: Chart) -> str:
-    """Generate the JavaScript initialization code for the chart.
+def _iterRectangleJs(
+    chartVar: str, seriesVar: str, rectangles: list[RectangleOptions]
+) -> Iterator[str]:
+    """Yield the JS attaching a series' rectangle primitive (see renderRectangleJs)."""
+    yield renderRectangleJs(chartVar, seriesVar, rectangles)
+
+
+def _iterChartInitScript(chart: Chart, sharedRuntime: bool = False) -> Iterator[str]:
+    """Generate the JavaScript initialization code for the chart, in chunks.
 
     Uses native LWC panes for multi-pane support. Single chart instance
     with multiple panes provides automatic time sync and unified crosshair.
 
     Args:
         chart: The chart to render.
+        sharedRuntime: Attach marker tooltips through the page's shared
+            ``TOOLTIP_RUNTIME_JS`` instead of inlining the handler.
 
-    Returns:
-        JavaScript code string (without script tags).
+    Yields:
+        Consecutive pieces of JavaScript code (without script tags).
     """
     containerId = f"container_{chart.id}"
     panes = chart.panes
     chartVar = f"chart_{chart.id}"
+    newline = "\n    "
 
     # Build chart options
     chartOptions = dict(chart.options)
     chartOptions["width"] = chart.width
     chartOptions["height"] = chart.height
-    optionsJs = json.dumps(chartOptions)
-
-    jsLines = [
-        f"const {chartVar} = LightweightCharts.createChart(",
-        f"    document.getElementById('{containerId}'),",
-        f"    {optionsJs}",
-        ");",
-    ]
+    optionsJs = dumps(chartOptions)
+
+    yield newline.join(
+        [
+            f"const {chartVar} = LightweightCharts.createChart(",
+            f"    document.getElementById('{containerId}'),",
+            f"    {optionsJs}",
+            ");",
+        ]
+    )
 
     # Process each pane
     for i, pane in enumerate(panes):
@@ -125,84 +347,180 @@ def _renderChartInitScript(chart: Chart) -> str:
 
         if i == 0:
             # First pane - get reference to auto-created pane 0
-            jsLines.append(f"const {paneVar} = {chartVar}.panes()[0];")
+            yield f"{newline}const {paneVar} = {chartVar}.panes()[0];"
         else:
             # Additional panes - create via addPane()
-            jsLines.append(f"const {paneVar} = {chartVar}.addPane();")
+            yield f"{newline}const {paneVar} = {chartVar}.addPane();"
 
         # Set stretch factor for proportional sizing
-        jsLines.append(f"{paneVar}.setStretchFactor({pane.stretchFactor});")
+        yield f"{newline}{paneVar}.setStretchFactor({pane.stretchFactor});"
 
         # Add series to this pane
         for series in pane.series:
-            jsLines.append(_renderSeriesJs(series, paneVar))
+            yield newline
+            yield from _iterSeriesJs(series, paneVar, chart.renderOptions)
 
             # Add rectangles if any (plugin)
             rectangles = extractRectangles(series)
             if rectangles:
-                jsLines.append(renderRectangleJs(chartVar, series.id, rectangles))
+                yield newline
+                yield from _cached(
+                    series,
+                    "rectangles",
+                    chartVar,
+                    partial(_iterRectangleJs, chartVar, series.id, rectangles),
+                    chart.renderOptions,
+                )
 
         # Add marker tooltips if any markers have tooltip data (plugin)
         tooltips = extractMarkerTooltips(pane)
-        if tooltips:
-            jsLines.append(renderTooltipJs(chartVar, containerId, tooltips))
+        if tooltips and sharedRuntime:
+            yield newline + renderTooltipCallJs(chartVar, containerId, tooltips)
+        elif tooltips:
+            yield newline + renderTooltipJs(chartVar, containerId, tooltips)
 
     # Fit content to timescale if requested
     if chart.shouldFitContent:
-        jsLines.append(f"{chartVar}.timeScale().fitContent();")
+        yield f"{newline}{chartVar}.timeScale().fitContent();"
 
-    return "\n    ".join(jsLines)
 
+def _renderChartInitScript(chart: Chart) -> str:
+    """Generate the JavaScript initialization code for the chart.
 
-def renderFragment(chart: Chart) -> str:
-    """Render a chart fragment for embedding in custom HTML.
+    Args:
+        chart: The chart to render.
+
+    Returns:
+        JavaScript code string (without script tags).
+    """
+    return "".join(_iterChartInitScript(chart))
+
+
+def _iterAsync(initScript: Iterable[str], ready: str | None = None) -> Iterator[str]:
+    """Run an init script inside an async function so it can await payloads.
+
+    Args:
+        initScript: Pieces of JavaScript init code.
+        ready: Optional promise to await before running the code.
+
+    Yields:
+        Consecutive pieces of JavaScript code.
+    """
+    wait = f"await {ready};\n    " if ready else ""
+    yield f"(async () => {{\n    {wait}"
+    yield from initScript
+    yield "\n    })();"
 
-    Returns container div and init script, but NOT:
-    - DOCTYPE/html/head/body wrapper
-    - LWC library (use getLwcScript() separately)
-    - Plugin scripts (use getPluginScripts() separately)
+
+def iterFragment(chart: Chart) -> Iterator[str]:
+    """Render a chart fragment as a stream of text chunks.
+
+    Series data is serialized one chunk at a time, so the whole fragment is
+    never held in memory. See ``renderFragment``.
 
     Args:
         chart: The chart to render.
 
-    Returns:
-        HTML fragment string with container and script.
+    Yields:
+        Consecutive pieces of the HTML fragment.
     """
+    return _iterCachedFragment(chart)
+
+
+def _iterCachedFragment(chart: Chart, sharedRuntime: bool = False) -> Iterator[str]:
+    """Render a chart fragment through the chart's disk cache, if it has one."""
+    diskCache = chart.renderOptions.get("diskCache")
+    if diskCache is None:
+        return _iterFragmentHtml(chart, sharedRuntime)
+    kind = "pageFragment" if sharedRuntime else "fragment"
+    return diskCache.fetch(
+        chartKey(chart, kind),
+        chartIds(chart),
+        partial(_iterFragmentHtml, chart, sharedRuntime),
+    )
+
+
+def _iterFragmentHtml(chart: Chart, sharedRuntime: bool = False) -> Iterator[str]:
+    """Render a chart fragment as a stream of text chunks, without caching."""
     containerId = f"container_{chart.id}"
     panes = chart.panes
 
     if not panes:
         style = f"width: {chart.width}px; height: {chart.height}px;"
-        return f'''<div id="{containerId}" style="{style}">
+        yield f'''<div id="{containerId}" style="{style}">
     <p>No data to display</p>
 </div>'''
+        return
 
     containerHtml = _renderContainerHtml(chart)
-    initScript = _renderChartInitScript(chart)
+    initScript = _iterChartInitScript(chart, sharedRuntime)
+    if chart.renderOptions.get("compress"):
+        initScript = _iterAsync(initScript)
 
-    return f"""{containerHtml}
-<script>
-{initScript}
-</script>"""
+    yield f"{containerHtml}\n<script>\n"
+    yield from initScript
+    yield "\n</script>"
 
 
-def renderChart(chart: Chart, style: StyleOptions | None = None) -> str:
-    """Render a chart to self-contained HTML.
+def renderFragment(chart: Chart) -> str:
+    """Render a chart fragment for embedding in custom HTML.
+
+    Returns container div and init script, but NOT:
+    - DOCTYPE/html/head/body wrapper
+    - LWC library (use getLwcScript() separately)
+    - Plugin scripts (use getPluginScripts() separately)
 
     Args:
         chart: The chart to render.
-        style: Optional HTML document styling options.
 
     Returns:
-        HTML string.
+        HTML fragment string with container and script.
+    """
+    return "".join(iterFragment(chart))
+
+
+def iterChart(
+    chart: Chart,
+    style: StyleOptions | None = None,
+    scripts: Sequence[str] | None = None,
+) -> Iterator[str]:
+    """Render a chart to self-contained HTML as a stream of text chunks.
+
+    The LWC library and each block of series data are yielded as separate
+    chunks, so writing them out never materializes the whole document.
+
+    Args:
+        chart: The chart to render.
+        style: Optional HTML document styling options.
+        scripts: URLs of the LWC library and plugin scripts (see
+            ``writeAssets``) to link with ``<script src>`` instead of
+            inlining them.
+
+    Yields:
+        Consecutive pieces of the HTML document.
     """
+    diskCache = chart.renderOptions.get("diskCache")
+    if diskCache is None:
+        return _iterChartHtml(chart, style, scripts)
+    return diskCache.fetch(
+        chartKey(chart, "html", style, scripts),
+        chartIds(chart),
+        partial(_iterChartHtml, chart, style, scripts),
+    )
+
+
+def _iterChartHtml(
+    chart: Chart,
+    style: StyleOptions | None = None,
+    scripts: Sequence[str] | None = None,
+) -> Iterator[str]:
+    """Render a chart to self-contained HTML as text chunks, without caching."""
     containerId = f"container_{chart.id}"
-    lwcJs = getLwcJs()
 
     panes = chart.panes
     if not panes:
         # No panes, no chart to render
-        return f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Chart</title>
@@ -213,20 +531,17 @@ def renderChart(chart: Chart, style: StyleOptions | None = None) -> str:
     </div>
 </body>
 </html>"""
+        return
 
     # Build container HTML
     containerHtml = _renderContainerHtml(chart)
 
     # Build chart JS
-    allChartJs = _renderChartInitScript(chart)
-
-    # Check if any series has rectangles (to include primitive class)
-    hasRectangles = any(series.rectangles for pane in panes for series in pane.series)
-    rectangleScript = (
-        f"\n    <script>{RECTANGLE_PRIMITIVE_JS}</script>" if hasRectangles else ""
-    )
+    allChartJs = _iterChartInitScript(chart)
+    renderOptions = chart.renderOptions
+    compress = bool(renderOptions.get("compress"))
 
-    return f"""<!DOCTYPE html>
+    yield f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Chart</title>
@@ -239,10 +554,134 @@ def renderChart(chart: Chart, style: StyleOptions | None = None) -> str:
     </style>
 </head>
 <body>
-    {containerHtml}
-    <script>{lwcJs}</script>{rectangleScript}
-    <script>
-    {allChartJs}
+    {containerHtml}"""
+
+    if scripts is not None:
+        # Linked library and plugins load before the init script runs
+        for url in scripts:
+            yield f'\n    <script src="{escape(url)}"></script>'
+        if compress:
+            allChartJs = _iterAsync(allChartJs)
+    else:
+        if compress:
+            # LWC is evaluated once inflated; the chart waits for it
+            lwcJs = (
+                "const litechartsLwcReady = litechartsInflate("
+                f'"{getCompressedLwcJs()}").then(code => (0, eval)(code));'
+            )
+            allChartJs = _iterAsync(allChartJs, "litechartsLwcReady")
+        else:
+            lwcJs = getLwcJs()
+
+        # Check if any series has rectangles (to include primitive class)
+        hasRectangles = any(
+            series.rectangles for pane in panes for series in pane.series
+        )
+        rectangleScript = (
+            f"\n    <script>{RECTANGLE_PRIMITIVE_JS}</script>" if hasRectangles else ""
+        )
+        payloadScript = (
+            f"\n    <script>{PAYLOAD_JS}</script>"
+            if compress or renderOptions.get("payload", "rows") != "rows"
+            else ""
+        )
+        yield f"{payloadScript}\n    <script>"
+        yield lwcJs
+        yield f"</script>{rectangleScript}"
+
+    yield "\n    <script>\n    "
+    yield from allChartJs
+    yield """
     </script>
 </body>
 </html>"""
+
+
+def renderChart(chart: Chart, style: StyleOptions | None = None) -> str:
+    """Render a chart to self-contained HTML.
+
+    Args:
+        chart: The chart to render.
+        style: Optional HTML document styling options.
+
+    Returns:
+        HTML string.
+    """
+    return "".join(iterChart(chart, style))
+
+
+def iterDashboard(
+    dashboard: Dashboard, scripts: Sequence[str] | None = None
+) -> Iterator[str]:
+    """Render a dashboard page as a stream of text chunks.
+
+    The LWC library and each plugin used by any chart are emitted once in
+    the page head; every chart is then streamed as a fragment, with marker
+    tooltips attached through one shared runtime.
+
+    Args:
+        dashboard: The dashboard to render.
+        scripts: URLs of the LWC library and plugin scripts (see
+            ``writeAssets``) to link instead of inlining them.
+
+    Yields:
+        Consecutive pieces of the HTML document.
+    """
+    charts = list(zip(dashboard.charts, dashboard.titles, strict=True))
+    style = dashboard.style
+    columns = dashboard.columns
+
+    yield f"""<!DOCTYPE html>
+<html>
+<head>
+    <title>{escape(dashboard.title)}</title>
+    <style>
+        body {{
+            margin: 0;
+            padding: {style.get("padding", 20)}px;
+            background: {style.get("background", "#1e1e1e")};
+            color: #d1d4dc;
+            font-family: sans-serif;
+        }}
+        .litecharts-grid {{
+            display: grid;
+            grid-template-columns: repeat({columns}, max-content);
+            gap: 16px;
+        }}
+        .litecharts-grid h3 {{
+            margin: 0 0 8px;
+            font-size: 14px;
+        }}
+    </style>"""
+
+    if scripts is not None:
+        for url in scripts:
+            yield f'\n    <script src="{escape(url)}"></script>'
+    else:
+        yield "\n    <script>"
+        yield getLwcJs()
+        yield "</script>"
+        plugins = []
+        panes = [pane for chart, _ in charts for pane in chart.panes]
+        if any(series.rectangles for pane in panes for series in pane.series):
+            plugins.append(RECTANGLE_PRIMITIVE_JS)
+        if any(extractMarkerTooltips(pane) for pane in panes):
+            plugins.append(TOOLTIP_RUNTIME_JS)
+        if any(
+            chart.renderOptions.get("compress")
+            or chart.renderOptions.get("payload", "rows") != "rows"
+            for chart, _ in charts
+        ):
+            plugins.append(PAYLOAD_JS)
+        if plugins:
+            yield f"\n    <script>{''.join(plugins)}</script>"
+
+    yield '\n</head>\n<body>\n<div class="litecharts-grid">'
+    for chart, title in charts:
+        yield "\n<div>"
+        if title is not None:
+            yield f"\n<h3>{escape(title)}</h3>"
+        yield "\n"
+        yield from _iterCachedFragment(chart, sharedRuntime=True)
+        yield "\n</div>"
+    yield "\n</div>\n</body>\n</html>"
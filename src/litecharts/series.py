@@ -4,9 +4,19 @@ from __future__ import annotations
 
 import uuid
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, TypeVar
-
-from .convert import toLwcOhlcData, toLwcSingleValueData
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypedDict, TypeVar, cast
+
+from .columnar import ColumnarData
+from .convert import (
+    applyColorRule,
+    applyNanPolicy,
+    convertOhlcData,
+    convertSingleValueData,
+    projectFields,
+    sanitizeData,
+    toRecords,
+)
 from .types import OhlcInput, SingleValueInput
 
 if TYPE_CHECKING:
@@ -16,18 +26,115 @@ if TYPE_CHECKING:
         BaselineSeriesOptions,
         BaseSeriesOptions,
         CandlestickSeriesOptions,
+        ColorRule,
         HistogramSeriesOptions,
         LineSeriesOptions,
         Marker,
+        NanPolicy,
         OhlcData,
         PriceLineOptions,
         RectangleOptions,
+        SeriesData,
         SingleValueData,
     )
 
 DataInputT = TypeVar("DataInputT", SingleValueInput, OhlcInput)
 
 
+class _ConvertOptions(TypedDict, total=False):
+    """Post-conversion options passed to setData."""
+
+    sanitize: bool
+    nanPolicy: NanPolicy
+    colorRule: ColorRule
+
+
+# Cache key and rendered JS chunks of one part of a series
+_CacheEntry = tuple[Hashable, tuple[str, ...]]
+
+
+def _convertOptions(
+    sanitize: bool, nanPolicy: NanPolicy, colorRule: ColorRule | None
+) -> _ConvertOptions:
+    """Validate and collect the post-conversion options of setData.
+
+    Raises:
+        ValueError: If nanPolicy is not a known policy.
+    """
+    if nanPolicy not in ("keep", "whitespace", "drop"):
+        msg = f"Unknown NaN policy: {nanPolicy!r}"
+        raise ValueError(msg)
+    options: _ConvertOptions = {"sanitize": sanitize, "nanPolicy": nanPolicy}
+    if colorRule is not None:
+        options["colorRule"] = colorRule
+    return options
+
+
+def _joinParts(parts: list[SeriesData]) -> SeriesData:
+    """Join converted chunks end to end, emptying the list.
+
+    Columnar chunks with the same fields are joined one column at a time,
+    each chunk's column being released once copied, so peak memory is
+    about the chunks plus one joined column rather than twice the data.
+    Row chunks, or chunks with differing fields, give row storage. Empty
+    chunks (e.g. the last page of a paginated source) are skipped, as they
+    convert without fields.
+
+    Args:
+        parts: Converted chunks in order; cleared on return.
+
+    Returns:
+        The joined series data.
+    """
+    if not any(len(part) for part in parts):
+        empty = parts[0] if parts else []
+        parts.clear()
+        return empty
+    parts[:] = [part for part in parts if len(part)]
+    first = parts[0]
+    if not isinstance(first, ColumnarData) or not all(
+        isinstance(part, ColumnarData) and part.keys == first.keys for part in parts
+    ):
+        rows = [point for part in parts for point in toRecords(part)]
+        parts.clear()
+        return rows
+
+    import numpy as np
+
+    columnar = cast("list[ColumnarData]", parts)
+    whitespace = None
+    if any(part.whitespace is not None for part in columnar):
+        whitespace = np.concatenate([part.whitespaceMask() for part in columnar])
+    pieces = {name: [part.fields[name] for part in columnar] for name in first.fields}
+    times = [part.time for part in columnar]
+    parts.clear()
+    time = np.concatenate(times)
+    del times
+    fields = {}
+    for name in list(pieces):
+        fields[name] = np.concatenate(pieces.pop(name))
+    return ColumnarData(time, fields, whitespace)
+
+
+def _normaliseMarkers(markers: list[Marker]) -> list[Marker]:
+    """Copy markers, converting all their times in one batch.
+
+    Args:
+        markers: List of marker dicts.
+
+    Returns:
+        New list of marker dicts with Unix timestamp times.
+    """
+    from .convert import toUnixTimestamps
+
+    normalised: list[Marker] = [marker.copy() for marker in markers]
+    timed = [m for m in normalised if "time" in m]
+    times = toUnixTimestamps([m["time"] for m in timed])
+    for m, timestamp in zip(timed, times, strict=True):
+        m["time"] = timestamp
+    return normalised
+
+
 class SeriesMarkersApi:
     """Handle for an independent marker group on a series.
 
@@ -53,15 +160,8 @@ class SeriesMarkersApi:
         Args:
             markers: New list of marker dicts (timestamps are normalised).
         """
-        from .convert import toUnixTimestamp
-
-        normalised: list[Marker] = []
-        for marker in markers:
-            m: Marker = marker.copy()
-            if "time" in m:
-                m["time"] = toUnixTimestamp(m["time"])
-            normalised.append(m)
-        self._markers = normalised
+        self._markers = _normaliseMarkers(markers)
+        self._series._invalidateRender("markers")
 
     def markers(self) -> list[Marker]:
         """Return this group's markers.
@@ -77,12 +177,17 @@ class SeriesMarkersApi:
         """
         if self in self._series._markerGroups:
             self._series._markerGroups.remove(self)
+            self._series._invalidateRender("markers")
 
 
 class BaseSeries(ABC, Generic[DataInputT]):
     """Base class for all series types."""
 
     _seriesType: str = "Line"
+    # Data point keys LWC reads for this series type, besides time
+    _dataFields: ClassVar[frozenset[str]] = frozenset(
+        {"value", "color", "customValues"}
+    )
 
     def __init__(self, options: BaseSeriesOptions | None = None) -> None:
         """Initialize the series.
@@ -92,10 +197,14 @@ class BaseSeries(ABC, Generic[DataInputT]):
         """
         self._id = f"series_{uuid.uuid4().hex[:8]}"
         self._options: BaseSeriesOptions = options.copy() if options else {}
-        self._data: list[OhlcData | SingleValueData] = []
+        self._data: SeriesData = []
+        self._pending: tuple[DataInputT, _ConvertOptions] | None = None
+        self._dataOptions: _ConvertOptions = {}
+        self._sanitizeFixes = 0
         self._markerGroups: list[SeriesMarkersApi] = []
         self._priceLines: list[PriceLineOptions] = []
         self._rectangles: list[RectangleOptions] = []
+        self._renderCache: dict[str, _CacheEntry] = {}
 
     @property
     def id(self) -> str:
@@ -114,8 +223,25 @@ class BaseSeries(ABC, Generic[DataInputT]):
 
     @property
     def data(self) -> list[OhlcData | SingleValueData]:
-        """Return the series data."""
-        return self._data
+        """Return the series data.
+
+        Columnar series (pandas/numpy input) are materialized into a new list
+        of dicts on each access; use ``setData``/``update`` to modify them.
+        """
+        return toRecords(self._materialize())
+
+    @property
+    def columns(self) -> ColumnarData | None:
+        """Return the columnar data store, or None for list-of-dict data."""
+        data = self._materialize()
+        if isinstance(data, ColumnarData):
+            return data
+        return None
+
+    @property
+    def isPending(self) -> bool:
+        """Return whether lazily set data is still waiting to be converted."""
+        return self._pending is not None
 
     @property
     def markers(self) -> list[Marker]:
@@ -176,6 +302,7 @@ class BaseSeries(ABC, Generic[DataInputT]):
             "color": color,
         }
         self._rectangles.append(rect)
+        self._invalidateRender("rectangles")
 
     def createPriceLine(self, options: PriceLineOptions) -> None:
         """Create a horizontal price line on the series.
@@ -192,38 +319,238 @@ class BaseSeries(ABC, Generic[DataInputT]):
             ... })
         """
         self._priceLines.append(options)
+        self._invalidateRender("priceLines")
 
-    def setData(self, data: DataInputT) -> None:
+    def setData(
+        self,
+        data: DataInputT,
+        *,
+        lazy: bool = False,
+        sanitize: bool = False,
+        nanPolicy: NanPolicy = "keep",
+        colorRule: ColorRule | None = None,
+    ) -> None:
         """Set the series data.
 
+        With ``lazy=True`` only a reference to ``data`` is kept, and it is
+        converted on first access to ``data``/``columns`` or at render time.
+        Conversion errors are then raised at that point. The source is read
+        when it is converted, so edits made to it in between are included.
+
+        LWC requires strictly ascending times. With ``sanitize=True`` the data
+        is stably sorted by time and duplicate timestamps are dropped (the
+        last one wins); the number of fixed points is available from
+        ``sanitizeFixes``.
+
+        NaN and infinite values are not valid JSON. ``nanPolicy`` controls
+        points containing them: "keep" passes them through unchanged,
+        "whitespace" turns them into time-only whitespace points (a gap in
+        the series) and "drop" removes them.
+
+        Per-point colors are read from color/borderColor/wickColor/lineColor
+        columns of tabular input. ``colorRule`` computes them instead by
+        comparing two input columns for every point at once (see
+        ``ColorRule``), e.g. to color volume bars by candle direction.
+
         Args:
             data: Data as list of dicts, pandas DataFrame/Series, or numpy array.
+            lazy: Defer conversion until the data is needed.
+            sanitize: Sort by time and drop duplicate timestamps.
+            nanPolicy: How to handle points with NaN/inf values.
+            colorRule: Rule setting a per-point color field.
+
+        Raises:
+            ValueError: If nanPolicy is not a known policy.
+        """
+        options = _convertOptions(sanitize, nanPolicy, colorRule)
+        if not lazy:
+            self._storeData(self._convert(data, options), options)
+            self._pending = None
+            return
+
+        self._pending = (data, options)
+
+    def setDataChunks(
+        self,
+        chunks: Iterable[DataInputT],
+        *,
+        sanitize: bool = False,
+        nanPolicy: NanPolicy = "keep",
+        colorRule: ColorRule | None = None,
+    ) -> None:
+        """Set the series data from an iterable of chunks.
+
+        Each chunk (DataFrame, array, list of dicts, ...) is converted as it
+        arrives, so only one source chunk needs to be in memory at a time;
+        generators from paginated sources work directly. Columnar chunks are
+        joined into a single columnar store at the end, one column at a
+        time, so peak memory stays close to one copy of the converted data.
+
+        Args:
+            chunks: Iterable of data chunks in time order.
+            sanitize: Sort by time and drop duplicate timestamps, e.g. where
+                pages overlap (see ``setData``).
+            nanPolicy: How to handle points with NaN/inf values (see
+                ``setData``).
+            colorRule: Rule setting a per-point color field (see ``setData``).
+
+        Raises:
+            ValueError: If nanPolicy is not a known policy (before any chunk
+                is read).
+        """
+        options = _convertOptions(sanitize, nanPolicy, colorRule)
+        parts = [self._convert(chunk, options) for chunk in chunks]
+        self._pending = None
+        self._storeData(_joinParts(parts), options)
+
+    @property
+    def sanitizeFixes(self) -> int:
+        """Return how many points the last sanitizing setData fixed.
+
+        Counts points that were out of order (earlier than the point before
+        them) plus duplicate timestamps dropped; zero when the data was
+        already strictly ascending or ``sanitize`` was not requested.
+        """
+        self._materialize()
+        return self._sanitizeFixes
+
+    def _storeData(self, data: SeriesData, options: _ConvertOptions) -> None:
+        """Apply post-conversion options and make data the series storage."""
+        self._sanitizeFixes = 0
+        data = applyNanPolicy(data, options.get("nanPolicy", "keep"))
+        if options.get("sanitize"):
+            data, self._sanitizeFixes = sanitizeData(data)
+        self._data = data
+        self._dataOptions = options
+        self._invalidateRender("data")
+
+    def _materialize(self) -> SeriesData:
+        """Convert lazily set data, if any, and return the series storage."""
+        if self._pending is not None:
+            source, options = self._pending
+            self._storeData(self._convert(source, options), options)
+            self._pending = None
+        return self._data
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the pickled state, e.g. for shipping a chart to a worker.
+
+        Columnar data pickles as its numpy buffers and lazily set sources
+        stay unconverted. The rendered JS cache is left out.
         """
-        self._data = self._convertData(data)
+        state = self.__dict__.copy()
+        state["_renderCache"] = {}
+        return state
+
+    def _dataSource(self) -> tuple[DataInputT | SeriesData, _ConvertOptions]:
+        """Return lazily set source data and options, or the stored data."""
+        if self._pending is not None:
+            return self._pending
+        return self._data, self._dataOptions
+
+    def _invalidateRender(self, part: str) -> None:
+        """Drop the cached rendered JS of one part of the series."""
+        self._renderCache.pop(part, None)
+
+    def _renderCached(
+        self, part: str, key: Hashable, render: Callable[[], Iterable[str]]
+    ) -> Iterator[str]:
+        """Yield the rendered JS of one part of the series, reusing it while unchanged.
+
+        Parts are "data", "markers", "priceLines" and "rectangles"; the
+        methods that modify a part drop it from the cache. Lists returned by
+        ``data``, ``priceLines`` etc. must not be edited in place, as that
+        bypasses the invalidation.
+
+        Args:
+            part: Name of the series part.
+            key: Render settings the output depends on; a different key
+                re-renders the part.
+            render: Produces the JS chunks on a cache miss.
+
+        Yields:
+            JS chunks, from the cache when possible.
+        """
+        self._materialize()
+        entry = self._renderCache.get(part)
+        if entry is not None and entry[0] == key:
+            yield from entry[1]
+            return
+        chunks = []
+        for chunk in render():
+            chunks.append(chunk)
+            yield chunk
+        self._renderCache[part] = (key, tuple(chunks))
+
+    def _convert(self, source: DataInputT, options: _ConvertOptions) -> SeriesData:
+        """Convert input and apply the options that need the source columns.
+
+        Keys this series type doesn't read (``_dataFields``) are dropped
+        last, so a color rule can still compare them.
+        """
+        data = self._convertData(source)
+        if "colorRule" in options:
+            data = applyColorRule(data, source, options["colorRule"])
+        return projectFields(data, self._dataFields)
 
     @abstractmethod
-    def _convertData(self, data: DataInputT) -> list[OhlcData | SingleValueData]:
+    def _convertData(self, data: DataInputT) -> SeriesData:
         """Convert data to LWC format."""
         ...
 
     def update(self, bar: OhlcData | SingleValueData) -> None:
         """Update with a single data point.
 
+        Keys this series type doesn't read are dropped, as in ``setData``,
+        and the ``nanPolicy`` of the last ``setData`` applies to the point.
+
         Args:
             bar: Single data point dict.
         """
         from .convert import toUnixTimestamp
 
-        normalized: OhlcData | SingleValueData = bar.copy()
+        normalized: OhlcData | SingleValueData = {  # type: ignore[assignment]
+            key: value
+            for key, value in bar.items()
+            if key == "time" or key in self._dataFields
+        }
         if "time" in normalized:
             normalized["time"] = toUnixTimestamp(normalized["time"])
-        self._data.append(normalized)
+
+        data = self._materialize()
+        policy = self._dataOptions.get("nanPolicy", "keep")
+        points = cast(
+            "list[OhlcData | SingleValueData]", applyNanPolicy([normalized], policy)
+        )
+        if not points:
+            return
+        normalized = points[0]
+        self._invalidateRender("data")
+        if isinstance(data, ColumnarData):
+            if data.accepts(normalized):
+                data.append(normalized)
+                return
+            # Point doesn't fit the columns - fall back to row storage
+            data = self._data = data.toRecords()
+        data.append(normalized)
 
 
 class CandlestickSeries(BaseSeries[OhlcInput]):
     """Candlestick chart series."""
 
     _seriesType = "Candlestick"
+    _dataFields = frozenset(
+        {
+            "open",
+            "high",
+            "low",
+            "close",
+            "color",
+            "borderColor",
+            "wickColor",
+            "customValues",
+        }
+    )
 
     def __init__(self, options: CandlestickSeriesOptions | None = None) -> None:
         """Initialize the candlestick series.
@@ -233,15 +560,16 @@ class CandlestickSeries(BaseSeries[OhlcInput]):
         """
         super().__init__(options)
 
-    def _convertData(self, data: OhlcInput) -> list[OhlcData | SingleValueData]:
+    def _convertData(self, data: OhlcInput) -> SeriesData:
         """Convert data to OHLC format."""
-        return toLwcOhlcData(data)
+        return convertOhlcData(data)
 
 
 class LineSeries(BaseSeries[SingleValueInput]):
     """Line chart series."""
 
     _seriesType = "Line"
+    _dataFields = frozenset({"value", "color", "customValues"})
 
     def __init__(self, options: LineSeriesOptions | None = None) -> None:
         """Initialize the line series.
@@ -251,15 +579,18 @@ class LineSeries(BaseSeries[SingleValueInput]):
         """
         super().__init__(options)
 
-    def _convertData(self, data: SingleValueInput) -> list[OhlcData | SingleValueData]:
+    def _convertData(self, data: SingleValueInput) -> SeriesData:
         """Convert data to single-value format."""
-        return toLwcSingleValueData(data)
+        return convertSingleValueData(data)
 
 
 class AreaSeries(BaseSeries[SingleValueInput]):
     """Area chart series."""
 
     _seriesType = "Area"
+    _dataFields = frozenset(
+        {"value", "lineColor", "topColor", "bottomColor", "customValues"}
+    )
 
     def __init__(self, options: AreaSeriesOptions | None = None) -> None:
         """Initialize the area series.
@@ -269,15 +600,16 @@ class AreaSeries(BaseSeries[SingleValueInput]):
         """
         super().__init__(options)
 
-    def _convertData(self, data: SingleValueInput) -> list[OhlcData | SingleValueData]:
+    def _convertData(self, data: SingleValueInput) -> SeriesData:
         """Convert data to single-value format."""
-        return toLwcSingleValueData(data)
+        return convertSingleValueData(data)
 
 
 class BarSeries(BaseSeries[OhlcInput]):
     """Bar chart series (OHLC bars)."""
 
     _seriesType = "Bar"
+    _dataFields = frozenset({"open", "high", "low", "close", "color", "customValues"})
 
     def __init__(self, options: BarSeriesOptions | None = None) -> None:
         """Initialize the bar series.
@@ -287,15 +619,16 @@ class BarSeries(BaseSeries[OhlcInput]):
         """
         super().__init__(options)
 
-    def _convertData(self, data: OhlcInput) -> list[OhlcData | SingleValueData]:
+    def _convertData(self, data: OhlcInput) -> SeriesData:
         """Convert data to OHLC format."""
-        return toLwcOhlcData(data)
+        return convertOhlcData(data)
 
 
 class HistogramSeries(BaseSeries[SingleValueInput]):
     """Histogram chart series."""
 
     _seriesType = "Histogram"
+    _dataFields = frozenset({"value", "color", "customValues"})
 
     def __init__(self, options: HistogramSeriesOptions | None = None) -> None:
         """Initialize the histogram series.
@@ -305,15 +638,27 @@ class HistogramSeries(BaseSeries[SingleValueInput]):
         """
         super().__init__(options)
 
-    def _convertData(self, data: SingleValueInput) -> list[OhlcData | SingleValueData]:
+    def _convertData(self, data: SingleValueInput) -> SeriesData:
         """Convert data to single-value format."""
-        return toLwcSingleValueData(data)
+        return convertSingleValueData(data)
 
 
 class BaselineSeries(BaseSeries[SingleValueInput]):
     """Baseline chart series."""
 
     _seriesType = "Baseline"
+    _dataFields = frozenset(
+        {
+            "value",
+            "topLineColor",
+            "topFillColor1",
+            "topFillColor2",
+            "bottomLineColor",
+            "bottomFillColor1",
+            "bottomFillColor2",
+            "customValues",
+        }
+    )
 
     def __init__(self, options: BaselineSeriesOptions | None = None) -> None:
         """Initialize the baseline series.
@@ -323,9 +668,9 @@ class BaselineSeries(BaseSeries[SingleValueInput]):
         """
         super().__init__(options)
 
-    def _convertData(self, data: SingleValueInput) -> list[OhlcData | SingleValueData]:
+    def _convertData(self, data: SingleValueInput) -> SeriesData:
         """Convert data to single-value format."""
-        return toLwcSingleValueData(data)
+        return convertSingleValueData(data)
 
 
 def createSeriesMarkers(
@@ -355,15 +700,7 @@ def createSeriesMarkers(
         >>> handle.markers()   # read back
         >>> handle.detach()    # remove this group
     """
-    from .convert import toUnixTimestamp
-
-    normalised: list[Marker] = []
-    for marker in markers:
-        m: Marker = marker.copy()
-        if "time" in m:
-            m["time"] = toUnixTimestamp(m["time"])
-        normalised.append(m)
-
-    handle = SeriesMarkersApi(series, normalised)
+    handle = SeriesMarkersApi(series, _normaliseMarkers(markers))
     series._markerGroups.append(handle)
+    series._invalidateRender("markers")
     return handle
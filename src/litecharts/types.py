@@ -9,6 +9,11 @@ from typing import TYPE_CHECKING, Any, Literal, TypeAlias, TypedDict
 if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+    from .cache import DiskCache
+    from .columnar import ColumnarData
 
 # Type alias for values in data point dictionaries (time, OHLC values, etc.)
 DataValue: TypeAlias = int | float | str | datetime
@@ -17,13 +22,31 @@ DataValue: TypeAlias = int | float | str | datetime
 SingleValueInput: TypeAlias = (
     "pd.DataFrame"
     " | pd.Series[float]"
+    " | pl.DataFrame"
+    " | pl.Series"
     " | np.ndarray[Any, Any]"
+    " | pa.Table"
+    " | pa.RecordBatch"
     " | list[Mapping[str, DataValue]]"
 )
 OhlcInput: TypeAlias = (
-    "pd.DataFrame | np.ndarray[Any, Any] | list[Mapping[str, DataValue]]"
+    "pd.DataFrame"
+    " | pl.DataFrame"
+    " | np.ndarray[Any, Any]"
+    " | pa.Table"
+    " | pa.RecordBatch"
+    " | list[Mapping[str, DataValue]]"
 )
 
+# How setData treats points with NaN/inf values
+NanPolicy: TypeAlias = Literal["keep", "whitespace", "drop"]
+
+# How the "binary" render payload stores value columns
+BinaryEncoding: TypeAlias = Literal["float64", "float32", "minMove"]
+
+# Internal series storage: columnar arrays or one dict per data point
+SeriesData: TypeAlias = "ColumnarData | list[OhlcData | SingleValueData]"
+
 
 class PriceScaleMargins(TypedDict, total=False):
     """Margins for the price scale."""
@@ -228,6 +251,41 @@ class StyleOptions(TypedDict, total=False):
     background: str
 
 
+class RenderOptions(TypedDict, total=False):
+    """Options for how series data is written into the generated HTML.
+
+    These are applied by litecharts when rendering (toHtml, toFragment,
+    save) and are not passed to LWC.
+
+    precision: Round series values before encoding, to this many decimals
+        or, with "priceFormat", to each series' priceFormat.precision (2 by
+        default, as in LWC). Series with a custom price format are left as-is.
+    payload: "rows" (default) writes one object per data point; "columns"
+        writes one array per key and rebuilds the points in the browser,
+        so key names are not repeated for every point; "binary" is like
+        "columns" but embeds value columns as base64 typed-array buffers.
+    binaryEncoding: Value column type for the "binary" payload: "float64"
+        (default, lossless), "float32", or "minMove" to store int32
+        multiples of each series' priceFormat.minMove (0.01 by default).
+    compress: Deflate each series' data (and, in standalone HTML, the LWC
+        library) and embed it as base64. The browser inflates it with the
+        native DecompressionStream before the chart is created.
+    cache: Keep each series' rendered data, markers, price lines and
+        rectangles, and reuse them until the series is modified (default
+        False). Speeds up re-rendering charts that change little between
+        renders, at the cost of holding their rendered text in memory.
+    diskCache: DiskCache storing whole rendered documents and fragments
+        by content, reused across processes (see ``DiskCache``).
+    """
+
+    precision: int | Literal["priceFormat"]
+    payload: Literal["rows", "columns", "binary"]
+    binaryEncoding: BinaryEncoding
+    compress: bool
+    cache: bool
+    diskCache: DiskCache
+
+
 class PriceLineOptions(TypedDict, total=False):
     """Options for price lines."""
 
@@ -402,6 +460,9 @@ class OhlcData(TypedDict, total=False):
     low: float
     close: float
     volume: float
+    color: str
+    borderColor: str
+    wickColor: str
 
 
 class SingleValueData(TypedDict, total=False):
@@ -410,6 +471,23 @@ class SingleValueData(TypedDict, total=False):
     time: int
     value: float
     color: str
+    lineColor: str
+
+
+class ColorRule(TypedDict, total=False):
+    """Vectorized per-point color rule for setData.
+
+    Points where ``left op right`` holds get upColor, the others downColor.
+    ``left`` and ``right`` name columns of the input (``right`` may also be
+    a number); they default to "close" and "open".
+    """
+
+    left: str
+    op: Literal[">", ">=", "<", "<=", "==", "!="]
+    right: str | float
+    upColor: str
+    downColor: str
+    field: Literal["color", "borderColor", "wickColor", "lineColor"]
 
 
 class RectangleOptions(TypedDict, total=False):
@@ -423,3 +501,10 @@ class RectangleOptions(TypedDict, total=False):
     startPrice: float
     endPrice: float
     color: str
+
+
+class SaveResult(TypedDict):
+    """Outcome of saving one chart with saveMany."""
+
+    path: str
+    error: BaseException | None
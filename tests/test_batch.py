@@ -0,0 +1,136 @@
+"""Tests for batch.py module."""
+
+from __future__ import annotations
+
+import pickle
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from litecharts import CandlestickSeries, LineSeries, createChart, saveMany
+from litecharts.batch import ChartSource
+from litecharts.chart import Chart
+
+
+def _lineChart(count: int) -> Chart:
+    """Build a line chart with count points (picklable factory)."""
+    chart = createChart()
+    chart.addSeries(LineSeries).setData(
+        [{"time": 1609459200 + i * 86400, "value": float(i)} for i in range(count)]
+    )
+    return chart
+
+
+def _failingChart() -> Chart:
+    """Factory that raises."""
+    msg = "no data for symbol"
+    raise RuntimeError(msg)
+
+
+class TestPickling:
+    """Tests for shipping charts to worker processes."""
+
+    def test_lazy_frame_round_trip(self) -> None:
+        """A chart with a lazily set DataFrame pickles and renders the same."""
+        pd = pytest.importorskip("pandas")
+        frame = pd.DataFrame(
+            {
+                "time": pd.date_range("2021-01-01", periods=5),
+                "open": 1.0,
+                "high": 2.0,
+                "low": 0.5,
+                "close": 1.5,
+            }
+        )
+        chart = createChart()
+        chart.addSeries(CandlestickSeries).setData(frame, lazy=True)
+        html = chart.toHtml()
+        assert pickle.loads(pickle.dumps(chart)).toHtml() == html
+
+    def test_render_cache_not_pickled(self) -> None:
+        """Rendered JS cached on a series is left out of the pickle."""
+        chart = _lineChart(1000)
+        before = len(pickle.dumps(chart))
+        chart.toHtml()
+        assert len(pickle.dumps(chart)) == before
+
+
+class TestSaveMany:
+    """Tests for saveMany function."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_saves_charts_and_factories(self, tmp_path: Path, workers: int) -> None:
+        """Charts and factories are saved as if by Chart.save."""
+        chart = _lineChart(3)
+        sources: dict[str, ChartSource] = {"a": chart, "b": partial(_lineChart, 4)}
+        results = saveMany(sources, tmp_path, workers=workers)
+        assert results == [
+            {"path": str(tmp_path / "a.html"), "error": None},
+            {"path": str(tmp_path / "b.html"), "error": None},
+        ]
+        assert (tmp_path / "a.html").read_text(encoding="utf-8") == chart.toHtml()
+        assert "LightweightCharts.createChart" in (tmp_path / "b.html").read_text(
+            encoding="utf-8"
+        )
+
+    def test_iterable_names(self, tmp_path: Path) -> None:
+        """Charts from a plain iterable are named by index."""
+        results = saveMany([_lineChart(1), _lineChart(2)], tmp_path, workers=1)
+        assert [Path(result["path"]).name for result in results] == [
+            "chart_0.html",
+            "chart_1.html",
+        ]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_errors_per_chart(self, tmp_path: Path, workers: int) -> None:
+        """A failing chart is reported without stopping the others."""
+        results = saveMany(
+            [_failingChart, partial(_lineChart, 2)], tmp_path, workers=workers
+        )
+        error = results[0]["error"]
+        assert isinstance(error, RuntimeError)
+        assert "no data for symbol" in str(error)
+        assert results[1]["error"] is None
+        assert (tmp_path / "chart_1.html").is_file()
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_failed_render_leaves_no_file(self, tmp_path: Path, workers: int) -> None:
+        """A chart failing mid-render doesn't leave a partial file behind."""
+        chart = createChart()
+        chart.addSeries(LineSeries).setData([{"time": [1], "value": 1.0}], lazy=True)
+        results = saveMany([chart], tmp_path, workers=workers)
+        assert isinstance(results[0]["error"], TypeError)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unpicklable_factory(self, tmp_path: Path) -> None:
+        """A factory that can't be pickled fails only its own chart."""
+        results = saveMany(
+            [lambda: _lineChart(1), partial(_lineChart, 1)], tmp_path, workers=2
+        )
+        assert results[0]["error"] is not None
+        assert results[1]["error"] is None
+
+    def test_sidecar_assets(self, tmp_path: Path) -> None:
+        """Sidecar assets are written once and linked from every page."""
+        saveMany([_lineChart(1), _lineChart(2)], tmp_path, workers=2, assets="sidecar")
+        assets = sorted(path.name for path in tmp_path.glob("*.js"))
+        assert len(assets) == 2
+        for page in ("chart_0.html", "chart_1.html"):
+            html = (tmp_path / page).read_text(encoding="utf-8")
+            for asset in assets:
+                assert f'<script src="{asset}"></script>' in html
+
+    @pytest.mark.parametrize("name", ["../escape", "a/b", "..", ""])
+    def test_rejects_non_file_names(self, tmp_path: Path, name: str) -> None:
+        """Mapping keys that aren't plain file names are rejected up front."""
+        out = tmp_path / "out"
+        with pytest.raises(ValueError, match="plain file name"):
+            saveMany({"ok": _lineChart(1), name: _lineChart(1)}, out, workers=1)
+        assert not out.exists()
+
+    def test_unknown_assets_mode(self, tmp_path: Path) -> None:
+        """An unknown assets mode is rejected before any chart is saved."""
+        with pytest.raises(ValueError, match="Unknown assets mode"):
+            saveMany([_lineChart(1)], tmp_path, assets="cdn")  # type: ignore[arg-type]
+        assert not list(tmp_path.glob("*.html"))
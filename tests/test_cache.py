@@ -0,0 +1,202 @@
+"""Tests for cache.py module."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from litecharts import DiskCache, LineSeries, cache, render
+from litecharts.cache import chartIds, chartKey
+from litecharts.chart import Chart
+
+
+def _chart(values: list[float], diskCache: DiskCache | None = None) -> Chart:
+    """Create a chart with one line series."""
+    chart = Chart()
+    series = chart.addSeries(LineSeries)
+    series.setData([{"time": i, "value": v} for i, v in enumerate(values)])
+    series.createPriceLine({"price": 1.0})
+    if diskCache is not None:
+        chart.setRenderOptions({"diskCache": diskCache})
+    return chart
+
+
+@pytest.fixture
+def diskCache(tmp_path: Path) -> DiskCache:
+    """Empty cache in a temporary directory."""
+    return DiskCache(tmp_path / "cache")
+
+
+def _forbidRender(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail if a chart is rendered instead of read from the cache."""
+
+    def fail(*args: object) -> None:
+        raise AssertionError("chart was rendered")
+
+    monkeypatch.setattr(render, "_iterChartHtml", fail)
+    monkeypatch.setattr(render, "_iterFragmentHtml", fail)
+
+
+def _touch(diskCache: DiskCache, chart: Chart, mtime: float) -> None:
+    """Set the modification time of a chart's cached fragment."""
+    path = diskCache.directory / f"{chartKey(chart, 'fragment')}.html"
+    os.utime(path, (mtime, mtime))
+
+
+class TestChartKey:
+    """Tests for chartKey function."""
+
+    def test_ignores_ids(self) -> None:
+        """Charts with the same content share a key."""
+        assert chartKey(_chart([1.0]), "html") == chartKey(_chart([1.0]), "html")
+
+    def test_covers_content(self) -> None:
+        """Data, style, output kind and render options change the key."""
+        key = chartKey(_chart([1.0]), "html")
+        assert chartKey(_chart([2.0]), "html") != key
+        assert chartKey(_chart([1.0]), "html", {"padding": 0}) != key
+        assert chartKey(_chart([1.0]), "fragment") != key
+        chart = _chart([1.0])
+        chart.setRenderOptions({"cache": False})
+        assert chartKey(chart, "html") == key
+        chart.setRenderOptions({"precision": 1})
+        assert chartKey(chart, "html") != key
+
+    def test_covers_renderer_version(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Another litecharts version or plugin script gives another key."""
+        import litecharts
+        from litecharts import _js
+
+        key = chartKey(_chart([1.0]), "html")
+        monkeypatch.setattr(litecharts, "__version__", "999.0")
+        cache._rendererDigest.cache_clear()
+        assert chartKey(_chart([1.0]), "html") != key
+        monkeypatch.undo()
+        monkeypatch.setattr(cache, "_getPluginJs", lambda: _js._getPluginJs() + ";")
+        cache._rendererDigest.cache_clear()
+        assert chartKey(_chart([1.0]), "html") != key
+        monkeypatch.undo()
+        cache._rendererDigest.cache_clear()
+        assert chartKey(_chart([1.0]), "html") == key
+
+    def test_numpy_buffers(self) -> None:
+        """Array data is hashed by value."""
+        np = pytest.importorskip("numpy")
+        keys = set()
+        for values in ([1.0, 2.0], [1.0, 2.0], [1.0, 3.0]):
+            chart = Chart()
+            data = np.column_stack((np.arange(2), np.array(values)))
+            chart.addSeries(LineSeries).setData(data, lazy=True)
+            keys.add(chartKey(chart, "html"))
+        assert len(keys) == 2
+
+    def test_lazy_dataframe_not_converted(self) -> None:
+        """Lazily set sources are hashed without converting them."""
+        pd = pytest.importorskip("pandas")
+        chart = Chart()
+        series = chart.addSeries(LineSeries)
+        frame = pd.DataFrame({"value": [1.0]}, index=pd.to_datetime(["2024-01-01"]))
+        series.setData(frame, lazy=True)
+        key = chartKey(chart, "html")
+        assert series.isPending
+        series.setData(frame.assign(value=2.0), lazy=True)
+        assert chartKey(chart, "html") != key
+
+    def test_tz_aware_frame_hashed_from_buffers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """tz-aware index and columns are hashed as epoch values, not objects."""
+        pd = pytest.importorskip("pandas")
+        hashArray = cache._hashArray
+
+        def numericOnly(digest: object, array: Any) -> None:
+            assert array.dtype.kind != "O"
+            hashArray(digest, array)
+
+        monkeypatch.setattr(cache, "_hashArray", numericOnly)
+        index = pd.date_range("2024-01-01", periods=3, tz="US/Eastern")
+        frame = pd.DataFrame({"time": index, "value": [1.0, 2.0, 3.0]}, index=index)
+        keys = set()
+        for data in (frame, frame, frame.shift(freq="1min")):
+            chart = Chart()
+            chart.addSeries(LineSeries).setData(data, lazy=True)
+            keys.add(chartKey(chart, "html"))
+        assert len(keys) == 2
+
+
+class TestDiskCache:
+    """Tests for DiskCache class."""
+
+    def test_hit_fills_in_current_ids(
+        self, diskCache: DiskCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A hit returns the stored output with the new chart's ids."""
+        first = _chart([1.0, 2.0], diskCache)
+        html = first.toHtml()
+        second = _chart([1.0, 2.0], diskCache)
+        expected = html
+        for old, new in zip(chartIds(first), chartIds(second), strict=True):
+            expected = expected.replace(old, new)
+
+        _forbidRender(monkeypatch)
+        assert second.toHtml() == expected
+
+    def test_ids_split_between_reads(
+        self, diskCache: DiskCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Ids cut off at the end of a read block are still filled in."""
+        fragment = _chart([1.0], diskCache).toFragment()
+        second = _chart([1.0], diskCache)
+        monkeypatch.setattr(cache, "_READ_SIZE", 7)
+        _forbidRender(monkeypatch)
+        result = second.toFragment()
+        assert "\0" not in result
+        assert len(result) == len(fragment)
+        assert f'id="container_{second.id}"' in result
+
+    def test_fragment_and_save(self, diskCache: DiskCache, tmp_path: Path) -> None:
+        """Fragments and saved files go through the cache too."""
+        chart = _chart([1.0], diskCache)
+        fragment = chart.toFragment()
+        chart.save(tmp_path / "chart.html")
+        assert chart.toFragment() == fragment
+        assert (tmp_path / "chart.html").read_text() == chart.toHtml()
+        assert len(list(diskCache.directory.glob("*.html"))) == 2
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """The least recently used files are removed past maxBytes."""
+        charts = [_chart([float(i)], DiskCache(tmp_path)) for i in range(3)]
+        charts[0].toFragment()
+        charts[1].toFragment()
+        size = max(path.stat().st_size for path in tmp_path.iterdir())
+        diskCache = DiskCache(tmp_path, maxBytes=size * 5 // 2)
+        for chart in charts:
+            chart.setRenderOptions({"diskCache": diskCache})
+        _touch(diskCache, charts[0], 100)
+        _touch(diskCache, charts[1], 200)
+        # A hit on the first chart makes the second one the oldest
+        charts[0].toFragment()
+        charts[2].toFragment()
+        assert chartKey(charts[0], "fragment") in diskCache
+        assert chartKey(charts[1], "fragment") not in diskCache
+        assert chartKey(charts[2], "fragment") in diskCache
+
+    def test_abandoned_render_not_stored(self, diskCache: DiskCache) -> None:
+        """Output is only stored once it was rendered completely."""
+        chart = _chart([1.0], diskCache)
+        chunks = render.iterChart(chart)
+        assert isinstance(chunks, Generator)
+        next(chunks)
+        chunks.close()
+        assert list(diskCache.directory.iterdir()) == []
+
+    def test_clear(self, diskCache: DiskCache) -> None:
+        """clear removes all stored output."""
+        chart = _chart([1.0], diskCache)
+        chart.toHtml()
+        diskCache.clear()
+        assert chartKey(chart, "html") not in diskCache
@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import io
+from pathlib import Path
+
+import pytest
+
+from litecharts import render
 from litecharts.chart import Chart, createChart
 from litecharts.pane import Pane
 from litecharts.series import (
@@ -156,6 +162,129 @@ class TestChartToHtml:
         assert "LightweightCharts.createChart" in html
 
 
+class TestChartWrite:
+    """Tests for Chart write and save methods."""
+
+    def test_write_matches_to_html(self, sample_ohlc_dicts: list[DataMapping]) -> None:
+        """Streaming produces the same document as toHtml."""
+        chart = Chart()
+        chart.addSeries(CandlestickSeries).setData(sample_ohlc_dicts)
+        fp = io.StringIO()
+        chart.write(fp, {"padding": 0})
+        assert fp.getvalue() == chart.toHtml({"padding": 0})
+
+    def test_save_streams_to_file(
+        self, sample_ohlc_dicts: list[DataMapping], tmp_path: Path
+    ) -> None:
+        """save writes the document through write."""
+        chart = Chart()
+        chart.addSeries(CandlestickSeries).setData(sample_ohlc_dicts)
+        path = tmp_path / "chart.html"
+        chart.save(path)
+        assert path.read_text(encoding="utf-8") == chart.toHtml()
+
+    def test_save_sidecar_assets(
+        self, sample_ohlc_dicts: list[DataMapping], tmp_path: Path
+    ) -> None:
+        """Sidecar mode links the library files instead of inlining them."""
+        chart = Chart()
+        chart.addSeries(CandlestickSeries).setData(sample_ohlc_dicts)
+        chart.addSeries(LineSeries).addRectangle(1, 2, 1.0, 2.0)
+        chart.save(tmp_path / "a.html", assets="sidecar")
+        chart.save(tmp_path / "b.html", assets="sidecar")
+
+        html = (tmp_path / "a.html").read_text()
+        assets = sorted(p.name for p in tmp_path.glob("*.js"))
+        assert len(assets) == 2
+        for name in assets:
+            assert f'<script src="{name}"></script>' in html
+        assert "class RectanglePrimitive" not in html
+        assert len(html) < 10000
+        assert html.index("<script src=") < html.index("createChart(")
+
+    def test_failed_save_keeps_existing_file(self, tmp_path: Path) -> None:
+        """A render error leaves the previous file intact and no temp file."""
+        path = tmp_path / "report.html"
+        path.write_text("previous report", encoding="utf-8")
+        chart = Chart()
+        chart.addSeries(LineSeries).setData([{"time": [1], "value": 1.0}], lazy=True)
+        with pytest.raises(TypeError, match="Unsupported time type"):
+            chart.save(path)
+        assert path.read_text(encoding="utf-8") == "previous report"
+        assert [p.name for p in tmp_path.iterdir()] == ["report.html"]
+
+    def test_save_unknown_assets_mode(self, tmp_path: Path) -> None:
+        """An unknown assets mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown assets mode"):
+            Chart().save(tmp_path / "a.html", assets="cdn")  # type: ignore[arg-type]
+
+    def test_series_data_written_in_blocks(
+        self, sample_ohlc_dicts: list[DataMapping], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Series data is yielded a block of points at a time."""
+        np = pytest.importorskip("numpy")
+        chart = Chart()
+        chart.addSeries(CandlestickSeries).setData(sample_ohlc_dicts)
+        line = chart.addSeries(LineSeries)
+        line.setData(np.array([[1, 1.0], [2, 2.0], [3, 3.0]]))
+        chart.setRenderOptions({"cache": False})
+        html = chart.toHtml()
+
+        monkeypatch.setattr(render, "_BLOCK_ROWS", 2)
+        chunks = list(render.iterChart(chart))
+        assert "".join(chunks) == html
+        assert '{"time":1,"value":1.0},{"time":2,"value":2.0}' in chunks
+        assert '{"time":3,"value":3.0}' in chunks
+
+
+class TestRenderOptions:
+    """Tests for Chart render options."""
+
+    def test_default_empty(self) -> None:
+        """No render options are set by default."""
+        assert Chart().renderOptions == {}
+
+    def test_set_render_options_merges(self) -> None:
+        """setRenderOptions merges into the current options."""
+        chart = Chart()
+        chart.setRenderOptions({"precision": 2})
+        chart.setRenderOptions({"precision": "priceFormat"})
+        assert chart.renderOptions == {"precision": "priceFormat"}
+
+    def test_explicit_precision(self) -> None:
+        """Values are rounded to an explicit number of decimals."""
+        chart = Chart()
+        chart.addSeries(LineSeries).setData([{"time": 1, "value": 101.23000000000001}])
+        chart.setRenderOptions({"precision": 2})
+        assert '{"time":1,"value":101.23}' in chart.toFragment()
+
+    def test_price_format_precision(self) -> None:
+        """Each series is rounded to its own priceFormat precision."""
+        chart = Chart()
+        fx = chart.addSeries(
+            LineSeries, {"priceFormat": {"type": "price", "precision": 4}}
+        )
+        fx.setData([{"time": 1, "value": 1.234567}])
+        chart.addSeries(HistogramSeries).setData([{"time": 1, "value": 9.876}])
+        custom = chart.addSeries(AreaSeries, {"priceFormat": {"type": "custom"}})
+        custom.setData([{"time": 1, "value": 0.123456}])
+        chart.setRenderOptions({"precision": "priceFormat"})
+
+        fragment = chart.toFragment()
+        assert '"value":1.2346' in fragment
+        assert '"value":9.88' in fragment
+        assert '"value":0.123456' in fragment
+
+    def test_series_data_not_modified(self) -> None:
+        """Rounding only affects the rendered payload."""
+        chart = Chart()
+        series = chart.addSeries(LineSeries)
+        series.setData([{"time": 1, "value": 1.23456}])
+        chart.setRenderOptions({"precision": 1})
+        chart.toFragment()
+        assert series.data[0].get("value") == 1.23456
+
+
 class TestCreateChart:
     """Tests for createChart factory function."""
 
@@ -0,0 +1,148 @@
+"""Tests for columnar.py module."""
+
+from __future__ import annotations
+
+import pytest
+
+from litecharts.columnar import ColumnarData
+
+np = pytest.importorskip("numpy")
+
+
+def _sample() -> ColumnarData:
+    """Build a small two-field columnar store."""
+    return ColumnarData(
+        np.array([1609459200, 1609545600]),
+        {"open": np.array([1, 2]), "close": np.array([1.5, 2.5])},
+    )
+
+
+class TestColumnarData:
+    """Tests for ColumnarData class."""
+
+    def test_dtypes(self) -> None:
+        """Time is stored as int64 and fields as float64."""
+        data = _sample()
+        assert data.time.dtype == np.int64
+        assert data.fields["open"].dtype == np.float64
+
+    def test_len_and_keys(self) -> None:
+        """Length is the number of points and keys start with time."""
+        data = _sample()
+        assert len(data) == 2
+        assert data.keys == ("time", "open", "close")
+
+    def test_to_records(self) -> None:
+        """Columns are materialized as dicts of Python scalars."""
+        records = _sample().toRecords()
+        assert records == [
+            {"time": 1609459200, "open": 1.0, "close": 1.5},
+            {"time": 1609545600, "open": 2.0, "close": 2.5},
+        ]
+        assert isinstance(records[0]["time"], int)
+
+    def test_length_mismatch_raises(self) -> None:
+        """Columns must match the time column length."""
+        with pytest.raises(ValueError, match="Column 'value' has 1 values"):
+            ColumnarData(np.array([1, 2]), {"value": np.array([1.0])})
+
+    def test_accepts_and_append(self) -> None:
+        """Points with matching keys are appended to every column."""
+        data = _sample()
+        point = {"time": 1609632000, "open": 3.0, "close": 3.5}
+        assert data.accepts(point)
+        assert not data.accepts({"time": 1609632000, "value": 1.0})
+        data.append(point)
+        assert len(data) == 3
+        assert data.toRecords()[-1] == point
+
+    def test_appends_merged_on_read(self) -> None:
+        """Buffered appends are merged in order, before and after a read."""
+        data = _sample()
+        data.append({"time": 1609632000, "open": 3.0, "close": 3.5})
+        data.append({"time": 1609718400})
+        assert len(data) == 4
+        assert data.time.tolist()[-2:] == [1609632000, 1609718400]
+        data.append({"time": 1609804800, "open": 5.0, "close": 5.5})
+        opens = data.fields["open"]
+        assert opens[2] == 3.0
+        assert np.isnan(opens[3])
+        assert opens[4] == 5.0
+        assert data.whitespaceMask().tolist() == [False, False, False, True, False]
+
+    def test_nbytes(self) -> None:
+        """nbytes counts every column buffer."""
+        assert _sample().nbytes == 3 * 2 * 8
+
+    def test_concat(self) -> None:
+        """Stores with the same keys are joined in order."""
+        joined = ColumnarData.concat([_sample(), _sample()])
+        assert len(joined) == 4
+        assert joined.keys == ("time", "open", "close")
+        assert joined.fields["close"].tolist() == [1.5, 2.5, 1.5, 2.5]
+
+    def test_concat_different_keys_raises(self) -> None:
+        """Stores with different keys can't be joined."""
+        other = ColumnarData(np.array([1]), {"value": np.array([1.0])})
+        with pytest.raises(ValueError, match="different fields"):
+            ColumnarData.concat([_sample(), other])
+
+    def test_whitespace_rows(self) -> None:
+        """Masked rows are materialized as time-only points."""
+        data = ColumnarData(
+            np.array([1, 2]),
+            {"value": np.array([1.0, np.nan])},
+            np.array([False, True]),
+        )
+        assert data.toRecords() == [{"time": 1, "value": 1.0}, {"time": 2}]
+
+    def test_empty_whitespace_mask_dropped(self) -> None:
+        """An all-False mask is not stored."""
+        data = ColumnarData(
+            np.array([1]), {"value": np.array([1.0])}, np.array([False])
+        )
+        assert data.whitespace is None
+        assert data.whitespaceMask().tolist() == [False]
+
+    def test_append_whitespace(self) -> None:
+        """Time-only points are accepted and appended as whitespace."""
+        data = _sample()
+        assert data.accepts({"time": 1609632000})
+        data.append({"time": 1609632000})
+        assert data.toRecords()[-1] == {"time": 1609632000}
+        assert data.whitespaceMask().tolist() == [False, False, True]
+
+    def test_take_and_concat_keep_whitespace(self) -> None:
+        """Row selection and joining carry the whitespace mask along."""
+        data = ColumnarData(
+            np.array([1, 2]),
+            {"value": np.array([1.0, 2.0])},
+            np.array([False, True]),
+        )
+        assert data.take(np.array([1, 0])).whitespaceMask().tolist() == [True, False]
+        joined = ColumnarData.concat([_sample().take(np.array([0])), _sample()])
+        assert joined.whitespace is None
+
+    def test_color_columns(self) -> None:
+        """Color columns stay strings and unset entries are left out."""
+        data = ColumnarData(
+            np.array([1, 2]),
+            {
+                "value": np.array([1.0, 2.0]),
+                "color": np.array(["red", np.nan], dtype=object),
+            },
+        )
+        assert data.fields["color"].dtype == object
+        assert data.toRecords() == [
+            {"time": 1, "value": 1.0, "color": "red"},
+            {"time": 2, "value": 2.0},
+        ]
+
+    def test_append_without_color(self) -> None:
+        """Points may leave out color keys when appended."""
+        data = ColumnarData(
+            np.array([1]), {"value": np.array([1.0]), "color": np.array(["red"])}
+        )
+        assert data.accepts({"time": 2, "value": 2.0})
+        data.append({"time": 2, "value": 2.0})
+        assert data.toRecords()[-1] == {"time": 2, "value": 2.0}
@@ -3,17 +3,29 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 import pytest
 
+from litecharts.columnar import ColumnarData
 from litecharts.convert import (
+    applyColorRule,
+    applyNanPolicy,
+    projectFields,
+    roundValues,
+    sanitizeData,
     toLwcOhlcData,
     toLwcSingleValueData,
+    toRecords,
     toUnixTimestamp,
+    toUnixTimestamps,
 )
 
 from .conftest import DataMapping
 
+if TYPE_CHECKING:
+    from litecharts.types import ColorRule, SeriesData
+
 
 class TestToUnixTimestamp:
     """Tests for toUnixTimestamp function."""
@@ -54,6 +66,50 @@ class TestToUnixTimestamp:
             toUnixTimestamp([1, 2, 3])  # type: ignore[arg-type]
 
 
+class TestToUnixTimestamps:
+    """Tests for toUnixTimestamps batch function."""
+
+    def test_uniform_iso_strings(self) -> None:
+        """Uniform ISO strings are parsed like toUnixTimestamp."""
+        values = ["2021-01-01T00:00:00Z", "2021-01-02T00:00:30Z"]
+        assert toUnixTimestamps(values) == [1609459200, 1609545630]
+
+    def test_date_only_strings(self) -> None:
+        """Date-only strings are parsed as UTC midnight."""
+        assert toUnixTimestamps(["2021-01-01", "2021-01-02"]) == [
+            1609459200,
+            1609545600,
+        ]
+
+    def test_fractional_seconds_floored(self) -> None:
+        """Fractional seconds are floored, including before 1970."""
+        values = ["1969-12-31T23:59:59.5", "2021-01-01T00:00:00.9"]
+        assert toUnixTimestamps(values) == [-1, 1609459200]
+        assert [toUnixTimestamp(v) for v in values] == [-1, 1609459200]
+
+    def test_mixed_layouts_fall_back(self) -> None:
+        """Strings with differing layouts or offsets are parsed one by one."""
+        values = ["2021-01-01", "2021-01-01T01:00:00+01:00", "2021-01-01T00:00Z"]
+        assert toUnixTimestamps(values) == [1609459200] * 3
+
+    def test_mixed_types(self) -> None:
+        """Non-string values are converted per value."""
+        dt = datetime(2021, 1, 1, tzinfo=timezone.utc)
+        assert (
+            toUnixTimestamps([1609459200, 1609459200.5, dt, "2021-01-01"])
+            == [1609459200] * 4
+        )
+
+    def test_invalid_string_raises(self) -> None:
+        """Invalid dates raise the same error as the scalar path."""
+        with pytest.raises(ValueError):
+            toUnixTimestamps(["2021-01-01", "2021-13-01"])
+
+    def test_empty(self) -> None:
+        """An empty batch returns an empty list."""
+        assert toUnixTimestamps([]) == []
+
+
 class TestToLwcOhlcData:
     """Tests for toLwcOhlcData function."""
 
@@ -94,3 +150,632 @@ class TestToLwcSingleValueData:
         data: list[DataMapping] = [{"time": "2021-01-01T00:00:00Z", "value": 100.0}]
         result = toLwcSingleValueData(data)
         assert result[0]["time"] == 1609459200
+
+
+class TestDataframeToOhlc:
+    """Tests for the column-wise DataFrame to OHLC conversion."""
+
+    def test_datetime_index(self) -> None:
+        """DatetimeIndex is converted to Unix seconds."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {"Open": [1, 2], "High": [3, 4], "Low": [0, 1], "Close": [2, 3]},
+            index=pd.to_datetime(["2021-01-01", "2021-01-02"]),
+        )
+        result = toLwcOhlcData(df)
+        assert result == [
+            {"time": 1609459200, "open": 1.0, "high": 3.0, "low": 0.0, "close": 2.0},
+            {"time": 1609545600, "open": 2.0, "high": 4.0, "low": 1.0, "close": 3.0},
+        ]
+
+    def test_tz_aware_index_uses_utc(self) -> None:
+        """Tz-aware indexes are converted to UTC seconds."""
+        pd = pytest.importorskip("pandas")
+        index = pd.DatetimeIndex(["2021-01-01 01:00"]).tz_localize("Europe/Paris")
+        df = pd.DataFrame({"close": [1.0]}, index=index)
+        assert toLwcOhlcData(df)[0]["time"] == 1609459200
+
+    def test_sub_second_times_floored(self) -> None:
+        """Sub-second datetimes are floored like toUnixTimestamp."""
+        pd = pytest.importorskip("pandas")
+        index = pd.to_datetime(["1969-12-31 23:59:59.5", "2021-01-01 00:00:00.9"])
+        df = pd.DataFrame({"close": [1.0, 2.0]}, index=index)
+        times = [point["time"] for point in toLwcOhlcData(df)]
+        assert times == [-1, 1609459200]
+
+    def test_time_column_with_volume(self) -> None:
+        """A time column is used when present and volume is carried over."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {
+                "time": [1609459200.7, 1609545600.2],
+                "open": [1, 2],
+                "high": [3, 4],
+                "low": [0, 1],
+                "close": [2, 3],
+                "volume": [10, 20],
+            }
+        )
+        result = toLwcOhlcData(df)
+        assert result[0]["time"] == 1609459200
+        assert result[1].get("volume") == 20.0
+        assert isinstance(result[1]["time"], int)
+
+    def test_color_columns(self) -> None:
+        """Color columns are matched case-insensitively and unset ones omitted."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {
+                "time": [1, 2],
+                "close": [1.0, 2.0],
+                "Color": ["red", None],
+                "wickcolor": [float("nan"), "rgba(0, 0, 0, 0.5)"],
+            }
+        )
+        assert toLwcOhlcData(df) == [
+            {"time": 1, "close": 1.0, "color": "red"},
+            {"time": 2, "close": 2.0, "wickColor": "rgba(0, 0, 0, 0.5)"},
+        ]
+
+    def test_string_time_column(self) -> None:
+        """Non-numeric time columns fall back to per-value parsing."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"time": ["2021-01-01T00:00:00Z"], "close": [1.0]})
+        assert toLwcOhlcData(df)[0]["time"] == 1609459200
+
+    def test_missing_time_raises(self) -> None:
+        """A DataFrame without time column or datetime index is rejected."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"close": [1.0]})
+        with pytest.raises(ValueError, match="'time' column or datetime index"):
+            toLwcOhlcData(df)
+
+
+class TestDataframeToSingleValue:
+    """Tests for the column-wise pandas single-value conversion."""
+
+    def test_color_column_not_taken_as_value(self) -> None:
+        """A color column is carried over, not mistaken for the value."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"time": [1], "volume": [5.0], "color": ["red"]})
+        assert toLwcSingleValueData(df) == [{"time": 1, "value": 5.0, "color": "red"}]
+
+    def test_series_datetime_index(self) -> None:
+        """Series with a DatetimeIndex converts index and values."""
+        pd = pytest.importorskip("pandas")
+        s = pd.Series([1, 2.5], index=pd.to_datetime(["2021-01-01", "2021-01-02"]))
+        assert toLwcSingleValueData(s) == [
+            {"time": 1609459200, "value": 1.0},
+            {"time": 1609545600, "value": 2.5},
+        ]
+
+    def test_series_integer_index(self) -> None:
+        """Series with an integer index uses it as Unix timestamps."""
+        pd = pytest.importorskip("pandas")
+        s = pd.Series([1.0, 2.0], index=[1609459200, 1609545600])
+        result = toLwcSingleValueData(s)
+        assert [point["time"] for point in result] == [1609459200, 1609545600]
+        assert isinstance(result[0]["time"], int)
+
+    def test_single_column_dataframe(self) -> None:
+        """A single-column DataFrame uses that column as value."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {"sma": [1.0, 2.0]}, index=pd.to_datetime(["2021-01-01", "2021-01-02"])
+        )
+        result = toLwcSingleValueData(df)
+        assert result[1] == {"time": 1609545600, "value": 2.0}
+
+    def test_single_column_dataframe_integer_index(self) -> None:
+        """A single-column DataFrame may use an integer index as time."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"Value": [3.0]}, index=[1609459200])
+        assert toLwcSingleValueData(df) == [{"time": 1609459200, "value": 3.0}]
+
+    def test_time_and_value_columns(self) -> None:
+        """Time and value columns are matched case-insensitively."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"Time": [1609459200], "VALUE": [4.0], "other": [0]})
+        assert toLwcSingleValueData(df) == [{"time": 1609459200, "value": 4.0}]
+
+    def test_ambiguous_value_column_raises(self) -> None:
+        """Several candidate value columns are rejected."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"a": [1.0], "b": [2.0]}, index=pd.to_datetime(["2021"]))
+        with pytest.raises(ValueError, match="Cannot determine value column"):
+            toLwcSingleValueData(df)
+
+
+class TestNumpyConversion:
+    """Tests for column-wise numpy array conversion."""
+
+    def test_ohlc_array(self) -> None:
+        """A (n, 5) float array is converted to OHLC points."""
+        np = pytest.importorskip("numpy")
+        arr = np.array([[1609459200.5, 1, 3, 0, 2]])
+        assert toLwcOhlcData(arr) == [
+            {"time": 1609459200, "open": 1.0, "high": 3.0, "low": 0.0, "close": 2.0}
+        ]
+
+    def test_ohlcv_array(self) -> None:
+        """A sixth column is read as volume."""
+        np = pytest.importorskip("numpy")
+        arr = np.array([[1609459200, 1, 3, 0, 2, 50]])
+        assert toLwcOhlcData(arr)[0].get("volume") == 50.0
+
+    def test_single_value_array(self) -> None:
+        """A (n, 2) array is converted to single-value points."""
+        np = pytest.importorskip("numpy")
+        arr = np.array([[1609459200, 1.5]])
+        assert toLwcSingleValueData(arr) == [{"time": 1609459200, "value": 1.5}]
+
+    def test_empty_array(self) -> None:
+        """An empty array converts to no points, as before columnar storage."""
+        np = pytest.importorskip("numpy")
+        assert toLwcOhlcData(np.array([])) == []
+        assert toLwcSingleValueData(np.empty((0, 2))) == []
+
+    def test_nan_time_raises(self) -> None:
+        """NaN times are rejected instead of cast to a bogus timestamp."""
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="must not contain nulls"):
+            toLwcSingleValueData(np.array([[np.nan, 1.0], [1609459200, 2.0]]))
+
+    def test_nat_index_raises(self) -> None:
+        """NaT in a DatetimeIndex is rejected, naive or tz-aware."""
+        pd = pytest.importorskip("pandas")
+        index = pd.DatetimeIndex(["2024-01-01", None])
+        for times in (index, index.tz_localize("UTC")):
+            with pytest.raises(ValueError, match="must not contain nulls"):
+                toLwcSingleValueData(pd.Series([1.0, 2.0], index=times))
+
+    def test_unexpected_width_raises(self) -> None:
+        """Arrays with an unsupported column count are rejected."""
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="Unexpected array row length: 3"):
+            toLwcOhlcData(np.zeros((2, 3)))
+
+    def test_structured_array_with_datetime64(self) -> None:
+        """Structured arrays are read by field name, including datetime64 time."""
+        np = pytest.importorskip("numpy")
+        arr = np.array(
+            [("2021-01-01T00:00:00.750", 1.0, 3.0, 0.0, 2.0, 10)],
+            dtype=[
+                ("Time", "datetime64[ms]"),
+                ("open", "f8"),
+                ("high", "f8"),
+                ("low", "f8"),
+                ("close", "f4"),
+                ("volume", "i8"),
+            ],
+        )
+        assert toLwcOhlcData(arr) == [
+            {
+                "time": 1609459200,
+                "open": 1.0,
+                "high": 3.0,
+                "low": 0.0,
+                "close": 2.0,
+                "volume": 10.0,
+            }
+        ]
+
+    def test_record_array_from_separate_columns(self) -> None:
+        """A datetime64 column combined with values via np.rec.fromarrays."""
+        np = pytest.importorskip("numpy")
+        times = np.array(["2021-01-01", "2021-01-02"], dtype="datetime64[D]")
+        arr = np.rec.fromarrays([times, [1.0, 2.0]], names="time,value")
+        assert toLwcSingleValueData(arr) == [
+            {"time": 1609459200, "value": 1.0},
+            {"time": 1609545600, "value": 2.0},
+        ]
+
+    def test_object_array_with_datetime64_time(self) -> None:
+        """datetime64 values in an object column are converted in one cast."""
+        np = pytest.importorskip("numpy")
+        times = np.array(["2021-01-01"], dtype="datetime64[s]")
+        arr = np.empty((1, 2), dtype=object)
+        arr[:, 0] = list(times)
+        arr[:, 1] = [1.0]
+        assert toLwcSingleValueData(arr) == [{"time": 1609459200, "value": 1.0}]
+
+    def test_structured_array_without_time_raises(self) -> None:
+        """Structured arrays must carry a time field."""
+        np = pytest.importorskip("numpy")
+        arr = np.zeros(1, dtype=[("value", "f8")])
+        with pytest.raises(ValueError, match="'time' field"):
+            toLwcSingleValueData(arr)
+
+
+class TestArrowConversion:
+    """Tests for pyarrow Table/RecordBatch conversion."""
+
+    def test_table_ohlc_timestamp_ms(self) -> None:
+        """Millisecond timestamps are floored to seconds."""
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table(
+            {
+                "Time": pa.array([1609459200500, -500], type=pa.timestamp("ms")),
+                "open": [1.0, 2.0],
+                "high": [3.0, 4.0],
+                "low": [0.0, 1.0],
+                "close": [2, 3],
+                "volume": [10.0, None],
+            }
+        )
+        result = toLwcOhlcData(table)
+        assert [point["time"] for point in result] == [1609459200, -1]
+        assert result[0] == {
+            "time": 1609459200,
+            "open": 1.0,
+            "high": 3.0,
+            "low": 0.0,
+            "close": 2.0,
+            "volume": 10.0,
+        }
+        assert str(result[1].get("volume")) == "nan"
+
+    def test_tz_aware_timestamps(self) -> None:
+        """Tz-aware timestamps are already UTC instants."""
+        pa = pytest.importorskip("pyarrow")
+        times = pa.array([1609459200], type=pa.timestamp("s", tz="Europe/Paris"))
+        table = pa.table({"time": times, "value": [1.0]})
+        assert toLwcSingleValueData(table) == [{"time": 1609459200, "value": 1.0}]
+
+    def test_record_batch_single_value(self) -> None:
+        """A RecordBatch with one non-time column uses it as value."""
+        pa = pytest.importorskip("pyarrow")
+        batch = pa.record_batch(
+            {"time": pa.array([1609459200], pa.int64()), "sma": [1.5]}
+        )
+        assert toLwcSingleValueData(batch) == [{"time": 1609459200, "value": 1.5}]
+
+    def test_chunked_columns(self) -> None:
+        """Multi-chunk columns are joined into one array."""
+        pa = pytest.importorskip("pyarrow")
+        table = pa.concat_tables(
+            [
+                pa.table({"time": ["2021-01-01"], "value": [1.0]}),
+                pa.table({"time": ["2021-01-02"], "value": [2.0]}),
+            ]
+        )
+        assert table.column("value").num_chunks == 2
+        assert toLwcSingleValueData(table) == [
+            {"time": 1609459200, "value": 1.0},
+            {"time": 1609545600, "value": 2.0},
+        ]
+
+    def test_date_column(self) -> None:
+        """date32 columns are converted to UTC midnight."""
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({"time": pa.array([18628], pa.date32()), "value": [1.0]})
+        assert toLwcSingleValueData(table)[0]["time"] == 1609459200
+
+    def test_missing_time_raises(self) -> None:
+        """Arrow tables need a time column."""
+        pa = pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError, match="must have a 'time' column"):
+            toLwcSingleValueData(pa.table({"value": [1.0]}))
+
+    def test_null_time_raises(self) -> None:
+        """Null times are rejected."""
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({"time": pa.array([None], pa.int64()), "value": [1.0]})
+        with pytest.raises(ValueError, match="must not contain nulls"):
+            toLwcSingleValueData(table)
+
+    def test_numeric_columns_zero_copy(self) -> None:
+        """Single-chunk float64 columns are stored without copying."""
+        pa = pytest.importorskip("pyarrow")
+        from litecharts.convert import convertSingleValueData
+
+        table = pa.table({"time": pa.array([1609459200], pa.int64()), "value": [1.0]})
+        columns = convertSingleValueData(table)
+        assert not isinstance(columns, list)
+        assert not columns.fields["value"].flags.owndata
+
+
+class TestPolarsConversion:
+    """Tests for polars DataFrame/Series conversion."""
+
+    def test_dataframe_ohlc(self) -> None:
+        """Datetime columns are floored to seconds; names match any case."""
+        pl = pytest.importorskip("polars")
+        df = pl.DataFrame(
+            {
+                "Time": pl.Series([1609459200500, -500], dtype=pl.Datetime("ms")),
+                "Open": [1.0, 2.0],
+                "High": [3.0, 4.0],
+                "Low": [0.0, 1.0],
+                "Close": [2, 3],
+            }
+        )
+        assert toLwcOhlcData(df) == [
+            {"time": 1609459200, "open": 1.0, "high": 3.0, "low": 0.0, "close": 2.0},
+            {"time": -1, "open": 2.0, "high": 4.0, "low": 1.0, "close": 3.0},
+        ]
+
+    def test_dataframe_single_value_date(self) -> None:
+        """Date columns and a single value column are supported."""
+        pl = pytest.importorskip("polars")
+        df = pl.DataFrame({"time": pl.Series([18628], dtype=pl.Date), "rsi": [55.5]})
+        assert toLwcSingleValueData(df) == [{"time": 1609459200, "value": 55.5}]
+
+    def test_integer_and_string_times(self) -> None:
+        """Integer and ISO string time columns are converted."""
+        pl = pytest.importorskip("polars")
+        ints = pl.DataFrame({"time": [1609459200], "value": [1.0]})
+        strings = pl.DataFrame({"time": ["2021-01-01T00:00:00Z"], "value": [1.0]})
+        assert toLwcSingleValueData(ints) == toLwcSingleValueData(strings)
+
+    def test_struct_series(self) -> None:
+        """A Series of structs is unnested into columns."""
+        pl = pytest.importorskip("polars")
+        series = pl.Series([{"time": 1609459200, "value": 2.0}])
+        assert toLwcSingleValueData(series) == [{"time": 1609459200, "value": 2.0}]
+
+    def test_plain_series_raises(self) -> None:
+        """A plain Series has no time axis."""
+        pl = pytest.importorskip("polars")
+        with pytest.raises(ValueError, match="no time axis"):
+            toLwcSingleValueData(pl.Series([1.0, 2.0]))
+
+    def test_missing_time_raises(self) -> None:
+        """Polars frames need a time column."""
+        pl = pytest.importorskip("polars")
+        with pytest.raises(ValueError, match="must have a 'time' column"):
+            toLwcOhlcData(pl.DataFrame({"close": [1.0]}))
+
+
+class TestSanitizeData:
+    """Tests for sanitizeData function."""
+
+    def test_sorted_rows_untouched(self) -> None:
+        """Strictly ascending rows are returned as-is."""
+        data = toLwcSingleValueData(
+            [{"time": 1, "value": 1.0}, {"time": 2, "value": 2.0}]
+        )
+        assert sanitizeData(data) == (data, 0)
+
+    def test_rows_sorted_and_deduplicated(self) -> None:
+        """Rows are stably sorted and the last duplicate wins."""
+        data = toLwcSingleValueData(
+            [
+                {"time": 3, "value": 3.0},
+                {"time": 1, "value": 1.0},
+                {"time": 3, "value": 4.0},
+                {"time": 2, "value": 2.0},
+            ]
+        )
+        fixed, fixes = sanitizeData(data)
+        assert fixed == [
+            {"time": 1, "value": 1.0},
+            {"time": 2, "value": 2.0},
+            {"time": 3, "value": 4.0},
+        ]
+        assert fixes == 3
+
+    def test_columns_sorted_and_deduplicated(self) -> None:
+        """Columnar data gets the same treatment as rows."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(
+            np.array([3, 1, 3, 2]), {"value": np.array([3.0, 1.0, 4.0, 2.0])}
+        )
+        fixed, fixes = sanitizeData(data)
+        assert isinstance(fixed, ColumnarData)
+        assert fixed.time.tolist() == [1, 2, 3]
+        assert fixed.fields["value"].tolist() == [1.0, 2.0, 4.0]
+        assert fixes == 3
+
+    def test_single_misplaced_point_counts_once(self) -> None:
+        """One point out of place is one fix, however far it moves."""
+        np = pytest.importorskip("numpy")
+        times = np.array([10, *range(10)])
+        data = ColumnarData(times, {"value": np.ones(11)})
+        assert sanitizeData(data)[1] == 1
+        assert sanitizeData(data.toRecords())[1] == 1
+
+    def test_sorted_columns_fast_path(self) -> None:
+        """Strictly ascending columns are returned without copying."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(np.array([1, 2]), {"value": np.array([1.0, 2.0])})
+        fixed, fixes = sanitizeData(data)
+        assert fixed is data
+        assert fixes == 0
+
+
+class TestApplyNanPolicy:
+    """Tests for applyNanPolicy function."""
+
+    def test_keep_returns_data(self) -> None:
+        """The keep policy leaves data untouched."""
+        data = toLwcSingleValueData([{"time": 1, "value": float("nan")}])
+        assert applyNanPolicy(data, "keep") is data
+
+    def test_rows_whitespace(self) -> None:
+        """Non-finite rows become time-only whitespace points."""
+        data = toLwcSingleValueData(
+            [
+                {"time": 1, "value": 1.0},
+                {"time": 2, "value": float("nan")},
+                {"time": 3, "value": float("inf")},
+            ]
+        )
+        assert applyNanPolicy(data, "whitespace") == [
+            {"time": 1, "value": 1.0},
+            {"time": 2},
+            {"time": 3},
+        ]
+
+    def test_rows_drop(self) -> None:
+        """Non-finite rows are removed by the drop policy."""
+        data = toLwcSingleValueData(
+            [{"time": 1, "value": 1.0}, {"time": 2, "value": float("nan")}]
+        )
+        assert applyNanPolicy(data, "drop") == [{"time": 1, "value": 1.0}]
+
+    def test_rows_drop_numpy_scalar(self) -> None:
+        """numpy float scalars in rows are checked too."""
+        np = pytest.importorskip("numpy")
+        data: SeriesData = [
+            {"time": 1, "value": 1.0},
+            {"time": 2, "value": np.float32("nan")},
+        ]
+        assert applyNanPolicy(data, "drop") == [{"time": 1, "value": 1.0}]
+
+    def test_columns_whitespace(self) -> None:
+        """A NaN in any column marks the whole row as whitespace."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(
+            np.array([1, 2, 3]),
+            {
+                "open": np.array([1.0, np.nan, 3.0]),
+                "close": np.array([1.0, 2.0, -np.inf]),
+            },
+        )
+        result = applyNanPolicy(data, "whitespace")
+        assert isinstance(result, ColumnarData)
+        assert result.toRecords() == [
+            {"time": 1, "open": 1.0, "close": 1.0},
+            {"time": 2},
+            {"time": 3},
+        ]
+
+    def test_columns_drop(self) -> None:
+        """Non-finite rows are filtered out of every column."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(np.array([1, 2]), {"value": np.array([np.nan, 2.0])})
+        result = applyNanPolicy(data, "drop")
+        assert isinstance(result, ColumnarData)
+        assert result.time.tolist() == [2]
+        assert result.fields["value"].tolist() == [2.0]
+
+    def test_finite_columns_untouched(self) -> None:
+        """Columns without NaN/inf are returned as-is."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(np.array([1]), {"value": np.array([1.0])})
+        assert applyNanPolicy(data, "drop") is data
+
+    def test_unknown_policy_raises(self) -> None:
+        """Unknown policies are rejected."""
+        with pytest.raises(ValueError, match="Unknown NaN policy"):
+            applyNanPolicy([], "zero")  # type: ignore[arg-type]
+
+
+class TestApplyColorRule:
+    """Tests for applyColorRule function."""
+
+    def test_columns_default_rule(self) -> None:
+        """By default close >= open picks upColor."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(
+            np.array([1, 2]),
+            {"open": np.array([1.0, 2.0]), "close": np.array([1.0, 1.5])},
+        )
+        result = applyColorRule(data, None, {"upColor": "green", "downColor": "red"})
+        assert isinstance(result, ColumnarData)
+        assert result.fields["color"].tolist() == ["green", "red"]
+
+    def test_operands_from_source(self) -> None:
+        """Columns the series doesn't keep are read from the source frame."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {"time": [1, 2], "Open": [1, 2], "Close": [2, 1], "value": [10, 20]}
+        )
+        result = toRecords(
+            applyColorRule(
+                toLwcSingleValueData(df),
+                df,
+                {"upColor": "green", "downColor": "red", "field": "lineColor"},
+            )
+        )
+        assert [point.get("lineColor") for point in result] == ["green", "red"]
+
+    def test_rows_with_number_operand(self) -> None:
+        """Rows are colored too, and right may be a constant."""
+        data = toLwcSingleValueData(
+            [{"time": 1, "value": -1.0}, {"time": 2, "value": 1.0}]
+        )
+        rule: ColorRule = {
+            "left": "value",
+            "op": "<",
+            "right": 0,
+            "upColor": "red",
+            "downColor": "green",
+        }
+        result = toRecords(applyColorRule(data, data, rule))
+        assert [point.get("color") for point in result] == ["red", "green"]
+
+    def test_numpy_source_by_position(self) -> None:
+        """Plain 2-D arrays are read with the OHLC column layout."""
+        np = pytest.importorskip("numpy")
+        arr = np.array([[1, 1.0, 2.0, 0.0, 0.5, 9.0]])
+        rule: ColorRule = {
+            "left": "volume",
+            "right": 5,
+            "upColor": "a",
+            "downColor": "b",
+        }
+        result = toRecords(applyColorRule(toLwcOhlcData(arr), arr, rule))
+        assert result[0].get("color") == "a"
+
+    def test_unknown_column_raises(self) -> None:
+        """Naming a column that doesn't exist is an error."""
+        data = toLwcSingleValueData([{"time": 1, "value": 1.0}])
+        with pytest.raises(ValueError, match="'close' not found"):
+            applyColorRule(data, data, {"upColor": "a", "downColor": "b"})
+
+    def test_incomplete_rule_raises(self) -> None:
+        """Both colors are required."""
+        with pytest.raises(ValueError, match="upColor"):
+            applyColorRule([], [], {"upColor": "a"})
+
+
+class TestProjectFields:
+    """Tests for projectFields function."""
+
+    def test_rows_keep_time_and_fields(self) -> None:
+        """Keys outside the whitelist are dropped from every row."""
+        data = toLwcOhlcData([{"time": 1, "close": 1.0, "volume": 5.0, "note": "x"}])
+        assert projectFields(data, {"close"}) == [{"time": 1, "close": 1.0}]
+
+    def test_rows_untouched_when_nothing_dropped(self) -> None:
+        """Rows that already fit are returned as-is."""
+        data = toLwcSingleValueData([{"time": 1, "value": 1.0}, {"time": 2}])
+        assert projectFields(data, {"value"}) is data
+
+    def test_columns_dropped(self) -> None:
+        """Columns outside the whitelist are dropped without copying the rest."""
+        np = pytest.importorskip("numpy")
+        close = np.array([1.0])
+        data = ColumnarData(np.array([1]), {"close": close, "volume": np.array([5.0])})
+        result = projectFields(data, {"close"})
+        assert isinstance(result, ColumnarData)
+        assert result.keys == ("time", "close")
+        assert result.fields["close"] is close
+
+
+class TestRoundValues:
+    """Tests for roundValues function."""
+
+    def test_rows(self) -> None:
+        """Float values are rounded, time and colors are kept."""
+        data = toLwcSingleValueData(
+            [{"time": 1, "value": 101.23000000000001, "color": "red"}]
+        )
+        assert roundValues(data, 2) == [{"time": 1, "value": 101.23, "color": "red"}]
+
+    def test_columns(self) -> None:
+        """Value columns are rounded in one vectorized step."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(
+            np.array([1, 2]),
+            {
+                "value": np.array([0.1 + 0.2, np.nan]),
+                "color": np.array(["red", "blue"]),
+            },
+        )
+        result = roundValues(data, 3)
+        assert isinstance(result, ColumnarData)
+        assert result.toRecords()[0] == {"time": 1, "value": 0.3, "color": "red"}
+        assert data.fields["value"][0] == 0.1 + 0.2
@@ -0,0 +1,156 @@
+"""Tests for dashboard.py module."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from litecharts import (
+    CandlestickSeries,
+    Dashboard,
+    LineSeries,
+    createChart,
+    createSeriesMarkers,
+)
+from litecharts._js import getLwcJs
+from litecharts._payload import PAYLOAD_JS
+from litecharts.chart import Chart
+from litecharts.plugins import RECTANGLE_PRIMITIVE_JS, TOOLTIP_RUNTIME_JS
+
+from .conftest import DataMapping
+
+
+def _tooltipChart(data: list[DataMapping]) -> Chart:
+    """Create a candlestick chart with one tooltip marker."""
+    chart = createChart()
+    series = chart.addSeries(CandlestickSeries)
+    series.setData(data)
+    createSeriesMarkers(
+        series,
+        [
+            {
+                "id": "signal-1",
+                "time": 1609459200,
+                "position": "aboveBar",
+                "shape": "arrowDown",
+                "color": "#f44336",
+                "tooltip": {"title": "Signal", "fields": {"Action": "Buy"}},
+            }
+        ],
+    )
+    return chart
+
+
+class TestDashboard:
+    """Tests for the Dashboard page builder."""
+
+    def test_add_chart(self) -> None:
+        """addChart keeps charts and titles in page order."""
+        dashboard = Dashboard("Page", columns=2)
+        first = dashboard.addChart(createChart(), title="First")
+        second = dashboard.addChart(createChart())
+        assert dashboard.charts == [first, second]
+        assert dashboard.titles == ["First", None]
+        assert dashboard.columns == 2
+        assert dashboard.title == "Page"
+
+    def test_lwc_emitted_once(self, sample_ohlc_dicts: list[DataMapping]) -> None:
+        """The library is inlined once however many charts there are."""
+        dashboard = Dashboard()
+        for _ in range(3):
+            chart = createChart()
+            chart.addSeries(CandlestickSeries).setData(sample_ohlc_dicts)
+            dashboard.addChart(chart)
+        html = dashboard.toHtml()
+        assert html.count(getLwcJs()) == 1
+        for chart in dashboard.charts:
+            assert f'id="container_{chart.id}"' in html
+
+    def test_tooltip_runtime_shared(self, sample_ohlc_dicts: list[DataMapping]) -> None:
+        """Tooltip panes call one shared runtime instead of inlining handlers."""
+        dashboard = Dashboard()
+        dashboard.addChart(_tooltipChart(sample_ohlc_dicts))
+        dashboard.addChart(_tooltipChart(sample_ohlc_dicts))
+        html = dashboard.toHtml()
+        assert html.count(TOOLTIP_RUNTIME_JS) == 1
+        assert html.count("litechartsAttachTooltips(") == 3
+        assert "markerTooltips_" not in html
+
+    def test_plugins_only_when_used(self, sample_ohlc_dicts: list[DataMapping]) -> None:
+        """Plugin code is only included for features some chart uses."""
+        chart = createChart()
+        chart.addSeries(LineSeries).setData([{"time": 1, "value": 1.0}])
+        dashboard = Dashboard()
+        dashboard.addChart(chart)
+        html = dashboard.toHtml()
+        assert RECTANGLE_PRIMITIVE_JS not in html
+        assert TOOLTIP_RUNTIME_JS not in html
+        assert PAYLOAD_JS not in html
+
+        rectangles = createChart()
+        rectangles.addSeries(LineSeries).addRectangle(1, 2, 1.0, 2.0)
+        columns = createChart()
+        columns.addSeries(CandlestickSeries).setData(sample_ohlc_dicts)
+        columns.setRenderOptions({"payload": "columns"})
+        dashboard.addChart(rectangles)
+        dashboard.addChart(columns)
+        html = dashboard.toHtml()
+        assert html.count(RECTANGLE_PRIMITIVE_JS) == 1
+        assert html.count(PAYLOAD_JS) == 1
+
+    def test_titles_escaped(self) -> None:
+        """Page and chart titles are HTML-escaped."""
+        dashboard = Dashboard("<Page>")
+        dashboard.addChart(createChart(), title="A & B")
+        html = dashboard.toHtml()
+        assert "<title>&lt;Page&gt;</title>" in html
+        assert "<h3>A &amp; B</h3>" in html
+
+    def test_style(self) -> None:
+        """Style options are applied to the page body."""
+        dashboard = Dashboard(style={"padding": 4, "background": "#000"})
+        html = dashboard.toHtml()
+        assert "padding: 4px;" in html
+        assert "background: #000;" in html
+
+    def test_write_matches_to_html(self, sample_ohlc_dicts: list[DataMapping]) -> None:
+        """write() streams the same document toHtml() returns."""
+        dashboard = Dashboard()
+        dashboard.addChart(_tooltipChart(sample_ohlc_dicts), title="BTC")
+        fp = io.StringIO()
+        dashboard.write(fp)
+        assert fp.getvalue() == dashboard.toHtml()
+
+    def test_save_sidecar(
+        self, tmp_path: Path, sample_ohlc_dicts: list[DataMapping]
+    ) -> None:
+        """Sidecar mode links the shared assets next to the page."""
+        dashboard = Dashboard()
+        dashboard.addChart(_tooltipChart(sample_ohlc_dicts))
+        path = tmp_path / "dashboard.html"
+        dashboard.save(path, assets="sidecar")
+        html = path.read_text(encoding="utf-8")
+        assert getLwcJs() not in html
+        assert "litechartsAttachTooltips(" in html
+        for asset in tmp_path.glob("*.js"):
+            assert f'<script src="{asset.name}"></script>' in html
+
+    def test_failed_save_keeps_existing_file(self, tmp_path: Path) -> None:
+        """A render error leaves the previous page intact."""
+        path = tmp_path / "dashboard.html"
+        path.write_text("previous page", encoding="utf-8")
+        chart = createChart()
+        chart.addSeries(LineSeries).setData([{"time": [1], "value": 1.0}], lazy=True)
+        dashboard = Dashboard()
+        dashboard.addChart(chart)
+        with pytest.raises(TypeError, match="Unsupported time type"):
+            dashboard.save(path)
+        assert path.read_text(encoding="utf-8") == "previous page"
+        assert [p.name for p in tmp_path.iterdir()] == ["dashboard.html"]
+
+    def test_save_unknown_assets_mode(self, tmp_path: Path) -> None:
+        """An unknown assets mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown assets mode"):
+            Dashboard().save(tmp_path / "x.html", assets="cdn")  # type: ignore[arg-type]
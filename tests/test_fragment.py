@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from litecharts import (
     CandlestickSeries,
     LineSeries,
@@ -10,7 +12,9 @@ from litecharts import (
     getDefaultStyles,
     getLwcScript,
     getPluginScripts,
+    writeAssets,
 )
+from litecharts._js import getLwcJs
 
 from .conftest import DataMapping
 
@@ -186,6 +190,29 @@ class TestGetPluginScripts:
         assert "RectanglePrimitive" in scripts
 
 
+class TestWriteAssets:
+    """Tests for writeAssets() function."""
+
+    def test_writes_content_hashed_files(self, tmp_path: Path) -> None:
+        """The library and plugins are written under content-hashed names."""
+        names = writeAssets(tmp_path / "assets")
+        lwcName, pluginName = names
+        assert lwcName.startswith("lightweight-charts.")
+        assert pluginName.startswith("litecharts-plugins.")
+        assert (tmp_path / "assets" / lwcName).read_text() == getLwcJs()
+        plugins = (tmp_path / "assets" / pluginName).read_text()
+        assert f"<script>{plugins}</script>" == getPluginScripts()
+
+    def test_existing_files_kept(self, tmp_path: Path) -> None:
+        """Files already present are not rewritten."""
+        names = writeAssets(tmp_path)
+        path = tmp_path / names[0]
+        path.write_text("cached")
+        assert writeAssets(tmp_path) == names
+        assert path.read_text() == "cached"
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(names)
+
+
 class TestGetDefaultStyles:
     """Tests for getDefaultStyles() function."""
 
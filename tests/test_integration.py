@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 from litecharts import Chart, createChart, createSeriesMarkers
 from litecharts.series import (
     AreaSeries,
@@ -196,6 +198,71 @@ class TestHtmlOutputRegression:
         html = chart.toHtml()
         hash_checker("simple_candlestick", html)
 
+    def test_columnar_candlestick_matches_dict_html(
+        self,
+        sample_ohlc_dicts: list[DataMapping],
+        hash_checker: Callable[[str, str], None],
+    ) -> None:
+        """Columnar (numpy) data renders byte-identical to list-of-dict data."""
+        np = pytest.importorskip("numpy")
+        chart = Chart({"width": 800, "height": 600})
+        chart._id = "chart_test0002"
+        pane = chart.addPane()
+        pane._id = "pane_test0001"
+        series = pane.addSeries(
+            CandlestickSeries, {"upColor": "#26a69a", "downColor": "#ef5350"}
+        )
+        series._id = "series_test0001"
+        keys = ("time", "open", "high", "low", "close")
+        series.setData(np.array([[bar[k] for k in keys] for bar in sample_ohlc_dicts]))
+
+        assert series.columns is not None
+        html = chart.toHtml()
+        hash_checker("simple_candlestick", html)
+
+    def test_nan_whitespace_matches_dict_html(self) -> None:
+        """Whitespace rows in columnar data render like time-only dicts."""
+        np = pytest.importorskip("numpy")
+        htmls = []
+        for data in (
+            np.array([[1, 1.0], [2, np.nan], [3, 3.0]]),
+            [{"time": 1, "value": 1.0}, {"time": 2}, {"time": 3, "value": 3.0}],
+        ):
+            chart = Chart()
+            chart._id = "chart_test0004"
+            pane = chart.addPane()
+            pane._id = "pane_test0001"
+            series = pane.addSeries(LineSeries)
+            series._id = "series_test0001"
+            series.setData(data, nanPolicy="whitespace")
+            htmls.append(chart.toHtml())
+
+        assert '{"time":2}' in htmls[0]
+        assert "NaN" not in htmls[0].split(".setData(")[1].split(");")[0]
+        assert htmls[0] == htmls[1]
+
+    def test_color_columns_match_dict_html(self) -> None:
+        """Color columns render like per-point color keys in dicts."""
+        pd = pytest.importorskip("pandas")
+        htmls = []
+        for data in (
+            pd.DataFrame(
+                {"time": [1, 2], "value": [1.0, 2.0], "color": ["#fff", None]}
+            ),
+            [{"time": 1, "value": 1.0, "color": "#fff"}, {"time": 2, "value": 2.0}],
+        ):
+            chart = Chart()
+            chart._id = "chart_test0005"
+            pane = chart.addPane()
+            pane._id = "pane_test0001"
+            series = pane.addSeries(HistogramSeries)
+            series._id = "series_test0001"
+            series.setData(data)
+            htmls.append(chart.toHtml())
+
+        assert '{"time":2,"value":2.0}' in htmls[0]
+        assert htmls[0] == htmls[1]
+
     def test_multi_pane_html(
         self,
         sample_ohlc_dicts: list[DataMapping],
@@ -0,0 +1,77 @@
+"""Tests for _json.py module."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from litecharts import _json
+from litecharts._json import dumps
+
+
+@pytest.fixture(params=["fast", "stdlib"])
+def backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[str]:
+    """Run a test with the installed fast encoder and with the stdlib only."""
+    if request.param == "fast":
+        if _json._fastEncoder() is None:
+            pytest.skip("neither orjson nor ujson is installed")
+    else:
+        monkeypatch.setattr(_json, "_fastEncoder", lambda: None)
+    yield request.param
+
+
+class TestDumps:
+    """Tests for dumps function."""
+
+    def test_compact_separators(self, backend: str) -> None:
+        """No whitespace is written between items or after keys."""
+        assert dumps([{"time": 1, "value": 1.5}]) == '[{"time":1,"value":1.5}]'
+
+    def test_numpy_values(self, backend: str) -> None:
+        """numpy scalars and arrays are encoded without pre-conversion."""
+        np = pytest.importorskip("numpy")
+        data = {"a": np.int64(3), "b": np.float64(0.5), "c": np.array([1, 2])}
+        assert dumps(data) == '{"a":3,"b":0.5,"c":[1,2]}'
+
+    def test_non_finite_floats(self, backend: str) -> None:
+        """NaN and infinity are written as JS literals by every backend."""
+        assert dumps([float("nan"), float("inf")]) == "[NaN,Infinity]"
+
+    def test_non_ascii_escaped(self, backend: str) -> None:
+        """Output is ASCII-only, since the HTML declares no charset."""
+        assert dumps({"title": "€"}) == '{"title":"\\u20ac"}'
+
+    def test_none_is_null(self, backend: str) -> None:
+        """None is still encoded as null."""
+        assert dumps([None, 1]) == "[null,1]"
+
+    def test_unsupported_type_raises(self, backend: str) -> None:
+        """Objects that aren't JSON-serializable are rejected."""
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            dumps(object())
+
+    def test_astral_characters_escaped(self, backend: str) -> None:
+        """Characters outside the BMP are written as surrogate pairs."""
+        assert dumps(["a\U0001f600"]) == '["a\\ud83d\\ude00"]'
+
+    def test_non_finite_numpy_array(self, backend: str) -> None:
+        """NaN in a numpy float array is written as a JS literal."""
+        np = pytest.importorskip("numpy")
+        assert dumps(np.array([1.0, np.nan])) == "[1.0,NaN]"
+
+    def test_none_keeps_fast_path(
+        self, backend: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Finite input holding None is encoded only once."""
+        np = pytest.importorskip("numpy")
+        if backend == "fast":
+            monkeypatch.setattr(_json, "_stdlibDumps", _failingDumps)
+        data = {"v": np.array([1.5, 2.0]), "c": np.array(["€", None], dtype=object)}
+        assert dumps(data) == '{"v":[1.5,2.0],"c":["\\u20ac",null]}'
+
+
+def _failingDumps(obj: object) -> str:
+    raise AssertionError("fell back to the stdlib encoder")
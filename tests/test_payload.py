@@ -0,0 +1,303 @@
+"""Tests for _payload.py module."""
+
+from __future__ import annotations
+
+import base64
+import json
+import re
+import zlib
+from typing import Any
+
+import pytest
+
+from litecharts import Chart, LineSeries, getPluginScripts
+from litecharts._js import getCompressedLwcJs, getLwcJs
+from litecharts._payload import (
+    PAYLOAD_JS,
+    compressText,
+    encodeTimes,
+    renderBinaryPayload,
+    renderColumnsPayload,
+)
+from litecharts.columnar import ColumnarData
+
+
+class TestRenderColumnsPayload:
+    """Tests for renderColumnsPayload function."""
+
+    def test_columnar_data(self) -> None:
+        """Each key is written once with an array of values."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(np.array([1, 2]), {"value": np.array([1.5, 2.0])})
+        assert renderColumnsPayload(data) == '{"time":[1,2],"value":[1.5,2.0]}'
+
+    def test_whitespace_and_unset_colors_are_null(self) -> None:
+        """Whitespace rows and unset colors become nulls."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(
+            np.array([1, 2]),
+            {
+                "value": np.array([1.0, np.nan]),
+                "color": np.array([None, "red"], dtype=object),
+            },
+            np.array([False, True]),
+        )
+        assert renderColumnsPayload(data) == (
+            '{"time":[1,2],"value":[1.0,null],"color":[null,null]}'
+        )
+
+    def test_rows_with_missing_keys(self) -> None:
+        """Keys missing from some dicts are written as null for those rows."""
+        rows = [{"time": 1, "value": 1.0}, {"time": 2}, {"time": 3, "color": "x"}]
+        assert renderColumnsPayload(rows) == (  # type: ignore[arg-type]
+            '{"time":[1,2,3],"value":[1.0,null,null],"color":[null,null,"x"]}'
+        )
+
+    def test_empty_rows(self) -> None:
+        """Empty data still has a time array."""
+        assert renderColumnsPayload([]) == '{"time":[]}'
+
+
+class TestCompressText:
+    """Tests for compressText function."""
+
+    def test_roundtrip(self) -> None:
+        """Output is base64 of a zlib stream, as DecompressionStream expects."""
+        text = '[{"time":1,"value":1.0}]' * 100
+        encoded = compressText(text)
+        assert zlib.decompress(base64.b64decode(encoded)).decode() == text
+        assert len(encoded) < len(text) / 10
+
+    def test_lwc_js(self) -> None:
+        """The bundled library is compressed once and cached."""
+        encoded = getCompressedLwcJs()
+        assert zlib.decompress(base64.b64decode(encoded)).decode() == getLwcJs()
+        assert getCompressedLwcJs() is encoded
+
+
+class TestEncodeTimes:
+    """Tests for encodeTimes function."""
+
+    def test_short_column_plain(self) -> None:
+        """Very short columns are written as plain arrays."""
+        np = pytest.importorskip("numpy")
+        assert encodeTimes(np.array([1, 2])) == "[1,2]"
+
+    def test_regular_grid_with_gap(self) -> None:
+        """A grid with gaps is written as runs sharing one step."""
+        np = pytest.importorskip("numpy")
+        times = np.concatenate(
+            (1609459200 + np.arange(100) * 60, 1609545600 + np.arange(100) * 60)
+        )
+        assert encodeTimes(times) == (
+            '{"count":200,"step":60,"runs":[0,1609459200,100,1609545600]}'
+        )
+
+    def test_irregular_times_use_deltas(self) -> None:
+        """Irregular but close timestamps are written as deltas."""
+        np = pytest.importorskip("numpy")
+        times = 1609459200 + np.cumsum([0, 7, 3, 11, 5, 2, 9])
+        assert encodeTimes(times) == (
+            '{"count":7,"base":1609459200,"deltas":[7,3,11,5,2,9]}'
+        )
+
+    def test_columns_payload_encodes_time(self) -> None:
+        """Columnar payloads use the compact time encoding."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(np.arange(10) * 60, {"value": np.ones(10)})
+        assert renderColumnsPayload(data).startswith(
+            '{"time":{"count":10,"step":60,"runs":[0,0]},'
+        )
+
+
+def _binaryColumns(expression: str) -> tuple[dict[str, Any], list[int] | None]:
+    """Parse the arguments of a litechartsZipColumns(...) expression."""
+    match = re.fullmatch(r"litechartsZipColumns\((\{.*\})(?:,(\[.*\]))?\)", expression)
+    assert match is not None
+    whitespace = json.loads(match.group(2)) if match.group(2) else None
+    return json.loads(match.group(1)), whitespace
+
+
+class TestRenderBinaryPayload:
+    """Tests for renderBinaryPayload function."""
+
+    def test_float64_roundtrip(self) -> None:
+        """Value columns are the raw little-endian float64 buffer."""
+        np = pytest.importorskip("numpy")
+        values = np.array([1.5, 101.23000000000001, np.nan])
+        columns, whitespace = _binaryColumns(
+            renderBinaryPayload(ColumnarData(np.arange(3), {"value": values}))
+        )
+        assert columns["value"]["dtype"] == "f8"
+        decoded = np.frombuffer(base64.b64decode(columns["value"]["data"]), "<f8")
+        np.testing.assert_array_equal(decoded, values)
+        assert whitespace is None
+
+    def test_float32(self) -> None:
+        """float32 halves the buffer size."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(np.arange(4), {"value": np.ones(4)})
+        columns, _ = _binaryColumns(renderBinaryPayload(data, "float32"))
+        assert columns["value"]["dtype"] == "f4"
+        assert len(base64.b64decode(columns["value"]["data"])) == 16
+
+    def test_min_move_power_of_ten(self) -> None:
+        """Decimal price steps are stored as int32 with an exact divisor."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(np.arange(2), {"value": np.array([101.23, 99.5])})
+        columns, _ = _binaryColumns(renderBinaryPayload(data, "minMove", 0.01))
+        assert columns["value"]["dtype"] == "i4"
+        assert columns["value"]["divisor"] == 100
+        decoded = np.frombuffer(base64.b64decode(columns["value"]["data"]), "<i4")
+        assert decoded.tolist() == [10123, 9950]
+
+    def test_min_move_other_step(self) -> None:
+        """Other price steps are stored with a scale factor."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(np.arange(1), {"value": np.array([1.75])})
+        columns, _ = _binaryColumns(renderBinaryPayload(data, "minMove", 0.25))
+        assert columns["value"]["scale"] == 0.25
+
+    def test_min_move_falls_back_to_float64(self) -> None:
+        """Columns with NaN or beyond int32 range stay float64."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(
+            np.arange(2),
+            {"open": np.array([1.0, np.nan]), "close": np.array([1.0, 1e9])},
+        )
+        columns, _ = _binaryColumns(renderBinaryPayload(data, "minMove", 0.01))
+        assert columns["open"]["dtype"] == "f8"
+        assert columns["close"]["dtype"] == "f8"
+
+    def test_min_move_ignores_whitespace_nan(self) -> None:
+        """NaN in whitespace rows (e.g. an indicator warm-up) keeps int32."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(
+            np.arange(3),
+            {"value": np.array([np.nan, 1.5, 2.25])},
+            np.array([True, False, False]),
+        )
+        columns, whitespace = _binaryColumns(renderBinaryPayload(data, "minMove", 0.01))
+        assert columns["value"]["dtype"] == "i4"
+        decoded = np.frombuffer(base64.b64decode(columns["value"]["data"]), "<i4")
+        assert decoded.tolist() == [0, 150, 225]
+        assert whitespace == [0]
+
+    def test_whitespace_and_colors(self) -> None:
+        """Whitespace rows are listed separately and colors stay JSON."""
+        np = pytest.importorskip("numpy")
+        data = ColumnarData(
+            np.arange(3),
+            {"value": np.ones(3), "color": np.array(["a", None, "b"], dtype=object)},
+            np.array([False, True, False]),
+        )
+        columns, whitespace = _binaryColumns(renderBinaryPayload(data))
+        assert columns["color"] == ["a", None, "b"]
+        assert whitespace == [1]
+
+    def test_rows_use_json_columns(self) -> None:
+        """Dict input falls back to the JSON columns payload."""
+        rows = [{"time": 1, "value": 1.0}]
+        assert renderBinaryPayload(rows) == (  # type: ignore[arg-type]
+            'litechartsZipColumns({"time":[1],"value":[1.0]})'
+        )
+
+
+class TestColumnsPayloadRendering:
+    """Tests for the "columns" payload render option."""
+
+    def test_html_uses_helper(self) -> None:
+        """Series data is zipped by the shared helper, included once."""
+        chart = Chart()
+        chart.addSeries(LineSeries).setData([{"time": 1, "value": 1.0}])
+        chart.addSeries(LineSeries).setData([{"time": 1, "value": 2.0}])
+        chart.setRenderOptions({"payload": "columns"})
+        html = chart.toHtml()
+        assert 'setData(litechartsZipColumns({"time":[1],"value":[2.0]}));' in html
+        assert html.count("function litechartsZipColumns") == 1
+
+    def test_binary_payload_uses_min_move(self) -> None:
+        """The binary payload reads each series' priceFormat.minMove."""
+        np = pytest.importorskip("numpy")
+        chart = Chart()
+        series = chart.addSeries(
+            LineSeries, {"priceFormat": {"type": "price", "minMove": 0.001}}
+        )
+        series.setData(np.array([[1, 1.2345]]))
+        chart.setRenderOptions({"payload": "binary", "binaryEncoding": "minMove"})
+        html = chart.toHtml()
+        assert '"dtype":"i4"' in html
+        assert '"divisor":1000' in html
+        assert html.count("function litechartsDecodeColumn") == 1
+
+    def test_rows_by_default(self) -> None:
+        """Without the option, data points are written as objects."""
+        chart = Chart()
+        chart.addSeries(LineSeries).setData([{"time": 1, "value": 1.0}])
+        html = chart.toHtml()
+        assert "litechartsZipColumns" not in html
+
+    def test_plugin_scripts_include_helper(self) -> None:
+        """Fragments can rely on the helper from getPluginScripts."""
+        assert PAYLOAD_JS in getPluginScripts()
+
+
+def _inflatedPayloads(html: str) -> list[str]:
+    """Return the decompressed text of every series payload in the HTML."""
+    return [
+        zlib.decompress(base64.b64decode(data)).decode()
+        for data in re.findall(r'litechartsInflateValue\("([^"]+)"\)', html)
+    ]
+
+
+class TestCompressedRendering:
+    """Tests for the "compress" render option."""
+
+    def test_series_data_compressed(self) -> None:
+        """Each series payload is inflated and awaited before setData."""
+        chart = Chart()
+        chart.addSeries(LineSeries).setData([{"time": 1, "value": 1.0}])
+        chart.setRenderOptions({"compress": True})
+        html = chart.toHtml()
+        assert '"value"' not in html
+        assert _inflatedPayloads(html) == ['[{"time":1,"value":1.0}]']
+        assert "setData(await litechartsInflateValue(" in html
+
+    def test_combines_with_payload(self) -> None:
+        """The compressed text is the payload expression of the chosen mode."""
+        chart = Chart()
+        chart.addSeries(LineSeries).setData([{"time": 1, "value": 1.0}])
+        chart.setRenderOptions({"payload": "columns", "compress": True})
+        assert _inflatedPayloads(chart.toHtml()) == [
+            'litechartsZipColumns({"time":[1],"value":[1.0]})'
+        ]
+
+    def test_lwc_inflated_before_init(self) -> None:
+        """Standalone HTML embeds LWC compressed and waits for it."""
+        chart = Chart()
+        chart.addSeries(LineSeries).setData([{"time": 1, "value": 1.0}])
+        chart.setRenderOptions({"compress": True})
+        html = chart.toHtml()
+        assert getLwcJs() not in html
+        assert getCompressedLwcJs() in html
+        assert "await litechartsLwcReady;" in html
+        assert html.index("function litechartsInflate") < html.index(
+            'litechartsInflate("'
+        )
+
+    def test_fragment_runs_async(self) -> None:
+        """Fragments wrap the init code so it can await the payloads."""
+        chart = Chart()
+        chart.addSeries(LineSeries).setData([{"time": 1, "value": 1.0}])
+        chart.setRenderOptions({"compress": True})
+        fragment = chart.toFragment()
+        assert "(async () => {" in fragment
+        assert "litechartsLwcReady" not in fragment
+
+    def test_uncompressed_by_default(self) -> None:
+        """Without the option, LWC and data are embedded as text."""
+        chart = Chart()
+        chart.addSeries(LineSeries).setData([{"time": 1, "value": 1.0}])
+        html = chart.toHtml()
+        assert getLwcJs() in html
+        assert "litechartsInflate" not in html
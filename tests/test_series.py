@@ -2,6 +2,14 @@
 
 from __future__ import annotations
 
+import io
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from litecharts import render
+from litecharts.chart import Chart
 from litecharts.series import (
     AreaSeries,
     BarSeries,
@@ -95,6 +103,31 @@ class TestCandlestickSeries:
         assert series.markers[0]["tooltip"]["fields"]["PnL"] == "+$50"
 
 
+class TestMarkerTimes:
+    """Tests for marker time normalization."""
+
+    def test_iso_marker_times_converted(self) -> None:
+        """ISO string marker times are converted in a batch."""
+        series = CandlestickSeries()
+        handle = createSeriesMarkers(
+            series,
+            [
+                {"time": "2021-01-01", "position": "aboveBar"},  # type: ignore[typeddict-item]
+                {"time": "2021-01-02", "position": "belowBar"},  # type: ignore[typeddict-item]
+            ],
+        )
+        assert [m["time"] for m in handle.markers()] == [1609459200, 1609545600]
+
+    def test_set_markers_does_not_mutate_input(self) -> None:
+        """setMarkers copies the marker dicts."""
+        series = CandlestickSeries()
+        handle = createSeriesMarkers(series, [])
+        markers = [{"time": "2021-01-01", "shape": "circle"}]
+        handle.setMarkers(markers)  # type: ignore[arg-type]
+        assert markers[0]["time"] == "2021-01-01"
+        assert handle.markers()[0]["time"] == 1609459200
+
+
 class TestSeriesMarkersApi:
     """Tests for the handle-based marker API (SeriesMarkersApi)."""
 
@@ -301,3 +334,420 @@ class TestRectangles:
         """Rectangles list is empty by default."""
         series = CandlestickSeries()
         assert series.rectangles == []
+
+
+class TestColumnarStorage:
+    """Tests for columnar storage of array-like series data."""
+
+    def test_dataframe_stored_columnar(self) -> None:
+        """DataFrame input is kept as columns, not dicts."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {"open": [1.0], "high": [2.0], "low": [0.5], "close": [1.5]},
+            index=pd.to_datetime(["2021-01-01"]),
+        )
+        series = CandlestickSeries()
+        series.setData(df)
+        assert series.columns is not None
+        assert series.columns.keys == ("time", "open", "high", "low", "close")
+        assert series.data == [
+            {"time": 1609459200, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5}
+        ]
+
+    def test_dataframe_values_copied(self) -> None:
+        """Editing the DataFrame after setData doesn't change the series."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {"value": [1.0, 2.0], "color": ["red", "blue"]},
+            index=pd.to_datetime(["2021-01-01", "2021-01-02"]),
+        )
+        series = LineSeries()
+        series.setData(df)
+        df.loc[df.index[0], "value"] = 99.0
+        df.loc[df.index[0], "color"] = "green"
+        assert series.data[0] == {"time": 1609459200, "value": 1.0, "color": "red"}
+
+    def test_list_of_dicts_not_columnar(
+        self, sample_single_value_dicts: list[DataMapping]
+    ) -> None:
+        """List-of-dict input keeps row storage."""
+        series = LineSeries()
+        series.setData(sample_single_value_dicts)
+        assert series.columns is None
+
+    def test_update_appends_to_columns(self) -> None:
+        """update() with matching keys appends to the columns."""
+        np = pytest.importorskip("numpy")
+        series = LineSeries()
+        series.setData(np.array([[1609459200, 1.0]]))
+        series.update({"time": 1609545600, "value": 2.0})
+        assert series.columns is not None
+        assert series.data[-1] == {"time": 1609545600, "value": 2.0}
+
+    def test_update_with_extra_keys_falls_back_to_rows(self) -> None:
+        """update() with different keys switches to row storage."""
+        np = pytest.importorskip("numpy")
+        series = HistogramSeries()
+        series.setData(np.array([[1609459200, 1.0]]))
+        series.update({"time": 1609545600, "value": 2.0, "color": "#ff0000"})
+        assert series.columns is None
+        assert len(series.data) == 2
+        assert series.data[1].get("color") == "#ff0000"
+
+
+class TestLazySetData:
+    """Tests for setData(lazy=True)."""
+
+    def test_conversion_deferred(self, sample_ohlc_dicts: list[DataMapping]) -> None:
+        """Lazy data is converted on first access."""
+        series = CandlestickSeries()
+        series.setData(sample_ohlc_dicts, lazy=True)
+        assert series.isPending
+        assert len(series.data) == 3
+        assert not series.isPending
+
+    def test_last_lazy_source_wins(self) -> None:
+        """Only the last lazily set source is converted."""
+        series = LineSeries()
+        series.setData([{"time": "not a date", "value": 1.0}], lazy=True)
+        series.setData([{"time": 1609459200, "value": 2.0}], lazy=True)
+        assert series.data == [{"time": 1609459200, "value": 2.0}]
+
+    def test_conversion_error_raised_on_access(self) -> None:
+        """Invalid lazy data raises when it is converted."""
+        series = LineSeries()
+        series.setData([{"time": [1], "value": 1.0}], lazy=True)
+        with pytest.raises(TypeError, match="Unsupported time type"):
+            _ = series.data
+
+    def test_edited_source_is_reconverted(self) -> None:
+        """Setting the same DataFrame again picks up in-place edits."""
+        pd = pytest.importorskip("pandas")
+        series = LineSeries()
+        df = pd.DataFrame({"time": [1609459200], "value": [1.0]})
+        series.setData(df)
+        df.loc[0, "value"] = 2.0
+        series.setData(df, lazy=True)
+        assert series.isPending
+        assert series.data == [{"time": 1609459200, "value": 2.0}]
+
+    def test_update_materializes(self, sample_ohlc_dicts: list[DataMapping]) -> None:
+        """update() converts pending data before appending."""
+        series = CandlestickSeries()
+        series.setData(sample_ohlc_dicts, lazy=True)
+        series.update({"time": 1609718400, "open": 1.0, "close": 2.0})
+        assert len(series.data) == 4
+
+
+class TestSetDataChunks:
+    """Tests for setDataChunks."""
+
+    def test_array_chunks_joined_columnar(self) -> None:
+        """Array chunks from a generator end up in one columnar store."""
+        np = pytest.importorskip("numpy")
+
+        def pages() -> Iterator[Any]:
+            for start in range(3):
+                yield np.array([[1609459200 + start * 86400, float(start)]])
+
+        series = LineSeries()
+        series.setDataChunks(pages())
+        assert series.columns is not None
+        assert [point["time"] for point in series.data] == [
+            1609459200,
+            1609545600,
+            1609632000,
+        ]
+
+    def test_empty_page_keeps_columnar(self) -> None:
+        """An empty page (e.g. the last one) doesn't force row storage."""
+        np = pytest.importorskip("numpy")
+        series = CandlestickSeries()
+        series.setDataChunks([np.array([[1, 1.0, 2.0, 0.5, 1.5]]), np.empty((0, 5))])
+        assert series.columns is not None
+        assert len(series.columns) == 1
+
+    def test_dict_chunks(self, sample_single_value_dicts: list[DataMapping]) -> None:
+        """List-of-dict chunks are concatenated as rows."""
+        series = LineSeries()
+        series.setDataChunks(
+            [sample_single_value_dicts[:1], sample_single_value_dicts[1:]]
+        )
+        assert series.columns is None
+        assert len(series.data) == 3
+
+    def test_mixed_chunks_fall_back_to_rows(
+        self, sample_single_value_dicts: list[DataMapping]
+    ) -> None:
+        """Mixing array and dict chunks keeps every point."""
+        np = pytest.importorskip("numpy")
+        series = LineSeries()
+        series.setDataChunks([np.array([[1609372800, 0.5]]), sample_single_value_dicts])
+        assert len(series.data) == 4
+        assert series.data[0] == {"time": 1609372800, "value": 0.5}
+
+    def test_empty_iterable(self) -> None:
+        """No chunks means no data."""
+        series = LineSeries()
+        series.setDataChunks([])
+        assert series.data == []
+
+
+class TestSanitize:
+    """Tests for setData(sanitize=True)."""
+
+    def test_sanitize_reports_fixes(self) -> None:
+        """Unsorted and duplicate points are fixed and counted."""
+        series = LineSeries()
+        series.setData(
+            [
+                {"time": 2, "value": 2.0},
+                {"time": 1, "value": 1.0},
+                {"time": 2, "value": 3.0},
+            ],
+            sanitize=True,
+        )
+        assert [point["time"] for point in series.data] == [1, 2]
+        assert series.data[-1].get("value") == 3.0
+        assert series.sanitizeFixes == 2
+
+    def test_without_sanitize_data_kept(self) -> None:
+        """Data is left as given by default."""
+        series = LineSeries()
+        series.setData([{"time": 2, "value": 2.0}, {"time": 1, "value": 1.0}])
+        assert [point["time"] for point in series.data] == [2, 1]
+        assert series.sanitizeFixes == 0
+
+    def test_lazy_sanitize(self) -> None:
+        """Sanitizing also applies when lazy data is converted."""
+        np = pytest.importorskip("numpy")
+        series = LineSeries()
+        series.setData(np.array([[2, 2.0], [1, 1.0]]), lazy=True, sanitize=True)
+        assert series.sanitizeFixes == 1
+        assert series.columns is not None
+        assert series.columns.time.tolist() == [1, 2]
+
+    def test_lazy_set_data_swaps_source_and_resanitizes(self) -> None:
+        """A lazy setData always swaps in the new source and re-sanitizes it."""
+        np = pytest.importorskip("numpy")
+        arr = np.array([[2, 2.0], [1, 1.0]])
+        series = LineSeries()
+        series.setData(arr)
+        series.setData(arr, lazy=True, sanitize=True)
+        assert series.isPending
+        assert series.sanitizeFixes == 1
+
+    def test_overlapping_chunks(self) -> None:
+        """Overlapping pages are de-duplicated by setDataChunks."""
+        series = LineSeries()
+        series.setDataChunks(
+            [
+                [{"time": 1, "value": 1.0}, {"time": 2, "value": 2.0}],
+                [{"time": 2, "value": 2.5}, {"time": 3, "value": 3.0}],
+            ],
+            sanitize=True,
+        )
+        assert [point.get("value") for point in series.data] == [1.0, 2.5, 3.0]
+        assert series.sanitizeFixes == 1
+
+
+class TestNanPolicy:
+    """Tests for setData(nanPolicy=...)."""
+
+    def test_default_keeps_nan(self) -> None:
+        """NaN values are passed through by default."""
+        series = LineSeries()
+        series.setData([{"time": 1, "value": float("nan")}])
+        assert len(series.data) == 1
+        assert "value" in series.data[0]
+
+    def test_whitespace_columns(self) -> None:
+        """NaN rows of columnar data become whitespace points."""
+        np = pytest.importorskip("numpy")
+        series = LineSeries()
+        series.setData(np.array([[1, 1.0], [2, np.nan]]), nanPolicy="whitespace")
+        assert series.columns is not None
+        assert series.data == [{"time": 1, "value": 1.0}, {"time": 2}]
+
+    def test_drop_with_chunks(self) -> None:
+        """The policy also applies to chunked data."""
+        series = LineSeries()
+        series.setDataChunks(
+            [[{"time": 1, "value": float("inf")}], [{"time": 2, "value": 2.0}]],
+            nanPolicy="drop",
+        )
+        assert series.data == [{"time": 2, "value": 2.0}]
+
+    def test_lazy_policy_applied_on_access(self) -> None:
+        """Lazy data gets the policy when it is converted."""
+        np = pytest.importorskip("numpy")
+        series = LineSeries()
+        series.setData(np.array([[1, np.nan]]), lazy=True, nanPolicy="drop")
+        assert series.isPending
+        assert series.data == []
+
+    def test_update_whitespace(self) -> None:
+        """A NaN point passed to update becomes a whitespace point."""
+        np = pytest.importorskip("numpy")
+        series = LineSeries()
+        series.setData(np.array([[1, 1.0]]), nanPolicy="whitespace")
+        series.update({"time": 2, "value": float("nan")})
+        assert series.data == [{"time": 1, "value": 1.0}, {"time": 2}]
+
+    def test_update_drop(self) -> None:
+        """A NaN point passed to update is skipped by the drop policy."""
+        series = LineSeries()
+        series.setData([{"time": 1, "value": 1.0}], nanPolicy="drop")
+        series.update({"time": 2, "value": float("nan")})
+        assert series.data == [{"time": 1, "value": 1.0}]
+
+    def test_unknown_policy_raises(self) -> None:
+        """Unknown policies are rejected up front."""
+        series = LineSeries()
+        with pytest.raises(ValueError, match="Unknown NaN policy"):
+            series.setData([], nanPolicy="zero")  # type: ignore[arg-type]
+
+    def test_unknown_policy_raises_before_chunks_are_read(self) -> None:
+        """setDataChunks rejects a bad policy without consuming the chunks."""
+
+        def chunks() -> Iterator[list[DataMapping]]:
+            raise AssertionError("chunks were read")
+            yield []
+
+        with pytest.raises(ValueError, match="Unknown NaN policy"):
+            LineSeries().setDataChunks(chunks(), nanPolicy="zero")  # type: ignore[arg-type]
+
+
+class TestColorRule:
+    """Tests for setData(colorRule=...)."""
+
+    def test_volume_colored_by_direction(self) -> None:
+        """Histogram bars get colors from the frame's open/close columns."""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame(
+            {
+                "time": [1, 2],
+                "open": [1.0, 2.0],
+                "close": [2.0, 1.0],
+                "value": [100.0, 200.0],
+            }
+        )
+        series = HistogramSeries()
+        series.setData(df, colorRule={"upColor": "green", "downColor": "red"})
+        assert series.columns is not None
+        assert series.data == [
+            {"time": 1, "value": 100.0, "color": "green"},
+            {"time": 2, "value": 200.0, "color": "red"},
+        ]
+
+    def test_chunks(self) -> None:
+        """The rule is applied to every chunk against its own source."""
+        series = LineSeries()
+        series.setDataChunks(
+            [[{"time": 1, "value": 1.0}], [{"time": 2, "value": -1.0}]],
+            colorRule={"left": "value", "right": 0, "upColor": "a", "downColor": "b"},
+        )
+        assert [point.get("color") for point in series.data] == ["a", "b"]
+
+
+class TestFieldProjection:
+    """Tests for dropping keys a series type doesn't read."""
+
+    def test_candlestick_drops_volume_column(self) -> None:
+        """Volume is not kept on candlestick columns."""
+        np = pytest.importorskip("numpy")
+        series = CandlestickSeries()
+        series.setData(np.array([[1, 1.0, 2.0, 0.5, 1.5, 100.0]]))
+        assert series.columns is not None
+        assert series.columns.keys == ("time", "open", "high", "low", "close")
+
+    def test_dict_extra_keys_dropped(self) -> None:
+        """Extra keys of dict input are dropped, LWC keys are kept."""
+        series = AreaSeries()
+        series.setData(
+            [{"time": 1, "value": 1.0, "lineColor": "red", "color": "x", "note": 1}]
+        )
+        assert series.data == [{"time": 1, "value": 1.0, "lineColor": "red"}]
+
+    def test_update_projects_point(self) -> None:
+        """An update carrying volume still appends to the columns."""
+        np = pytest.importorskip("numpy")
+        series = BarSeries()
+        series.setData(np.array([[1, 1.0, 2.0, 0.5, 1.5, 100.0]]))
+        series.update(
+            {"time": 2, "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 9}
+        )
+        assert series.columns is not None
+        assert len(series.columns) == 2
+        assert "volume" not in series.data[-1]
+
+
+class TestRenderCache:
+    """Tests for the per-series render cache."""
+
+    @pytest.fixture
+    def chart(self) -> Chart:
+        """Chart with one rendered line series."""
+        chart = Chart()
+        chart.setRenderOptions({"cache": True})
+        chart.addSeries(LineSeries).setData([{"time": 1, "value": 1.0}])
+        chart.toFragment()
+        return chart
+
+    @pytest.fixture
+    def noRender(self, chart: Chart, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Fail if the chart's series data is encoded again."""
+
+        def fail(data: object) -> Iterator[str]:
+            raise AssertionError("data was re-rendered")
+
+        monkeypatch.setattr(render, "_iterRowsJson", fail)
+
+    def series(self, chart: Chart) -> LineSeries:
+        """Return the chart's line series."""
+        return chart.panes[0].series[0]  # type: ignore[return-value]
+
+    @pytest.mark.usefixtures("noRender")
+    def test_unchanged_series_reused(self, chart: Chart) -> None:
+        """Rendering again reuses the cached payload."""
+        assert '{"time":1,"value":1.0}' in chart.toFragment()
+        assert '{"time":1,"value":1.0}' in chart.toHtml()
+
+    def test_update_invalidates(self, chart: Chart) -> None:
+        """update re-renders the data."""
+        self.series(chart).update({"time": 2, "value": 2.0})
+        assert '{"time":2,"value":2.0}' in chart.toFragment()
+
+    def test_set_data_invalidates(self, chart: Chart) -> None:
+        """setData, including lazily set data, re-renders the data."""
+        self.series(chart).setData([{"time": 3, "value": 3.0}], lazy=True)
+        assert '{"time":3,"value":3.0}' in chart.toFragment()
+
+    def test_render_options_in_key(self, chart: Chart) -> None:
+        """Different render settings render the data again."""
+        chart.setRenderOptions({"payload": "columns"})
+        assert "litechartsZipColumns" in chart.toFragment()
+
+    @pytest.mark.usefixtures("noRender")
+    def test_markers_price_lines_rectangles(self, chart: Chart) -> None:
+        """Other parts are invalidated on their own, keeping the data."""
+        series = self.series(chart)
+        handle = createSeriesMarkers(series, [{"time": 1, "shape": "circle"}])
+        assert '"shape":"circle"' in chart.toFragment()
+        handle.setMarkers([{"time": 1, "shape": "square"}])
+        assert '"shape":"square"' in chart.toFragment()
+        handle.detach()
+        assert "createSeriesMarkers" not in chart.toFragment()
+
+        series.createPriceLine({"price": 1.5})
+        assert '"price":1.5' in chart.toFragment()
+        series.addRectangle(1, 2, 1.0, 2.0)
+        assert "rectPrimitive_" in chart.toFragment()
+
+    def test_disabled_by_default(self) -> None:
+        """Without the cache option nothing is stored, e.g. after save()."""
+        chart = Chart()
+        series = chart.addSeries(LineSeries)
+        series.setData([{"time": 1, "value": 1.0}])
+        chart.write(io.StringIO())
+        assert not series._renderCache